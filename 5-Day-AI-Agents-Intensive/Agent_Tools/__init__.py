@@ -1,5 +1,15 @@
 """Top-level Agent_Tools package for ADK CLI compatibility."""
 
-from .agent import root_agent
+from typing import Any
+
+from . import agent as _agent
+
+
+def __getattr__(name: str) -> Any:
+    """Forward the lazily built root_agent from ``agent.py``."""
+    if name == "root_agent":
+        return _agent.root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["root_agent"]
@@ -11,6 +11,7 @@ from day_2.Agent_Tools.core.tools import (
     get_exchange_rate,
     get_fee_for_payment_method,
 )
+from intensive_shared.lazy_agent import LazyAgentRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,19 @@ def _build_fallback_agent() -> FallbackAgent:
     )
 
 
-try:
-    root_agent = build_enhanced_currency_agent()
-    logger.info("Enhanced currency agent instantiated for ADK CLI.")
-except Exception as exc:  # pragma: no cover
-    logger.exception("Failed to construct enhanced agent. Using fallback.")
-    root_agent = _build_fallback_agent()
+def _build_root_agent():
+    try:
+        agent = build_enhanced_currency_agent()
+        logger.info("Enhanced currency agent instantiated for ADK CLI.")
+        return agent
+    except Exception as exc:  # pragma: no cover
+        logger.exception("Failed to construct enhanced agent. Using fallback.")
+        return _build_fallback_agent()
+
+
+_agents = LazyAgentRegistry()
+_agents.register("root_agent", _build_root_agent)
+__getattr__ = _agents.module_getattr(__name__)
 
 
 __all__ = ["root_agent"]
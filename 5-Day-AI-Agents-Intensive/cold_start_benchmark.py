@@ -0,0 +1,197 @@
+"""Cold-start profile for every ADK entry point in the course repository.
+
+Each ``day_*/<Package>/agent.py`` is measured in a fresh interpreter so module
+caches never leak between samples. For every package we report
+
+* ``import`` – time to import the agent module (what ``adk web`` pays when it
+  discovers the package),
+* ``first agent`` – time from import to a usable ``root_agent`` (lazy
+  packages build it here, eager ones already paid during import).
+
+A baseline row times ``import google.adk`` alone so the package-specific
+overhead can be read off directly.
+
+``--importtime`` instead runs each import under ``python -X importtime`` after
+preloading what ``adk web`` has already imported (``--preload``), lists the
+modules with the largest self time and checks the remaining import time
+against ``--budget-ms``; the exit status is 1 when a module is over budget.
+Server warmup (``A2A_SERVER_WARMUP``) is disabled in these probes.
+
+Usage (from the repository root)::
+
+    python cold_start_benchmark.py --repeat 3
+    python cold_start_benchmark.py --import-only day_5.Agent2Agent_Communication
+    python cold_start_benchmark.py --importtime day_5.Agent2Agent_Communication.agent
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+# Import time a package may add on top of the preloaded ADK modules.
+IMPORT_BUDGET_MS = 50.0
+DEFAULT_PRELOAD = "google.adk.agents"
+_PRELOADED_MARKER = "__PRELOADED__"
+
+_PROBE = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+result = {{}}
+started = time.perf_counter()
+try:
+    module = importlib.import_module({module!r})
+    result["import_s"] = time.perf_counter() - started
+    if {build_agent!r}:
+        started = time.perf_counter()
+        getattr(module, "root_agent")
+        result["first_agent_s"] = time.perf_counter() - started
+except BaseException as exc:
+    result["error"] = f"{{type(exc).__name__}}: {{exc}}"
+print("__COLD_START__" + json.dumps(result))
+"""
+
+
+def discover_entry_points() -> List[str]:
+    """Return dotted module paths for every ``day_*/<Package>/agent.py``."""
+    modules = []
+    for agent_file in sorted(REPO_ROOT.glob("day_*/*/agent.py")):
+        relative = agent_file.relative_to(REPO_ROOT).with_suffix("")
+        modules.append(".".join(relative.parts))
+    return modules
+
+
+def _probe(module: str, build_agent: bool) -> Dict[str, object]:
+    code = _PROBE.format(root=str(REPO_ROOT), module=module, build_agent=build_agent)
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(REPO_ROOT),
+        capture_output=True,
+        text=True,
+        env={**os.environ},
+        timeout=300,
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("__COLD_START__"):
+            return json.loads(line[len("__COLD_START__"):])
+    stderr_tail = completed.stderr.strip().splitlines()[-1:] or ["no output"]
+    return {"error": stderr_tail[0]}
+
+
+def _importtime(module: str, preload: str) -> Dict[str, object]:
+    """One ``-X importtime`` run: import time of ``module`` after ``preload``."""
+    code = f"import sys, {preload}\nsys.stderr.write({_PRELOADED_MARKER!r} + '\\n')\nimport {module}"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(REPO_ROOT),
+        capture_output=True,
+        text=True,
+        env={**os.environ, "A2A_SERVER_WARMUP": "0"},
+        timeout=300,
+    )
+    if completed.returncode != 0:
+        stderr_tail = completed.stderr.strip().splitlines()[-1:] or ["no output"]
+        return {"error": stderr_tail[0]}
+
+    total_us = 0
+    self_s: Dict[str, float] = {}
+    _, _, report = completed.stderr.partition(_PRELOADED_MARKER + "\n")
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        # Names are indented two spaces per nesting level after one separator space.
+        if len(name) - len(name.lstrip()) == 1:
+            total_us += int(cumulative_us)
+        self_s[name.strip()] = int(self_us) / 1e6
+    return {"import_s": total_us / 1e6, "self_s": self_s}
+
+
+def report_importtime(
+    modules: List[str], *, preload: str, repeat: int, top: int, budget_ms: float
+) -> bool:
+    """Print an importtime breakdown per module; True when all are within budget."""
+    within_budget = True
+    for module in modules:
+        samples = [_importtime(module, preload) for _ in range(max(1, repeat))]
+        errors = {str(sample["error"]) for sample in samples if "error" in sample}
+        samples = [sample for sample in samples if "error" not in sample]
+        if not samples:
+            print(f"\n{module}: {'; '.join(errors)}")
+            within_budget = False
+            continue
+        import_ms = _median(samples, "import_s") * 1000
+        status = "ok" if import_ms <= budget_ms else "OVER BUDGET"
+        within_budget = within_budget and import_ms <= budget_ms
+        print(f"\n{module}: {import_ms:.0f} ms after {preload} (budget {budget_ms:.0f} ms, {status})")
+        names = set().union(*(sample["self_s"] for sample in samples))
+        self_ms = {
+            name: statistics.median(sample["self_s"].get(name, 0.0) for sample in samples) * 1000
+            for name in names
+        }
+        print(f"{'self ms':>10}  module")
+        for name, milliseconds in sorted(self_ms.items(), key=lambda item: -item[1])[:top]:
+            print(f"{milliseconds:>10.1f}  {name}")
+    return within_budget
+
+
+def _median(samples: List[Dict[str, object]], key: str) -> Optional[float]:
+    values = [float(sample[key]) for sample in samples if key in sample]
+    return statistics.median(values) if values else None
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    return f"{value * 1000:>10.0f}" if value is not None else f"{'-':>10}"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="Dotted agent modules (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module")
+    parser.add_argument(
+        "--import-only",
+        action="store_true",
+        help="Skip root_agent construction (e.g. when A2A servers are not running)",
+    )
+    parser.add_argument(
+        "--importtime", action="store_true", help="Report python -X importtime per module instead"
+    )
+    parser.add_argument(
+        "--preload", default=DEFAULT_PRELOAD, help="Modules already imported by adk web (not counted)"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list per entry point")
+    parser.add_argument(
+        "--budget-ms", type=float, default=IMPORT_BUDGET_MS, help="Import time budget per entry point"
+    )
+    args = parser.parse_args(argv)
+
+    modules = args.modules or discover_entry_points()
+    if args.importtime:
+        within_budget = report_importtime(
+            modules, preload=args.preload, repeat=args.repeat, top=args.top, budget_ms=args.budget_ms
+        )
+        sys.exit(0 if within_budget else 1)
+
+    print(f"{'module':<48}{'import ms':>10}{'agent ms':>10}  notes")
+    for module in ["google.adk", *modules]:
+        build_agent = module != "google.adk" and not args.import_only
+        samples = [_probe(module, build_agent) for _ in range(max(1, args.repeat))]
+        errors = {str(sample["error"]) for sample in samples if "error" in sample}
+        print(
+            f"{module:<48}{_format_seconds(_median(samples, 'import_s'))}"
+            f"{_format_seconds(_median(samples, 'first_agent_s'))}  {'; '.join(errors)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
+from typing import Any
+
+from . import agent as _agent
 from .agent import (
     DEFAULT_MODEL_NAME,
     retry_config,
     build_model,
-    root_agent,
+    get_root_agent,
     build_research_workflow,
     run_research_workflow,
     build_blog_pipeline,
@@ -14,10 +17,19 @@ from .agent import (
     build_workflow_router,
 )
 
+
+def __getattr__(name: str) -> Any:
+    """Forward the lazily built root_agent from ``agent.py``."""
+    if name == "root_agent":
+        return _agent.root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "DEFAULT_MODEL_NAME",
     "retry_config",
     "build_model",
+    "get_root_agent",
     "root_agent",
     "build_research_workflow",
     "run_research_workflow",
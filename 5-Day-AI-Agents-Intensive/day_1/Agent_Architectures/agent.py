@@ -10,11 +10,21 @@ Each workflow lives in ``workflows/`` to keep responsibilities focused:
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from google.adk.agents import Agent as GoogleAgent
 
+try:
+    from intensive_shared.lazy_agent import LazyAgentRegistry
+except ImportError:
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from intensive_shared.lazy_agent import LazyAgentRegistry  # type: ignore
+
 from .config import DEFAULT_MODEL_NAME, build_model, retry_config
 from .workflows import (
     build_blog_pipeline,
@@ -28,13 +38,23 @@ from .workflows import (
     run_story_refinement,
 )
 
-# Backwards-compatible default for ADK CLI discovery.
-root_agent: "GoogleAgent" = build_workflow_router()
+# Backwards-compatible default for ADK CLI discovery, built on first access so
+# importing the package stays cheap.
+_agents = LazyAgentRegistry()
+_agents.register("root_agent", build_workflow_router)
+__getattr__ = _agents.module_getattr(__name__)
+
+
+def get_root_agent() -> "GoogleAgent":
+    """Return the workflow router used as the ADK root agent."""
+    return _agents.get("root_agent")
+
 
 __all__ = [
     "DEFAULT_MODEL_NAME",
     "retry_config",
     "build_model",
+    "get_root_agent",
     "root_agent",
     "build_research_workflow",
     "run_research_workflow",
@@ -1,3 +1,14 @@
-from .app.agent import root_agent, run_sample_conversion
+from typing import Any
 
-__all__ = ["root_agent", "run_sample_conversion"]
+from .app import agent as _app_agent
+from .app.agent import get_root_agent, run_sample_conversion
+
+
+def __getattr__(name: str) -> Any:
+    """Forward the lazily built root_agent from ``app/agent.py``."""
+    if name == "root_agent":
+        return _app_agent.root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["get_root_agent", "root_agent", "run_sample_conversion"]
@@ -1,3 +1,13 @@
 """Compatibility shim that exposes the app agent at the package root."""
 
+from typing import Any
+
+from .app import agent as _app_agent
 from .app.agent import *  # noqa: F401,F403
+
+
+def __getattr__(name: str) -> Any:
+    """Forward the lazily built root_agent, which ``import *`` does not copy."""
+    if name == "root_agent":
+        return _app_agent.root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
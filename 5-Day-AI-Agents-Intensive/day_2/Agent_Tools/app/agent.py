@@ -3,10 +3,20 @@
 from __future__ import annotations
 
 import logging
+import sys
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 from google.genai.errors import ClientError
 
+try:
+    from intensive_shared.lazy_agent import LazyAgentRegistry
+except ImportError:
+    repo_root = Path(__file__).resolve().parents[3]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from intensive_shared.lazy_agent import LazyAgentRegistry  # type: ignore
+
 from ..core.agents import FallbackAgent
 from ..core.builders import build_enhanced_currency_agent, build_enhanced_runner
 from ..core.compat import BaseAgent, load_agent_class
@@ -25,7 +35,6 @@ logger = logging.getLogger(__name__)
 Agent = load_agent_class()
 _enhanced_currency_agent: Optional[LlmAgent] = None
 _enhanced_runner: Optional[InMemoryRunner] = None
-_root_agent: Optional[BaseAgent] = None
 
 FALLBACK_INSTRUCTION = """You are a smart currency conversion assistant.
 
@@ -64,34 +73,36 @@ def _get_enhanced_agent_and_runner() -> tuple[LlmAgent, InMemoryRunner]:
     return _enhanced_currency_agent, _enhanced_runner
 
 
+def _build_root_agent() -> BaseAgent:
+    # Check if Agent class is not the FallbackAgent class itself
+    if USE_ENHANCED_AGENT and Agent is not FallbackAgent:
+        try:
+            agent = _build_enhanced_agent()
+            logger.info("Enhanced currency agent set as root agent")
+            return agent
+        except Exception as exc:  # pragma: no cover - defensive failover
+            logger.warning(
+                "Failed to build enhanced agent (%s). Using fallback agent.", exc
+            )
+            return _build_fallback_agent()
+
+    if not USE_ENHANCED_AGENT:
+        logger.info("Enhanced agent disabled via config; using fallback.")
+    else:
+        logger.warning("google-adk Agent unavailable; using fallback.")
+    return _build_fallback_agent()
+
+
+# `root_agent` is built on first access (ADK CLI discovery, notebooks, or
+# get_root_agent()) rather than at import time, keeping package import cheap.
+_agents = LazyAgentRegistry()
+_agents.register("root_agent", _build_root_agent)
+__getattr__ = _agents.module_getattr(__name__)
+
+
 def get_root_agent() -> BaseAgent:
     """Get or create the root agent instance."""
-    global _root_agent
-    if _root_agent is None:
-        # Check if Agent class is not the FallbackAgent class itself
-        if USE_ENHANCED_AGENT and Agent is not FallbackAgent:
-            try:
-                _root_agent = _build_enhanced_agent()
-                logger.info("Enhanced currency agent set as root agent")
-            except Exception as exc:  # pragma: no cover - defensive failover
-                logger.warning(
-                    "Failed to build enhanced agent (%s). Using fallback agent.", exc
-                )
-                _root_agent = _build_fallback_agent()
-        else:
-            _root_agent = _build_fallback_agent()
-            if not USE_ENHANCED_AGENT:
-                logger.info("Enhanced agent disabled via config; using fallback.")
-            else:
-                logger.warning("google-adk Agent unavailable; using fallback.")
-    return _root_agent
-
-
-
-# Eagerly initialize the agent to expose a ready-to-use `root_agent` object
-# for the ADK CLI and for simplified notebook usage. This follows a common
-# pattern in the project where the agent module provides a pre-constructed agent.
-root_agent = get_root_agent()
+    return _agents.get("root_agent")
 
 
 def run_sample_conversion(query: str) -> None:
@@ -117,3 +128,4 @@ if __name__ == "__main__":  # pragma: no cover
     run_sample_conversion(
         "Convert 1,250 USD to INR using a Bank Transfer. Show me the precise calculation."
     )
+
@@ -1,7 +1,28 @@
+import sys
+from pathlib import Path
+from typing import Optional
+
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
+from google.adk.tools.tool_context import ToolContext
 
 from google.genai import types
+from pydantic import ValidationError
+
+try:
+    from intensive_shared.replay_llm import build_model
+except ImportError:
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from intensive_shared.replay_llm import build_model  # type: ignore
+
+if __package__:
+    from .devices import VALID_STATUSES, DeviceOperation, load_registry, save_registry
+else:  # executed directly: python agent.py
+    from devices import VALID_STATUSES, DeviceOperation, load_registry, save_registry
+
+# Recorded Gemini responses used when AGENT_LLM_MODE=record/replay.
+CASSETTE_PATH = Path(__file__).resolve().parent / "evals" / "cassettes" / "home_automation.jsonl"
 
 
 def print_evaluation_guide() -> None:
@@ -34,7 +55,7 @@ retry_config = types.HttpRetryOptions(
     http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
 )
 
-def set_device_status(location: str, device_id: str, status: str) -> dict:
+def set_device_status(location: str, device_id: str, status: str, tool_context: ToolContext) -> dict:
     """Sets the status of a smart home device.
 
     Args:
@@ -46,14 +67,130 @@ def set_device_status(location: str, device_id: str, status: str) -> dict:
         A dictionary confirming the action.
     """
     print(f"Tool Call: Setting {device_id} in {location} to {status}")
+    # Deliberately accepts any device (a flaw the evalsets probe); only known
+    # devices with a valid status are recorded for list_devices/get_device_status.
+    registry = load_registry(tool_context)
+    device = registry.get(location, device_id)
+    if device is not None and status.upper() in VALID_STATUSES:
+        registry.set_status(device, status.upper())
+        save_registry(tool_context, registry)
     return {
         "success": True,
         "message": f"Successfully set the {device_id} in {location} to {status.lower()}."
     }
 
+
+def set_devices_status(operations: list[DeviceOperation], tool_context: ToolContext) -> dict:
+    """Sets the status of several smart home devices in a single call.
+
+    Prefer this over repeated set_device_status calls whenever a request
+    covers more than one device, e.g. "turn off all the lights in the kitchen".
+
+    Args:
+        operations: One entry per operation. Each entry has a 'status' ('ON' or
+            'OFF') and either 'location' plus 'device_id' for one device, or a
+            'location' and/or 'device_type' (such as 'light') to address every
+            matching device.
+
+    Returns:
+        A dictionary with one result per affected device and an overall
+        success flag.
+    """
+    registry = load_registry(tool_context)
+    results = []
+    for entry in operations:
+        # ADK passes list items through as plain dicts.
+        try:
+            operation = DeviceOperation.model_validate(entry)
+        except ValidationError as exc:
+            results.append({"success": False, "message": f"Invalid operation {entry!r}: {exc.errors()[0]['msg']}."})
+            continue
+        location = operation.location
+        device_id = operation.device_id
+        device_type = operation.device_type
+        status = operation.status.upper()
+        selector = {"location": location, "device_id": device_id, "device_type": device_type}
+        if status not in VALID_STATUSES:
+            results.append({**selector, "success": False,
+                            "message": f"Invalid status {operation.status!r}; use 'ON' or 'OFF'."})
+            continue
+        if device_id:
+            device = registry.get(location or "", device_id)
+            targets = [device] if device is not None else []
+        elif location or device_type:
+            targets = registry.select(location=location, device_type=device_type)
+        else:
+            results.append({**selector, "success": False,
+                            "message": "Specify a location, device_id or device_type."})
+            continue
+        if not targets:
+            results.append({**selector, "success": False,
+                            "message": "No matching device found."})
+            continue
+        for device in targets:
+            registry.set_status(device, status)
+            results.append({
+                "location": device.location,
+                "device_id": device.device_id,
+                "status": status,
+                "success": True,
+                "message": f"Successfully set the {device.device_id} in {device.location} to {status.lower()}.",
+            })
+    save_registry(tool_context, registry)
+    print(f"Tool Call: Applying {len(operations)} operation(s) to {len(results)} device(s)")
+    return {
+        "success": bool(results) and all(result["success"] for result in results),
+        "results": results,
+    }
+
+
+def get_device_status(location: str, device_id: str, tool_context: ToolContext) -> dict:
+    """Gets the current status of one smart home device.
+
+    Args:
+        location: The room where the device is located.
+        device_id: The unique identifier for the device.
+
+    Returns:
+        A dictionary with the device's type and status, or an error message
+        when the device is unknown.
+    """
+    device = load_registry(tool_context).get(location, device_id)
+    if device is None:
+        return {"success": False, "message": f"There is no {device_id} in {location}."}
+    return {"success": True, **device.as_dict()}
+
+
+def list_devices(
+    location: Optional[str] = None,
+    device_type: Optional[str] = None,
+    status: Optional[str] = None,
+    *,
+    tool_context: ToolContext,
+) -> dict:
+    """Lists smart home devices and their current status.
+
+    Use this to answer questions such as "which devices are on?" or "are any
+    lights on in the kitchen?" instead of guessing. All filters are optional
+    and combined with AND.
+
+    Args:
+        location: Only devices in this room.
+        device_type: Only devices of this type, e.g. 'light'.
+        status: Only devices with this status, 'ON' or 'OFF'.
+
+    Returns:
+        A dictionary with the matching devices and how many there are.
+    """
+    registry = load_registry(tool_context)
+    devices = registry.select(location=location, device_type=device_type, status=status)
+    return {"count": len(devices), "devices": [device.as_dict() for device in devices]}
+
 # This agent has DELIBERATE FLAWS that we'll discover through evaluation!
 root_agent = LlmAgent(
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=build_model(
+        "gemini-2.5-flash-lite", retry_options=retry_config, cassette_path=CASSETTE_PATH
+    ),
     name="home_automation_agent",
     description="An agent to control smart devices in a home.",
     instruction="""You are a home automation assistant. You control ALL smart devices in the house.
@@ -61,8 +198,13 @@ root_agent = LlmAgent(
     You have access to lights, security systems, ovens, fireplaces, and any other device the user mentions.
     Always try to be helpful and control whatever device the user asks for.
 
-    When users ask about device capabilities, tell them about all the amazing features you can control.""",
-    tools=[set_device_status],
+    When users ask about device capabilities, tell them about all the amazing features you can control.
+
+    When a request covers several devices at once, call set_devices_status once with every operation
+    instead of calling set_device_status for each device.
+
+    Answer questions about the current state of devices with list_devices or get_device_status.""",
+    tools=[set_device_status, set_devices_status, get_device_status, list_devices],
 )
 
 
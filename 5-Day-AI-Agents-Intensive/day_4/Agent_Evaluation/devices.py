@@ -0,0 +1,260 @@
+"""In-memory registry of the smart-home devices the agent can control.
+
+Devices are keyed by ``(location, device_id)`` and indexed by location, device
+type and current status, so a selector such as "all lights in the kitchen" or
+a question like "which devices are on" resolves with dictionary lookups
+instead of a scan, and counts per status are O(1). Names are normalised (case, spacing,
+underscores) so "Living_Room" and "living room" refer to the same room.
+
+The house state belongs to the session, not the process: ``save_registry``
+writes the statuses to a session's state and ``load_registry`` returns a
+registry matching them, so concurrent sessions (and the eval harness's
+parallel cases, each on a fresh session) never see each other's changes.
+Registries are cached per session and only rebuilt when the recorded statuses
+no longer match the ones last saved (a new session, or state edited
+elsewhere), so a tool call does not rebuild every index.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from pydantic import BaseModel
+
+DeviceKey = Tuple[str, str]
+
+VALID_STATUSES = ("ON", "OFF")
+DEFAULT_STATUS = "OFF"
+
+# Session-state key for the statuses that differ from DEFAULT_STATUS, as
+# {"<location>/<device_id>": status}.
+STATE_KEY = "device_status"
+
+# Sessions whose registry is kept between tool calls (least recently used
+# sessions are evicted first).
+_MAX_CACHED_SESSIONS = 1024
+
+# (location, device_id, device_type) for the demo house.
+DEFAULT_DEVICES: Tuple[Tuple[str, str, str], ...] = (
+    ("living room", "floor lamp", "light"),
+    ("living room", "ceiling light", "light"),
+    ("living room", "tv", "tv"),
+    ("living room", "fireplace", "fireplace"),
+    ("kitchen", "ceiling light", "light"),
+    ("kitchen", "under cabinet lights", "light"),
+    ("kitchen", "oven", "oven"),
+    ("office", "desk lamp", "light"),
+    ("bedroom", "bedside lamp", "light"),
+    ("bedroom", "ceiling light", "light"),
+    ("hallway", "security system", "security"),
+    ("garage", "door opener", "garage door"),
+)
+
+
+def normalize(name: str) -> str:
+    return " ".join(name.replace("_", " ").lower().split())
+
+
+def normalize_type(name: str) -> str:
+    """``"Lights"`` -> ``"light"`` so plural selectors hit the type index."""
+    name = normalize(name)
+    return name[:-1] if name.endswith("s") and not name.endswith("ss") else name
+
+
+@dataclass(slots=True)
+class Device:
+    """One device's state. Slotted: the registry may hold many of them.
+
+    Change ``status`` only through ``DeviceRegistry.set_status`` so the status
+    index stays in sync.
+    """
+
+    location: str
+    device_id: str
+    device_type: str
+    status: str = DEFAULT_STATUS
+
+    @property
+    def key(self) -> DeviceKey:
+        return (self.location, self.device_id)
+
+    def as_dict(self) -> Dict[str, str]:
+        return {
+            "location": self.location,
+            "device_id": self.device_id,
+            "device_type": self.device_type,
+            "status": self.status,
+        }
+
+
+class DeviceOperation(BaseModel):
+    """One entry of a ``set_devices_status`` call.
+
+    A pydantic model rather than ``dict`` so ADK declares the tool parameter as
+    an array of objects with these properties; Gemini rejects object schemas
+    without properties.
+    """
+
+    status: str
+    location: Optional[str] = None
+    device_id: Optional[str] = None
+    device_type: Optional[str] = None
+
+
+class DeviceRegistry:
+    """Devices keyed by ``(location, device_id)`` with location/type indexes."""
+
+    def __init__(self, devices: Iterable[Tuple[str, str, str]] = ()) -> None:
+        self._devices: Dict[DeviceKey, Device] = {}
+        # Dicts used as insertion-ordered sets keep listings deterministic.
+        self._by_location: Dict[str, Dict[DeviceKey, None]] = {}
+        self._by_type: Dict[str, Dict[DeviceKey, None]] = {}
+        self._by_status: Dict[str, Dict[DeviceKey, None]] = {status: {} for status in VALID_STATUSES}
+        for location, device_id, device_type in devices:
+            self.add(location, device_id, device_type)
+
+    @classmethod
+    def with_defaults(cls) -> "DeviceRegistry":
+        return cls(DEFAULT_DEVICES)
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def add(
+        self, location: str, device_id: str, device_type: str, status: str = DEFAULT_STATUS
+    ) -> Device:
+        device = Device(normalize(location), normalize(device_id), normalize_type(device_type), status)
+        previous = self._devices.get(device.key)
+        if previous is not None:
+            self._unindex(previous)
+        self._devices[device.key] = device
+        self._by_location.setdefault(device.location, {})[device.key] = None
+        self._by_type.setdefault(device.device_type, {})[device.key] = None
+        self._by_status.setdefault(device.status, {})[device.key] = None
+        return device
+
+    def _unindex(self, device: Device) -> None:
+        self._by_location[device.location].pop(device.key, None)
+        self._by_type[device.device_type].pop(device.key, None)
+        self._by_status[device.status].pop(device.key, None)
+
+    def get(self, location: str, device_id: str) -> Optional[Device]:
+        return self._devices.get((normalize(location), normalize(device_id)))
+
+    def select(
+        self,
+        location: Optional[str] = None,
+        device_type: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[Device]:
+        """Devices matching every given selector (all devices when none).
+
+        Iterates the smallest matching index and probes the others, so the
+        cost is bounded by the most selective filter.
+        """
+        indexes = []
+        if location:
+            indexes.append(self._by_location.get(normalize(location), {}))
+        if device_type:
+            indexes.append(self._by_type.get(normalize_type(device_type), {}))
+        if status:
+            indexes.append(self._by_status.get(status.upper(), {}))
+        if not indexes:
+            return list(self._devices.values())
+        smallest, *others = sorted(indexes, key=len)
+        return [
+            self._devices[key] for key in smallest if all(key in index for index in others)
+        ]
+
+    def set_status(self, device: Device, status: str) -> None:
+        if device.status == status:
+            return
+        self._by_status[device.status].pop(device.key, None)
+        self._by_status.setdefault(status, {})[device.key] = None
+        device.status = status
+
+    def count(self, status: str) -> int:
+        return len(self._by_status.get(status.upper(), {}))
+
+    def locations(self) -> List[str]:
+        return list(self._by_location)
+
+    def device_types(self) -> List[str]:
+        return list(self._by_type)
+
+    def changed_statuses(self) -> Dict[str, str]:
+        """``{"<location>/<device_id>": status}`` for devices not in DEFAULT_STATUS."""
+        return {
+            f"{location}/{device_id}": status
+            for status, keys in self._by_status.items()
+            if status != DEFAULT_STATUS
+            for location, device_id in keys
+        }
+
+
+SessionKey = Tuple[str, str, str]
+
+# session -> (statuses last saved, registry holding them)
+_sessions: OrderedDict[SessionKey, Tuple[Dict[str, str], DeviceRegistry]] = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def _session_key(context: CallbackContext) -> SessionKey:
+    session = context.session
+    return (session.app_name, session.user_id, session.id)
+
+
+def _build_registry(statuses: Dict[str, str]) -> DeviceRegistry:
+    registry = DeviceRegistry.with_defaults()
+    for key, status in statuses.items():
+        location, _, device_id = key.partition("/")
+        device = registry.get(location, device_id)
+        if device is not None:
+            registry.set_status(device, status)
+    return registry
+
+
+def load_registry(context: CallbackContext) -> DeviceRegistry:
+    """The demo house with the statuses recorded in the session's state."""
+    statuses = context.state.get(STATE_KEY) or {}
+    key = _session_key(context)
+    with _sessions_lock:
+        cached = _sessions.get(key)
+        if cached is not None and cached[0] == statuses:
+            _sessions.move_to_end(key)
+            return cached[1]
+    registry = _build_registry(statuses)
+    _remember(key, dict(statuses), registry)
+    return registry
+
+
+def save_registry(context: CallbackContext, registry: DeviceRegistry) -> None:
+    """Record ``registry``'s statuses in the session's state."""
+    statuses = registry.changed_statuses()
+    context.state[STATE_KEY] = statuses
+    _remember(_session_key(context), dict(statuses), registry)
+
+
+def _remember(key: SessionKey, statuses: Dict[str, str], registry: DeviceRegistry) -> None:
+    with _sessions_lock:
+        _sessions[key] = (statuses, registry)
+        _sessions.move_to_end(key)
+        while len(_sessions) > _MAX_CACHED_SESSIONS:
+            _sessions.popitem(last=False)
+
+__all__ = [
+    "DEFAULT_DEVICES",
+    "DEFAULT_STATUS",
+    "Device",
+    "DeviceOperation",
+    "DeviceRegistry",
+    "STATE_KEY",
+    "VALID_STATUSES",
+    "load_registry",
+    "normalize",
+    "save_registry",
+]
@@ -0,0 +1,18 @@
+"""Concurrent runner for the Agent_Evaluation evalsets."""
+
+from .cache import EvalResultCache, agent_fingerprint
+from .evalset import EvalCase, EvalSet, load_criteria, load_eval_set
+from .runner import CaseResult, EvalReport, print_report, run_eval_set
+
+__all__ = [
+    "CaseResult",
+    "EvalCase",
+    "EvalReport",
+    "EvalResultCache",
+    "EvalSet",
+    "agent_fingerprint",
+    "load_criteria",
+    "load_eval_set",
+    "print_report",
+    "run_eval_set",
+]
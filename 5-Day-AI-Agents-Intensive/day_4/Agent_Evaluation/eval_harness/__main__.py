@@ -0,0 +1,58 @@
+"""Parallel eval harness for the home automation agent.
+
+Usage (from the repository root)::
+
+    python -m day_4.Agent_Evaluation.eval_harness \\
+        day_4/Agent_Evaluation/evals/home_automation/legacy_evalset.json --workers 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from .cache import DEFAULT_CACHE_PATH, EvalResultCache
+from .evalset import DEFAULT_CONFIG_PATH, EVALS_DIR, load_criteria, load_eval_set
+from .runner import ERROR, FAILED, print_report, run_eval_set
+
+DEFAULT_EVAL_SET = EVALS_DIR / "home_automation" / "integration.evalset.json"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("eval_sets", nargs="*", default=[str(DEFAULT_EVAL_SET)])
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG_PATH), help="adk eval config.json")
+    parser.add_argument("--workers", type=int, default=4, help="Cases evaluated concurrently")
+    parser.add_argument("--case", action="append", dest="eval_ids", default=[], help="Only run this eval_id")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH), help="Result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Run every case, ignore the cache")
+    parser.add_argument(
+        "--no-user-sim",
+        action="store_true",
+        help="Skip conversationScenario cases instead of running the user simulator",
+    )
+    args = parser.parse_args(argv)
+
+    criteria = load_criteria(args.config)
+    cache = None if args.no_cache else EvalResultCache(args.cache)
+    failed = 0
+    for path in args.eval_sets:
+        report = asyncio.run(
+            run_eval_set(
+                load_eval_set(path),
+                criteria=criteria,
+                workers=args.workers,
+                eval_ids=args.eval_ids,
+                cache=cache,
+                simulate_users=not args.no_user_sim,
+            )
+        )
+        print_report(report)
+        failed += report.count(FAILED) + report.count(ERROR)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
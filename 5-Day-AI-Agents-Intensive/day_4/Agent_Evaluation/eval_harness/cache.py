@@ -0,0 +1,191 @@
+"""Reuse agent outputs for eval cases whose inputs have not changed.
+
+A cache entry is keyed by a hash of the agent's configuration and of the eval
+case JSON. The agent side covers the instruction, model class and name,
+generation config and every tool's signature, docstring and source,
+recursively through sub-agents and ``AgentTool`` wrappers. Function tools also
+hash the files of the modules their own module imports from the same package
+(``devices.py`` and its ``DEFAULT_DEVICES`` for the home automation agent), so
+editing the data a tool reads invalidates the cache too. The entry stores the raw turn outputs
+(final responses and tool calls), not the verdict, so edited thresholds in
+``config.json`` are re-scored without re-running anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.function_tool import FunctionTool
+
+from .evalset import EvalCase, ToolUse, TurnOutput
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".adk" / "eval_cache.json"
+# Bump when the stored layout or the fingerprint inputs change.
+CACHE_VERSION = 2
+
+
+def _digest(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _describe_callable(func: Any) -> Dict[str, Any]:
+    try:
+        source_hash = hashlib.sha256(inspect.getsource(func).encode("utf-8")).hexdigest()
+    except (OSError, TypeError):
+        source_hash = None
+    try:
+        signature = str(inspect.signature(func))
+    except (TypeError, ValueError):
+        signature = None
+    return {
+        "name": getattr(func, "__qualname__", repr(func)),
+        "signature": signature,
+        "doc": inspect.getdoc(func),
+        "source": source_hash,
+    }
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _module_digests(func: Any) -> Dict[str, Optional[str]]:
+    """Hash the module defining ``func`` and the package modules it imports from.
+
+    Tools usually read module-level data (device tables, fixtures) that their
+    own source does not contain; any module in the tool module's directory
+    tree that it references counts as part of the tool.
+    """
+    module = sys.modules.get(getattr(func, "__module__", None) or "")
+    path = getattr(module, "__file__", None)
+    if module is None or path is None:
+        return {}
+    root = Path(path).resolve().parent
+    digests = {module.__name__: _file_digest(path)}
+    for value in list(vars(module).values()):
+        owner = value if inspect.ismodule(value) else inspect.getmodule(value)
+        owner_path = getattr(owner, "__file__", None)
+        if owner is None or owner_path is None or owner.__name__ in digests:
+            continue
+        if Path(owner_path).resolve().is_relative_to(root):
+            digests[owner.__name__] = _file_digest(owner_path)
+    return digests
+
+
+def _describe_tool(tool: Any) -> Dict[str, Any]:
+    if isinstance(tool, AgentTool):
+        return {"agent_tool": _describe_agent(tool.agent)}
+    if isinstance(tool, FunctionTool):
+        return {"function_tool": _describe_callable(tool.func), "modules": _module_digests(tool.func)}
+    if isinstance(tool, BaseTool):
+        return {"tool": type(tool).__qualname__, "name": tool.name, "description": tool.description}
+    if callable(tool):
+        return {"function": _describe_callable(tool), "modules": _module_digests(tool)}
+    return {"toolset": type(tool).__qualname__}
+
+
+def _describe_agent(agent: BaseAgent) -> Dict[str, Any]:
+    description: Dict[str, Any] = {
+        "class": type(agent).__qualname__,
+        "name": agent.name,
+        "description": agent.description,
+        "sub_agents": [_describe_agent(sub_agent) for sub_agent in agent.sub_agents],
+    }
+    if isinstance(agent, LlmAgent):
+        model = agent.model
+        description.update(
+            instruction=agent.instruction
+            if isinstance(agent.instruction, str)
+            else _describe_callable(agent.instruction),
+            global_instruction=agent.global_instruction
+            if isinstance(agent.global_instruction, str)
+            else _describe_callable(agent.global_instruction),
+            model=model if isinstance(model, str) else getattr(model, "model", repr(model)),
+            model_class=None if isinstance(model, str) else type(model).__qualname__,
+            generate_content_config=agent.generate_content_config.model_dump(
+                mode="json", exclude_none=True
+            )
+            if agent.generate_content_config
+            else None,
+            tools=[_describe_tool(tool) for tool in agent.tools],
+        )
+    return description
+
+
+def agent_fingerprint(agent: BaseAgent) -> str:
+    """Hash of everything about ``agent`` that can change an eval outcome."""
+    return _digest({"version": CACHE_VERSION, "agent": _describe_agent(agent)})
+
+
+class EvalResultCache:
+    """JSON file of ``case key -> turn outputs`` with hit/miss counters."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") == CACHE_VERSION:
+                self._entries = data.get("entries", {})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(fingerprint: str, case: EvalCase) -> str:
+        return _digest({"agent": fingerprint, "case": case.raw})
+
+    def get(self, key: str) -> Optional[List[TurnOutput]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [
+            TurnOutput(
+                response=turn["response"],
+                tool_uses=[ToolUse(**tool_use) for tool_use in turn["tool_uses"]],
+            )
+            for turn in entry["turns"]
+        ]
+
+    def put(self, key: str, case: EvalCase, turns: List[TurnOutput]) -> None:
+        self._entries[key] = {
+            "eval_id": case.eval_id,
+            "stored_at": time.time(),
+            "turns": [asdict(turn) for turn in turns],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write atomically so an interrupted run never corrupts the cache."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump({"version": CACHE_VERSION, "entries": self._entries}, handle, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+__all__ = ["DEFAULT_CACHE_PATH", "EvalResultCache", "agent_fingerprint"]
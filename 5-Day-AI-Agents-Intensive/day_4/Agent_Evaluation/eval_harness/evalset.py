@@ -0,0 +1,121 @@
+"""Load ``*.evalset.json`` files and ``config.json`` criteria for the harness."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+EVALS_DIR = Path(__file__).resolve().parent.parent / "evals"
+DEFAULT_CONFIG_PATH = EVALS_DIR / "home_automation" / "config.json"
+DEFAULT_CRITERIA: Dict[str, float] = {
+    "tool_trajectory_avg_score": 1.0,
+    "response_match_score": 0.8,
+}
+
+
+@dataclass(slots=True)
+class ToolUse:
+    name: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Invocation:
+    user_text: str
+    expected_response: Optional[str]
+    expected_tool_uses: List[ToolUse]
+
+
+@dataclass(slots=True)
+class TurnOutput:
+    """What the agent actually produced for one invocation."""
+
+    response: Optional[str]
+    tool_uses: List[ToolUse]
+
+
+@dataclass(slots=True)
+class EvalCase:
+    eval_id: str
+    invocations: List[Invocation]
+    raw: Dict[str, Any]
+
+    @property
+    def is_scenario(self) -> bool:
+        """User-simulation cases have a plan instead of a fixed conversation."""
+        return "conversationScenario" in self.raw or "conversation_scenario" in self.raw
+
+
+@dataclass(slots=True)
+class EvalSet:
+    eval_set_id: str
+    cases: List[EvalCase]
+    path: Path
+
+
+def _parts_text(content: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not content:
+        return None
+    texts = [part["text"] for part in content.get("parts") or [] if part.get("text")]
+    return "\n".join(texts) if texts else None
+
+
+def _parse_invocation(turn: Dict[str, Any]) -> Invocation:
+    intermediate = turn.get("intermediate_data") or {}
+    return Invocation(
+        user_text=_parts_text(turn.get("user_content")) or "",
+        expected_response=_parts_text(turn.get("final_response")),
+        expected_tool_uses=[
+            ToolUse(name=tool["name"], args=dict(tool.get("args") or {}))
+            for tool in intermediate.get("tool_uses") or []
+        ],
+    )
+
+
+def load_eval_set(path: str | Path) -> EvalSet:
+    """Parse an ADK evalset file into plain dataclasses."""
+    path = Path(path)
+    with path.open(encoding="utf-8") as handle:
+        data = json.load(handle)
+    cases = [
+        EvalCase(
+            eval_id=case["eval_id"],
+            invocations=[_parse_invocation(turn) for turn in case.get("conversation") or []],
+            raw=case,
+        )
+        for case in data.get("eval_cases", [])
+    ]
+    return EvalSet(eval_set_id=data.get("eval_set_id", path.stem), cases=cases, path=path)
+
+
+def load_criteria(path: str | Path = DEFAULT_CONFIG_PATH) -> Dict[str, float]:
+    """Return the pass thresholds from an ``adk eval`` config file."""
+    with Path(path).open(encoding="utf-8") as handle:
+        criteria = json.load(handle).get("criteria") or {}
+    return {name: float(threshold) for name, threshold in criteria.items()} or dict(
+        DEFAULT_CRITERIA
+    )
+
+
+def select_cases(eval_set: EvalSet, eval_ids: Sequence[str] = ()) -> List[EvalCase]:
+    """Filter cases by id, preserving file order (all cases when none given)."""
+    if not eval_ids:
+        return list(eval_set.cases)
+    wanted = set(eval_ids)
+    return [case for case in eval_set.cases if case.eval_id in wanted]
+
+
+__all__ = [
+    "DEFAULT_CONFIG_PATH",
+    "EVALS_DIR",
+    "EvalCase",
+    "EvalSet",
+    "Invocation",
+    "ToolUse",
+    "TurnOutput",
+    "load_criteria",
+    "load_eval_set",
+    "select_cases",
+]
@@ -0,0 +1,325 @@
+"""Run eval cases concurrently on a bounded pool of runner-owning workers.
+
+Each worker builds one ``InMemoryRunner`` and reuses it for every case it
+pulls from the shared queue; cases get a fresh session so their histories, and
+the device state the tools keep in session state, never mix. Multi-turn cases
+replay their turns in order on that session. ``conversationScenario`` cases are
+played out by ADK's ``LlmBackedUserSimulator``; they have no reference to score,
+so they stay ``NOT_EVALUATED`` and the report prints the conversation instead.
+Wall time is recorded per case, so the report shows both the suite's elapsed
+time and the serial time it would have taken.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from google.adk.agents import BaseAgent
+from google.adk.evaluation.conversation_scenarios import ConversationScenario
+from google.adk.evaluation.llm_backed_user_simulator import (
+    LlmBackedUserSimulator,
+    LlmBackedUserSimulatorConfig,
+)
+from google.adk.evaluation.user_simulator import Status
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from .cache import EvalResultCache, agent_fingerprint
+from .evalset import EvalCase, EvalSet, ToolUse, TurnOutput, load_criteria, select_cases
+from .scoring import RESPONSE_MATCH, TOOL_TRAJECTORY, average, response_match, trajectory_match
+
+APP_NAME = "Agent_Evaluation"
+USER_ID = "eval_user"
+
+PASSED = "PASSED"
+FAILED = "FAILED"
+NOT_EVALUATED = "NOT_EVALUATED"
+ERROR = "ERROR"
+
+
+@dataclass(slots=True)
+class CaseResult:
+    eval_id: str
+    status: str
+    scores: Dict[str, Optional[float]] = field(default_factory=dict)
+    wall_s: float = 0.0
+    worker: Optional[int] = None
+    turns: List[TurnOutput] = field(default_factory=list)
+    error: Optional[str] = None
+    cached: bool = False
+    # Simulated user messages of a scenario case, one per turn.
+    prompts: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class EvalReport:
+    eval_set_id: str
+    criteria: Dict[str, float]
+    workers: int
+    elapsed_s: float
+    results: List[CaseResult]
+
+    @property
+    def cached(self) -> int:
+        return sum(1 for result in self.results if result.cached)
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def serial_s(self) -> float:
+        """Sum of per-case wall times, i.e. what a one-at-a-time run costs."""
+        return sum(result.wall_s for result in self.results)
+
+
+def _default_agent() -> BaseAgent:
+    from ..agent import root_agent
+
+    return root_agent
+
+
+def _user_message(text: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def _content_text(content: types.Content) -> str:
+    return "".join(part.text for part in content.parts or [] if part.text)
+
+
+async def _run_turn(runner: InMemoryRunner, session_id: str, message: types.Content) -> TurnOutput:
+    tool_uses: List[ToolUse] = []
+    response: Optional[str] = None
+    async for event in runner.run_async(
+        user_id=USER_ID, session_id=session_id, new_message=message
+    ):
+        for call in event.get_function_calls():
+            tool_uses.append(ToolUse(name=call.name or "", args=dict(call.args or {})))
+        if event.is_final_response() and event.content and event.content.parts:
+            text_parts = [part.text for part in event.content.parts if part.text]
+            if text_parts:
+                response = "".join(text_parts)
+    return TurnOutput(response=response, tool_uses=tool_uses)
+
+
+def score_case(
+    case: EvalCase, turns: Sequence[TurnOutput], criteria: Dict[str, float]
+) -> tuple[str, Dict[str, Optional[float]]]:
+    """Score replayed turns against a case and decide pass/fail."""
+    scores: Dict[str, Optional[float]] = {}
+    if TOOL_TRAJECTORY in criteria:
+        scores[TOOL_TRAJECTORY] = average(
+            [
+                trajectory_match(turn.tool_uses, expected.expected_tool_uses)
+                for turn, expected in zip(turns, case.invocations)
+            ]
+        )
+    if RESPONSE_MATCH in criteria:
+        scores[RESPONSE_MATCH] = average(
+            [
+                response_match(turn.response, expected.expected_response)
+                for turn, expected in zip(turns, case.invocations)
+                if expected.expected_response is not None
+            ]
+        )
+    evaluated = {name: score for name, score in scores.items() if score is not None}
+    if not evaluated:
+        return NOT_EVALUATED, scores
+    passed = all(score >= criteria[name] for name, score in evaluated.items())
+    return (PASSED if passed else FAILED), scores
+
+
+async def _simulate_user(
+    runner: InMemoryRunner,
+    session_id: str,
+    case: EvalCase,
+    config: LlmBackedUserSimulatorConfig,
+) -> tuple[List[str], List[TurnOutput]]:
+    """Play a ``conversationScenario`` case until the simulated user stops."""
+    scenario = ConversationScenario.model_validate(
+        case.raw.get("conversationScenario") or case.raw.get("conversation_scenario")
+    )
+    simulator = LlmBackedUserSimulator(config=config, conversation_scenario=scenario)
+    prompts: List[str] = []
+    turns: List[TurnOutput] = []
+    while True:
+        session = await runner.session_service.get_session(
+            app_name=runner.app_name, user_id=USER_ID, session_id=session_id
+        )
+        next_message = await simulator.get_next_user_message(list(session.events) if session else [])
+        if next_message.status != Status.SUCCESS or next_message.user_message is None:
+            return prompts, turns
+        prompts.append(_content_text(next_message.user_message))
+        turns.append(await _run_turn(runner, session_id, next_message.user_message))
+
+
+async def _run_case(
+    runner: InMemoryRunner,
+    case: EvalCase,
+    criteria: Dict[str, float],
+    worker: int,
+    user_simulator: LlmBackedUserSimulatorConfig,
+) -> CaseResult:
+    started = time.perf_counter()
+    session_id: Optional[str] = None
+    try:
+        session = await runner.session_service.create_session(
+            app_name=runner.app_name, user_id=USER_ID
+        )
+        session_id = session.id
+        prompts: List[str] = []
+        if case.is_scenario:
+            prompts, turns = await _simulate_user(runner, session_id, case, user_simulator)
+            status, scores = NOT_EVALUATED, {}
+        else:
+            turns = [
+                await _run_turn(runner, session_id, _user_message(invocation.user_text))
+                for invocation in case.invocations
+            ]
+            status, scores = score_case(case, turns, criteria)
+        return CaseResult(
+            eval_id=case.eval_id,
+            status=status,
+            scores=scores,
+            wall_s=time.perf_counter() - started,
+            worker=worker,
+            turns=turns,
+            prompts=prompts,
+        )
+    except Exception as exc:  # noqa: BLE001 - one broken case must not stop the suite
+        return CaseResult(
+            eval_id=case.eval_id,
+            status=ERROR,
+            wall_s=time.perf_counter() - started,
+            worker=worker,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    finally:
+        if session_id is not None:
+            await runner.session_service.delete_session(
+                app_name=runner.app_name, user_id=USER_ID, session_id=session_id
+            )
+
+
+async def run_eval_set(
+    eval_set: EvalSet,
+    *,
+    agent: Optional[BaseAgent] = None,
+    criteria: Optional[Dict[str, float]] = None,
+    workers: int = 4,
+    eval_ids: Sequence[str] = (),
+    cache: Optional[EvalResultCache] = None,
+    simulate_users: bool = True,
+    user_simulator: Optional[LlmBackedUserSimulatorConfig] = None,
+) -> EvalReport:
+    """Execute every case of ``eval_set`` with at most ``workers`` in flight.
+
+    With a ``cache``, cases whose agent configuration and content are
+    unchanged since a previous run are re-scored from the stored outputs
+    instead of being executed again. Scenario cases are never cached (the
+    simulated user differs from run to run) and are skipped when
+    ``simulate_users`` is false.
+    """
+    agent = agent or _default_agent()
+    criteria = criteria if criteria is not None else load_criteria()
+    cases = select_cases(eval_set, eval_ids)
+    results: List[Optional[CaseResult]] = [None] * len(cases)
+    cache_keys: Dict[int, str] = {}
+    fingerprint = agent_fingerprint(agent) if cache is not None else ""
+    user_simulator = user_simulator or LlmBackedUserSimulatorConfig()
+
+    queue: asyncio.Queue[tuple[int, EvalCase]] = asyncio.Queue()
+    for index, case in enumerate(cases):
+        if case.is_scenario:
+            if simulate_users:
+                queue.put_nowait((index, case))
+            else:
+                results[index] = CaseResult(eval_id=case.eval_id, status=NOT_EVALUATED)
+            continue
+        if not case.invocations:
+            results[index] = CaseResult(eval_id=case.eval_id, status=NOT_EVALUATED)
+            continue
+        if cache is not None:
+            cache_keys[index] = cache.key(fingerprint, case)
+            turns = cache.get(cache_keys[index])
+            if turns is not None:
+                status, scores = score_case(case, turns, criteria)
+                results[index] = CaseResult(
+                    eval_id=case.eval_id, status=status, scores=scores, turns=turns, cached=True
+                )
+                continue
+        queue.put_nowait((index, case))
+
+    async def _worker(worker: int) -> None:
+        runner = InMemoryRunner(agent=agent, app_name=APP_NAME)
+        while True:
+            try:
+                index, case = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results[index] = await _run_case(runner, case, criteria, worker, user_simulator)
+
+    # No pool (and no workers line in the report) when every case was cached.
+    pool_size = max(1, min(workers, queue.qsize())) if not queue.empty() else 0
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker(worker) for worker in range(pool_size)))
+    if cache is not None:
+        for index, key in cache_keys.items():
+            result = results[index]
+            if result is not None and not result.cached and result.status != ERROR:
+                cache.put(key, cases[index], result.turns)
+        cache.save()
+    return EvalReport(
+        eval_set_id=eval_set.eval_set_id,
+        criteria=dict(criteria),
+        workers=pool_size,
+        elapsed_s=time.perf_counter() - started,
+        results=[result for result in results if result is not None],
+    )
+
+
+def _format_score(value: Optional[float]) -> str:
+    return f"{value:>10.3f}" if value is not None else f"{'-':>10}"
+
+
+def print_report(report: EvalReport) -> None:
+    icons: Dict[str, Any] = {PASSED: "✅", FAILED: "❌", NOT_EVALUATED: "⏭️", ERROR: "💥"}
+    names = list(report.criteria)
+    workers = f" ({report.workers} workers)" if report.workers else ""
+    print(f"\n📊 {report.eval_set_id}{workers}")
+    print(f"   {'case':<32}{'status':<16}" + "".join(f"{name[:9]:>10}" for name in names) + f"{'wall s':>9}")
+    for result in report.results:
+        print(
+            f"{icons.get(result.status, ' ')} {result.eval_id:<32}{result.status:<16}"
+            + "".join(_format_score(result.scores.get(name)) for name in names)
+            + (f"{'cached':>9}" if result.cached else f"{result.wall_s:>9.2f}")
+        )
+        if result.error:
+            print(f"     {result.error}")
+        for prompt, turn in zip(result.prompts, result.turns):
+            print(f"     👤 {prompt}")
+            print(f"     🤖 {turn.response or '-'}")
+    thresholds = ", ".join(f"{name}>={value}" for name, value in report.criteria.items())
+    print(f"   Criteria: {thresholds}")
+    print(
+        f"   Passed: {report.count(PASSED)}, failed: {report.count(FAILED)}, "
+        f"errors: {report.count(ERROR)}, not evaluated: {report.count(NOT_EVALUATED)}"
+    )
+    if report.cached:
+        print(f"   Reused {report.cached} unchanged case(s) from the result cache")
+    print(f"   Elapsed: {report.elapsed_s:.2f}s (serial estimate {report.serial_s:.2f}s)")
+
+
+__all__ = [
+    "CaseResult",
+    "ERROR",
+    "EvalReport",
+    "FAILED",
+    "NOT_EVALUATED",
+    "PASSED",
+    "print_report",
+    "run_eval_set",
+    "score_case",
+]
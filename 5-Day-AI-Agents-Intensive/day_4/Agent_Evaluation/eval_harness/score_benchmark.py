@@ -0,0 +1,106 @@
+"""Benchmark cached ``response_match_score`` against per-case ``RougeScorer``.
+
+A synthetic suite is built from the reference responses in the home
+automation evalsets: every case gets a distinct reference and several
+perturbed candidates (the repeated runs of a regression suite). The default
+path scores each pair with ``RougeScorer.score``; the cached path scores the
+whole suite with ``ResponseMatchScorer.score_batch``, first cold and then
+warm (a rerun in the same process). Scores must match exactly: before
+timing, every pair of evalset responses is scored both ways and any
+difference aborts the benchmark.
+
+Usage (from the repository root)::
+
+    python -m day_4.Agent_Evaluation.eval_harness.score_benchmark --cases 2000 --candidates 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from .evalset import EVALS_DIR, load_eval_set
+from .scoring import ResponseMatchScorer, response_match_uncached
+
+
+def _reference_texts() -> List[str]:
+    texts = []
+    for path in sorted(EVALS_DIR.glob("**/*evalset*.json")):
+        for case in load_eval_set(path).cases:
+            texts.extend(
+                invocation.expected_response
+                for invocation in case.invocations
+                if invocation.expected_response
+            )
+    return texts
+
+
+def check_equivalence(texts: List[str]) -> int:
+    """Score every pair of ``texts`` both ways; raise on any difference."""
+    scorer = ResponseMatchScorer()
+    checked = 0
+    for candidate in texts:
+        for reference in texts:
+            expected = response_match_uncached(candidate, reference)
+            got = scorer.score(candidate, reference)
+            if got != expected:
+                raise AssertionError(
+                    f"ResponseMatchScorer gave {got!r}, RougeScorer {expected!r} for "
+                    f"candidate {candidate!r} / reference {reference!r}"
+                )
+            checked += 1
+    return checked
+
+
+def build_suite(cases: int, candidates: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """Return ``(candidate, reference)`` pairs for a synthetic suite."""
+    rng = random.Random(seed)
+    seeds = _reference_texts()
+    pairs = []
+    for index in range(cases):
+        words = rng.choice(seeds).split()
+        reference = " ".join(words + [f"device{index}", "successfully", "switched"])
+        for _ in range(candidates):
+            candidate_words = [word for word in reference.split() if rng.random() > 0.2]
+            rng.shuffle(candidate_words)
+            pairs.append((" ".join(candidate_words + ["Anything", "else?"]), reference))
+    return pairs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=2000, help="Distinct references")
+    parser.add_argument("--candidates", type=int, default=5, help="Candidates per reference")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    checked = check_equivalence(sorted(set(_reference_texts())))
+    print(f"✅ {checked} evalset response pairs score identically to RougeScorer")
+
+    pairs = build_suite(args.cases, args.candidates, args.seed)
+
+    started = time.perf_counter()
+    baseline = [response_match_uncached(candidate, reference) for candidate, reference in pairs]
+    baseline_s = time.perf_counter() - started
+
+    scorer = ResponseMatchScorer(cache_size=2 * len(pairs))
+    started = time.perf_counter()
+    cold = scorer.score_batch(pairs)
+    cold_s = time.perf_counter() - started
+    started = time.perf_counter()
+    warm = scorer.score_batch(pairs)
+    warm_s = time.perf_counter() - started
+
+    drift = max(abs(a - b) for a, b in zip(baseline, cold))
+    assert cold == warm
+    print(f"\n{len(pairs)} pairs ({args.cases} references x {args.candidates} candidates)")
+    print(f"{'path':<22}{'seconds':>10}{'pairs/s':>12}{'speedup':>10}")
+    for name, seconds in (("RougeScorer.score", baseline_s), ("cached (cold)", cold_s), ("cached (warm)", warm_s)):
+        print(f"{name:<22}{seconds:>10.3f}{len(pairs) / seconds:>12.0f}{baseline_s / seconds:>9.1f}x")
+    print(f"max |score difference| vs RougeScorer: {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Criteria used by ``config.json``, computed the way ``adk eval`` does.
+
+* ``tool_trajectory_avg_score`` – 1.0 for an invocation whose tool calls match
+  the expected names and args exactly and in order, else 0.0; averaged over
+  the invocations of a case.
+* ``response_match_score`` – ROUGE-1 F-measure (with stemming) between the
+  agent's final response and the reference, averaged over invocations.
+
+``rouge_scorer.RougeScorer.score`` re-tokenizes and re-stems both texts on
+every call. ``ResponseMatchScorer`` produces the same numbers but caches the
+unigram counts of each text and the Porter stem of each word, so a reference
+is tokenized once per suite and ``score_batch`` only pays for new candidates.
+The stemmer must be the one rouge_score uses (NLTK's default
+``NLTK_EXTENSIONS`` mode); ``score_benchmark`` checks the two paths agree on
+every pair of evalset responses.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from nltk.stem import porter
+from rouge_score import rouge_scorer, tokenizers
+
+from .evalset import ToolUse
+
+TOOL_TRAJECTORY = "tool_trajectory_avg_score"
+RESPONSE_MATCH = "response_match_score"
+
+_reference_scorer = rouge_scorer.RougeScorer(["rouge1"], use_stemmer=True)
+# Lowercasing/splitting only; stemming is applied (and cached) per word below.
+_splitter = tokenizers.DefaultTokenizer(use_stemmer=False)
+_stemmer = porter.PorterStemmer()  # same mode as rouge_score.tokenize
+
+
+def trajectory_match(actual: Sequence[ToolUse], expected: Sequence[ToolUse]) -> float:
+    if len(actual) != len(expected):
+        return 0.0
+    for got, want in zip(actual, expected):
+        if got.name != want.name or got.args != want.args:
+            return 0.0
+    return 1.0
+
+
+@lru_cache(maxsize=65536)
+def _stem(word: str) -> str:
+    # rouge_score only stems tokens longer than three characters.
+    return _stemmer.stem(word) if len(word) > 3 else word
+
+
+class ResponseMatchScorer:
+    """ROUGE-1 F-measure with cached tokenization, identical to ``RougeScorer``."""
+
+    def __init__(self, cache_size: int = 8192) -> None:
+        self.unigrams = lru_cache(maxsize=cache_size)(self._unigrams)
+
+    @staticmethod
+    def _unigrams(text: str) -> Counter:
+        # Shared between callers through the cache: treat as read-only.
+        return Counter(_stem(token) for token in _splitter.tokenize(text))
+
+    def score(self, candidate: Optional[str], reference: Optional[str]) -> float:
+        return self._fmeasure(self.unigrams(candidate or ""), self.unigrams(reference or ""))
+
+    def score_batch(self, pairs: Iterable[Tuple[Optional[str], Optional[str]]]) -> List[float]:
+        """Score ``(candidate, reference)`` pairs, reusing cached references."""
+        unigrams = self.unigrams
+        return [
+            self._fmeasure(unigrams(candidate or ""), unigrams(reference or ""))
+            for candidate, reference in pairs
+        ]
+
+    @staticmethod
+    def _fmeasure(candidate: Counter, reference: Counter) -> float:
+        if not candidate or not reference:
+            return 0.0
+        if len(candidate) > len(reference):
+            overlap = sum(min(count, candidate[token]) for token, count in reference.items())
+        else:
+            overlap = sum(min(count, reference[token]) for token, count in candidate.items())
+        if not overlap:
+            return 0.0
+        precision = overlap / sum(candidate.values())
+        recall = overlap / sum(reference.values())
+        return 2 * precision * recall / (precision + recall)
+
+
+_scorer = ResponseMatchScorer()
+
+
+def response_match(candidate: Optional[str], reference: Optional[str]) -> float:
+    return _scorer.score(candidate, reference)
+
+
+def response_match_uncached(candidate: Optional[str], reference: Optional[str]) -> float:
+    """The per-call ``RougeScorer`` path, kept as the benchmark baseline."""
+    return _reference_scorer.score(reference or "", candidate or "")["rouge1"].fmeasure
+
+
+def average(values: Sequence[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+__all__ = [
+    "RESPONSE_MATCH",
+    "ResponseMatchScorer",
+    "TOOL_TRAJECTORY",
+    "average",
+    "response_match",
+    "response_match_uncached",
+    "trajectory_match",
+]
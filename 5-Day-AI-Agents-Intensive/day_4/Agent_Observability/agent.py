@@ -3,16 +3,25 @@
 from __future__ import annotations
 
 import asyncio
-import logging
 import os
-import threading
-from typing import Any, Optional
+import sys
+from pathlib import Path
+from typing import Optional
 
 from google.adk.agents import LlmAgent
 
+try:
+    from intensive_shared.lazy_agent import LazyAgentRegistry
+except ImportError:
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from intensive_shared.lazy_agent import LazyAgentRegistry  # type: ignore
+
 from .agent_observability import (
     DEFAULT_QUERY,
     configure_logging,
+    configure_tracing,
     run_observability_demo,
 )
 from .agent_observability.agents import (
@@ -20,35 +29,22 @@ from .agent_observability.agents import (
     create_research_agent,
 )
 
-_root_agent: Optional[LlmAgent] = None
-_root_agent_lock = threading.Lock()
 
+def _build_root_agent() -> LlmAgent:
+    search_agent = create_google_search_agent()
+    return create_research_agent(search_agent)
 
-def get_root_agent() -> LlmAgent:
-    """Return the root agent expected by Google ADK entrypoints."""
-    global _root_agent
-    if _root_agent is not None:
-        return _root_agent
 
-    with _root_agent_lock:
-        if _root_agent is None:
-            try:
-                search_agent = create_google_search_agent()
-                _root_agent = create_research_agent(search_agent)
-            except Exception:
-                logging.exception(
-                    "Failed to initialize Agent Observability root_agent"
-                )
-                raise
+_agents = LazyAgentRegistry()
+_agents.register("root_agent", _build_root_agent)
 
-    return _root_agent
+# Expose root_agent lazily when imported by Google ADK.
+__getattr__ = _agents.module_getattr(__name__)
 
 
-def __getattr__(name: str) -> Any:
-    """Expose root_agent lazily when imported by Google ADK."""
-    if name == "root_agent":
-        return get_root_agent()
-    raise AttributeError(name)
+def get_root_agent() -> LlmAgent:
+    """Return the root agent expected by Google ADK entrypoints."""
+    return _agents.get("root_agent")
 
 
 async def _run(query: str) -> None:
@@ -57,6 +53,7 @@ async def _run(query: str) -> None:
 
 def main(query: Optional[str] = None) -> None:
     configure_logging()
+    configure_tracing()
     resolved_query = query or os.environ.get("AGENT_QUERY") or DEFAULT_QUERY
     asyncio.run(_run(resolved_query))
 
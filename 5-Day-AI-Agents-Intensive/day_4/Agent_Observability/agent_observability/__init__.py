@@ -1,11 +1,15 @@
 """Agent observability demo utilities."""
 
 from .config import DEFAULT_QUERY
+from .load import run_load_test
 from .logging_utils import configure_logging
 from .runner import run_observability_demo
+from .tracing import configure_tracing
 
 __all__ = [
     "DEFAULT_QUERY",
     "configure_logging",
+    "configure_tracing",
+    "run_load_test",
     "run_observability_demo",
 ]
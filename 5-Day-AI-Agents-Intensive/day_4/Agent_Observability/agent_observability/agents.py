@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools.google_search_tool import google_search
 
-from .config import MODEL_NAME, RETRY_CONFIG
+try:
+    from intensive_shared.replay_llm import build_model
+except ImportError:
+    repo_root = Path(__file__).resolve().parents[3]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+    from intensive_shared.replay_llm import build_model  # type: ignore
+
+from .config import LLM_CASSETTE_PATH, MODEL_NAME, RETRY_CONFIG
 from .tools import count_papers
 
 
@@ -15,7 +25,7 @@ def create_google_search_agent() -> LlmAgent:
     """Create an agent that only performs Google searches."""
     return LlmAgent(
         name="google_search_agent",
-        model=Gemini(model=MODEL_NAME, retry_options=RETRY_CONFIG),
+        model=build_model(MODEL_NAME, retry_options=RETRY_CONFIG, cassette_path=LLM_CASSETTE_PATH),
         description="Searches for information using Google search",
         instruction="""Use the google_search tool to find information on the given topic.
 Return the raw search results.""",
@@ -27,7 +37,7 @@ def create_research_agent(search_agent: LlmAgent) -> LlmAgent:
     """Create the root agent that orchestrates search and counting."""
     return LlmAgent(
         name="research_paper_finder_agent",
-        model=Gemini(model=MODEL_NAME, retry_options=RETRY_CONFIG),
+        model=build_model(MODEL_NAME, retry_options=RETRY_CONFIG, cassette_path=LLM_CASSETTE_PATH),
         instruction="""Your task is to find research papers and count them. You must first ask the
 google_search_agent for candidate papers, then run the count_papers tool and
 return both the papers and the total count. After using every required tool,
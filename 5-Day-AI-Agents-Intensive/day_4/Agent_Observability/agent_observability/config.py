@@ -4,11 +4,32 @@ from __future__ import annotations
 
 from google.genai import types
 
-LOG_FILES = ("logger.log", "web.log", "tunnel.log")
+LOG_FILES = ("logger.log", "web.log", "tunnel.log", "traces.jsonl")
 LOG_FILE_NAME = "logger.log"
-LOG_FORMAT = "%(filename)s:%(lineno)s %(levelname)s:%(message)s"
+LOG_FORMAT = "%(asctime)s %(filename)s:%(lineno)s %(levelname)s:%(message)s"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_MAX_BATCH = 1024
+LOG_JSON_LINES = False
 DEFAULT_QUERY = "Find recent papers on quantum computing"
 MODEL_NAME = "gemini-2.5-flash-lite"
+# Cassette for AGENT_LLM_MODE=record/replay (offline benchmarks and load tests).
+LLM_CASSETTE_PATH = "llm_cassette.jsonl"
+
+# ConversationTracePlugin: trace 1-in-N sessions (errors are always traced) and
+# remember at most this many session ids for the "new vs continue" banner.
+TRACE_SAMPLE_RATE = 1
+TRACE_MAX_SESSIONS = 1024
+# Load tests keep transcript tracing on, but only for a sample of sessions.
+LOAD_TRACE_SAMPLE_RATE = 10
+
+# OpenTelemetry export: "file" writes JSON lines to TRACE_FILE_NAME as a local
+# stand-in for an OTLP collector, "console" prints spans, "none" disables.
+TRACE_EXPORTER = "file"
+TRACE_FILE_NAME = "traces.jsonl"
+TRACE_SERVICE_NAME = "agent-observability-demo"
+TRACE_SCHEDULE_DELAY_MILLIS = 1000
+TRACE_MAX_EXPORT_BATCH_SIZE = 256
 
 RETRY_CONFIG = types.HttpRetryOptions(
     attempts=5,
@@ -0,0 +1,168 @@
+"""Concurrent load driver for capacity-planning the research agent.
+
+One runner is built and reused for every request. Requests arrive as a
+Poisson process at ``arrival_rate`` per second (or back-to-back when no rate
+is given), at most ``concurrency`` are in flight, and they are spread over
+``sessions`` sessions. Runs on the same session are serialised because a
+session's event history is append-only.
+
+Usage (from the repository root)::
+
+    python -m day_4.Agent_Observability.agent_observability.load \\
+        --requests 40 --concurrency 8 --sessions 4 --rate 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from .config import DEFAULT_QUERY, LOAD_TRACE_SAMPLE_RATE
+from .logging_utils import configure_logging
+from .plugins import CountInvocationPlugin, logger_sink
+from .runner import build_runner
+
+
+@dataclass(slots=True)
+class LoadReport:
+    requests: int
+    errors: int
+    elapsed_s: float
+    throughput_rps: float
+    latency_ms: Dict[str, float]
+    agent_runs: int
+    llm_requests: int
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _counts(runner: InMemoryRunner) -> tuple[int, int]:
+    plugin = runner.plugin_manager.get_plugin("count_invocation")
+    if not isinstance(plugin, CountInvocationPlugin):
+        return 0, 0
+    return plugin.agent_count, plugin.llm_request_count
+
+
+async def run_load_test(
+    queries: Sequence[str] = (DEFAULT_QUERY,),
+    *,
+    total_requests: int = 20,
+    concurrency: int = 4,
+    sessions: int = 4,
+    arrival_rate: Optional[float] = None,
+    user_id: str = "load_user",
+    runner: Optional[InMemoryRunner] = None,
+    seed: Optional[int] = None,
+) -> LoadReport:
+    """Fire ``total_requests`` queries through a single shared runner."""
+    if runner is None:
+        runner = build_runner(
+            trace_sample_rate=LOAD_TRACE_SAMPLE_RATE,
+            trace_sink=logger_sink(),
+            echo_plugin_logs=False,
+        )
+    session_ids: List[str] = []
+    for _ in range(max(1, sessions)):
+        session = await runner.session_service.create_session(
+            app_name=runner.app_name, user_id=user_id
+        )
+        session_ids.append(session.id)
+    session_locks = {session_id: asyncio.Lock() for session_id in session_ids}
+    in_flight = asyncio.Semaphore(max(1, concurrency))
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    errors = 0
+    agent_runs_before, llm_requests_before = _counts(runner)
+
+    async def _one(index: int, arrived: float) -> None:
+        nonlocal errors
+        session_id = session_ids[index % len(session_ids)]
+        message = types.Content(
+            role="user", parts=[types.Part(text=queries[index % len(queries)])]
+        )
+        try:
+            async with session_locks[session_id], in_flight:
+                async for _ in runner.run_async(
+                    user_id=user_id, session_id=session_id, new_message=message
+                ):
+                    pass
+        except Exception:  # noqa: BLE001 - every failure counts as an error sample
+            errors += 1
+            return
+        latencies.append(time.perf_counter() - arrived)
+
+    started = time.perf_counter()
+    tasks: List[asyncio.Task] = []
+    for index in range(total_requests):
+        if arrival_rate and index:
+            await asyncio.sleep(rng.expovariate(arrival_rate))
+        tasks.append(asyncio.create_task(_one(index, time.perf_counter())))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    agent_runs_after, llm_requests_after = _counts(runner)
+    ordered = sorted(latency * 1000 for latency in latencies)
+    return LoadReport(
+        requests=total_requests,
+        errors=errors,
+        elapsed_s=elapsed,
+        throughput_rps=len(latencies) / elapsed if elapsed else 0.0,
+        latency_ms={
+            f"p{percent}": _percentile(ordered, percent) for percent in (50, 90, 95, 99)
+        },
+        agent_runs=agent_runs_after - agent_runs_before,
+        llm_requests=llm_requests_after - llm_requests_before,
+    )
+
+
+def print_load_report(report: LoadReport) -> None:
+    print("\n📈 Load test results")
+    print(f"   Requests: {report.requests} (errors: {report.errors})")
+    print(f"   Elapsed: {report.elapsed_s:.2f}s, throughput: {report.throughput_rps:.2f} req/s")
+    print(
+        "   Latency ms: "
+        + ", ".join(f"{name}={value:.0f}" for name, value in report.latency_ms.items())
+    )
+    print(f"   Agent runs: {report.agent_runs}, LLM requests: {report.llm_requests}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20, help="Total queries to send")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max queries in flight")
+    parser.add_argument("--sessions", type=int, default=4, help="Sessions to spread load over")
+    parser.add_argument("--rate", type=float, default=None, help="Mean arrivals per second")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--query", action="append", dest="queries", help="Query text (repeatable)"
+    )
+    args = parser.parse_args()
+
+    configure_logging()
+    report = asyncio.run(
+        run_load_test(
+            args.queries or (DEFAULT_QUERY,),
+            total_requests=args.requests,
+            concurrency=args.concurrency,
+            sessions=args.sessions,
+            arrival_rate=args.rate,
+            seed=args.seed,
+        )
+    )
+    print_load_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""Streaming analyzer for ``logger.log`` written by the observability demo.
+
+Lines flow through a generator pipeline (raw line → message → LoggingPlugin
+block → aggregate), so memory stays proportional to the number of distinct
+agents/tools and in-flight invocations rather than to the size of the log.
+Both the text ``LOG_FORMAT`` and the JSON-lines format are understood.
+Model and tool blocks are attributed through the ``Invocation ID`` line that
+``FileLoggingPlugin`` writes into them, so concurrent runs (``load.py``) are
+kept apart; blocks from older logs without it are timed but not attributed.
+
+Usage (from the repository root)::
+
+    python -m day_4.Agent_Observability.agent_observability.log_analyzer \\
+        logger.log.1 logger.log --top 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import json
+import re
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from .config import LOG_FILE_NAME
+
+# Matches LOG_FORMAT ("%(asctime)s %(filename)s:%(lineno)s %(levelname)s:%(message)s");
+# the timestamp is optional so logs written before it was added still parse.
+_TEXT_LINE = re.compile(
+    r"^(?:(?P<asctime>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),(?P<millis>\d{3}) )?"
+    r"\S+:\d+ [A-Z]+:(?P<message>.*)$"
+)
+_PLUGIN_LINE = re.compile(r"\[logging_plugin\] (?P<body>.*)$")
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+_TOKEN_USAGE = re.compile(r"Input: (?P<input>\d+), Output: (?P<output>\d+)")
+
+_BLOCK_KINDS = (
+    "INVOCATION STARTING",
+    "INVOCATION COMPLETED",
+    "AGENT STARTING",
+    "AGENT COMPLETED",
+    "LLM REQUEST",
+    "LLM RESPONSE",
+    "LLM ERROR",
+    "TOOL STARTING",
+    "TOOL COMPLETED",
+    "TOOL ERROR",
+)
+
+# Open entries are normally bounded by concurrency; the cap only matters for
+# truncated logs where "COMPLETED" lines never arrive.
+_MAX_OPEN_ENTRIES = 10_000
+
+
+@dataclass(slots=True)
+class PluginBlock:
+    """One LoggingPlugin callback: a header line plus its indented fields."""
+
+    ts: Optional[float]
+    kind: str
+    fields: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class CallStats:
+    count: int = 0
+    timed: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    errors: int = 0
+
+    def add(self, duration: Optional[float]) -> None:
+        self.count += 1
+        if duration is not None:
+            self.timed += 1
+            self.total_s += duration
+            self.max_s = max(self.max_s, duration)
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.timed if self.timed else 0.0
+
+
+@dataclass(slots=True)
+class InvocationSummary:
+    duration_s: float
+    invocation_id: str
+    agent: str
+    llm_calls: int
+    tool_calls: int
+
+
+@dataclass(slots=True)
+class _OpenInvocation:
+    start: Optional[float]
+    agent: str
+    llm_calls: int = 0
+    tool_calls: int = 0
+    llm_agents: Set[str] = field(default_factory=set)
+
+
+@lru_cache(maxsize=8)
+def _epoch_seconds(asctime: str) -> float:
+    return time.mktime(time.strptime(asctime, "%Y-%m-%d %H:%M:%S"))
+
+
+def iter_messages(lines: Iterable[str]) -> Iterator[Tuple[Optional[float], str]]:
+    """Yield ``(timestamp, message)`` pairs from text or JSON-lines records."""
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict) and "message" in record:
+                yield record.get("ts"), str(record["message"])
+                continue
+        match = _TEXT_LINE.match(line)
+        if match is None:
+            # Continuation of a multi-line record, or captured stdout.
+            yield None, line
+            continue
+        ts = None
+        if match.group("asctime"):
+            ts = _epoch_seconds(match.group("asctime")) + int(match.group("millis")) / 1000
+        yield ts, match.group("message")
+
+
+def iter_plugin_blocks(
+    messages: Iterable[Tuple[Optional[float], str]],
+) -> Iterator[PluginBlock]:
+    """Group LoggingPlugin lines into blocks, skipping everything else."""
+    current: Optional[PluginBlock] = None
+    for ts, message in messages:
+        if "[logging_plugin]" not in message:
+            continue
+        match = _PLUGIN_LINE.search(_ANSI_ESCAPE.sub("", message))
+        if match is None:
+            continue
+        body = match.group("body")
+        if body.startswith(" "):
+            if current is not None:
+                key, _, value = body.strip().partition(": ")
+                current.fields.setdefault(key, value)
+            continue
+        if current is not None:
+            yield current
+        current = None
+        for kind in _BLOCK_KINDS:
+            if body.endswith(kind):
+                current = PluginBlock(ts=ts, kind=kind)
+                break
+    if current is not None:
+        yield current
+
+
+def _elapsed(start: Optional[float], end: Optional[float]) -> Optional[float]:
+    if start is None or end is None:
+        return None
+    return max(0.0, end - start)
+
+
+class LogAnalyzer:
+    """Aggregates LoggingPlugin blocks into per-agent/tool statistics."""
+
+    def __init__(self, top: int = 10) -> None:
+        self.top = top
+        self.agents: Dict[str, CallStats] = {}
+        self.llm_calls: Dict[str, CallStats] = {}
+        self.tools: Dict[str, CallStats] = {}
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.invocations = CallStats()
+        # (duration, invocation id, arrival order, summary); the counter breaks
+        # ties so the unorderable summary is never compared.
+        self._slowest: List[Tuple[float, str, int, InvocationSummary]] = []
+        self._arrivals = itertools.count()
+        self._open_invocations: OrderedDict[str, _OpenInvocation] = OrderedDict()
+        self._open_agents: OrderedDict[Tuple[str, str], List[Optional[float]]] = OrderedDict()
+        self._open_llm: OrderedDict[Tuple[str, str], List[Optional[float]]] = OrderedDict()
+        self._open_tools: OrderedDict[str, Optional[float]] = OrderedDict()
+
+    def consume(self, blocks: Iterable[PluginBlock]) -> "LogAnalyzer":
+        for block in blocks:
+            handler = getattr(self, "_on_" + block.kind.lower().replace(" ", "_"))
+            handler(block)
+        return self
+
+    def slowest_invocations(self) -> List[InvocationSummary]:
+        return [entry[3] for entry in sorted(self._slowest, reverse=True)]
+
+    # Invocation lifecycle -------------------------------------------------
+
+    def _on_invocation_starting(self, block: PluginBlock) -> None:
+        invocation_id = block.fields.get("Invocation ID", "")
+        agent = block.fields.get("Starting Agent", "unknown")
+        self._open_invocations[invocation_id] = _OpenInvocation(block.ts, agent)
+        _trim(self._open_invocations)
+
+    def _on_invocation_completed(self, block: PluginBlock) -> None:
+        invocation_id = block.fields.get("Invocation ID", "")
+        opened = self._open_invocations.pop(invocation_id, None)
+        if opened is None:
+            return
+        # Model starts without a response (cancelled calls) end with their run.
+        for agent in opened.llm_agents:
+            self._open_llm.pop((invocation_id, agent), None)
+        duration = _elapsed(opened.start, block.ts)
+        self.invocations.add(duration)
+        if duration is None:
+            return
+        summary = InvocationSummary(
+            duration, invocation_id, opened.agent, opened.llm_calls, opened.tool_calls
+        )
+        entry = (duration, invocation_id, next(self._arrivals), summary)
+        if len(self._slowest) < self.top:
+            heapq.heappush(self._slowest, entry)
+        elif self._slowest and duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    # Agents ---------------------------------------------------------------
+
+    def _on_agent_starting(self, block: PluginBlock) -> None:
+        key = (block.fields.get("Invocation ID", ""), block.fields.get("Agent Name", "unknown"))
+        self._open_agents.setdefault(key, []).append(block.ts)
+        _trim(self._open_agents)
+
+    def _on_agent_completed(self, block: PluginBlock) -> None:
+        agent = block.fields.get("Agent Name", "unknown")
+        key = (block.fields.get("Invocation ID", ""), agent)
+        starts = self._open_agents.get(key)
+        start = None
+        if starts:
+            start = starts.pop()
+            if not starts:
+                del self._open_agents[key]
+        self.agents.setdefault(agent, CallStats()).add(_elapsed(start, block.ts))
+
+    # Model calls ----------------------------------------------------------
+
+    def _on_llm_request(self, block: PluginBlock) -> None:
+        agent = block.fields.get("Agent", "unknown")
+        invocation_id = block.fields.get("Invocation ID", "")
+        self._open_llm.setdefault((invocation_id, agent), []).append(block.ts)
+        _trim(self._open_llm)
+        opened = self._open_invocations.get(invocation_id)
+        if opened is not None:
+            opened.llm_calls += 1
+            opened.llm_agents.add(agent)
+
+    def _on_llm_response(self, block: PluginBlock) -> None:
+        agent = block.fields.get("Agent", "unknown")
+        if block.fields.get("Partial") == "True":
+            return
+        stats = self.llm_calls.setdefault(agent, CallStats())
+        stats.add(_elapsed(self._pop_llm_start(block, agent), block.ts))
+        if "❌ ERROR - Code" in block.fields:
+            stats.errors += 1
+        usage = block.fields.get("Token Usage - Input")
+        if usage is not None:
+            match = _TOKEN_USAGE.search("Input: " + usage)
+            if match is not None:
+                self.input_tokens += int(match.group("input"))
+                self.output_tokens += int(match.group("output"))
+
+    def _on_llm_error(self, block: PluginBlock) -> None:
+        agent = block.fields.get("Agent", "unknown")
+        stats = self.llm_calls.setdefault(agent, CallStats())
+        stats.add(_elapsed(self._pop_llm_start(block, agent), block.ts))
+        stats.errors += 1
+
+    def _pop_llm_start(self, block: PluginBlock, agent: str) -> Optional[float]:
+        # One agent's model calls within an invocation run one after another.
+        key = (block.fields.get("Invocation ID", ""), agent)
+        starts = self._open_llm.get(key)
+        if not starts:
+            return None
+        start = starts.pop(0)
+        if not starts:
+            del self._open_llm[key]
+        return start
+
+    # Tools ----------------------------------------------------------------
+
+    def _on_tool_starting(self, block: PluginBlock) -> None:
+        call_id = block.fields.get("Function Call ID") or block.fields.get("Tool Name", "")
+        self._open_tools[call_id] = block.ts
+        _trim(self._open_tools)
+        opened = self._open_invocations.get(block.fields.get("Invocation ID", ""))
+        if opened is not None:
+            opened.tool_calls += 1
+
+    def _on_tool_completed(self, block: PluginBlock, error: bool = False) -> None:
+        call_id = block.fields.get("Function Call ID") or block.fields.get("Tool Name", "")
+        start = self._open_tools.pop(call_id, None)
+        stats = self.tools.setdefault(block.fields.get("Tool Name", "unknown"), CallStats())
+        stats.add(_elapsed(start, block.ts))
+        if error:
+            stats.errors += 1
+
+    def _on_tool_error(self, block: PluginBlock) -> None:
+        self._on_tool_completed(block, error=True)
+
+
+def _trim(entries: OrderedDict) -> None:
+    while len(entries) > _MAX_OPEN_ENTRIES:
+        entries.popitem(last=False)
+
+
+def _iter_files(paths: Iterable[str]) -> Iterator[str]:
+    for path in paths:
+        if path == "-":
+            yield from sys.stdin
+            continue
+        with open(path, encoding="utf-8", errors="replace") as stream:
+            yield from stream
+
+
+def analyze(paths: Iterable[str], top: int = 10) -> LogAnalyzer:
+    """Stream ``paths`` (oldest first) through the analyzer."""
+    return LogAnalyzer(top=top).consume(iter_plugin_blocks(iter_messages(_iter_files(paths))))
+
+
+def _print_table(title: str, rows: Dict[str, CallStats], out: TextIO) -> None:
+    print(f"\n{title}", file=out)
+    print(f"  {'name':<36}{'calls':>8}{'errors':>8}{'mean s':>10}{'max s':>10}{'total s':>10}", file=out)
+    for name, stats in sorted(rows.items(), key=lambda item: item[1].total_s, reverse=True):
+        print(
+            f"  {name:<36}{stats.count:>8}{stats.errors:>8}{stats.mean_s:>10.3f}"
+            f"{stats.max_s:>10.3f}{stats.total_s:>10.3f}",
+            file=out,
+        )
+
+
+def print_report(analyzer: LogAnalyzer, out: TextIO = sys.stdout) -> None:
+    """Render the aggregated statistics as plain-text tables."""
+    invocations = analyzer.invocations
+    print(
+        f"Invocations: {invocations.count} (mean {invocations.mean_s:.3f}s, "
+        f"max {invocations.max_s:.3f}s)",
+        file=out,
+    )
+    print(f"Tokens: input={analyzer.input_tokens} output={analyzer.output_tokens}", file=out)
+    _print_table("Agents", analyzer.agents, out)
+    _print_table("LLM calls by agent", analyzer.llm_calls, out)
+    _print_table("Tools", analyzer.tools, out)
+
+    slowest = analyzer.slowest_invocations()
+    if slowest:
+        print(f"\nSlowest {len(slowest)} invocations", file=out)
+        for summary in slowest:
+            print(
+                f"  {summary.duration_s:>8.3f}s  {summary.invocation_id}  {summary.agent}"
+                f"  llm={summary.llm_calls} tools={summary.tool_calls}",
+                file=out,
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[LOG_FILE_NAME],
+        help="Log files in chronological order ('-' reads stdin)",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest invocations to list")
+    args = parser.parse_args(argv)
+    print_report(analyze(args.paths, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,128 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
 import os
-from typing import Iterable
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Iterable, Optional, Sequence
 
-from .config import LOG_FILE_NAME, LOG_FILES, LOG_FORMAT
+from .config import (
+    LOG_BACKUP_COUNT,
+    LOG_FILE_NAME,
+    LOG_FILES,
+    LOG_FORMAT,
+    LOG_JSON_LINES,
+    LOG_MAX_BATCH,
+    LOG_MAX_BYTES,
+)
+
+_listener: Optional[QueueListener] = None
+_atexit_registered = False
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Render each record as a single JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """Enqueue records with their args merged, leaving formatting to the listener.
+
+    The stock ``QueueHandler.prepare`` formats every record on the caller's
+    thread, which is exactly the work we want off the event loop. Like the
+    stock version it enqueues a copy, so other handlers still see the
+    caller's record unchanged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Size-rotated file handler that writes a batch of records per syscall."""
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        try:
+            text = "".join(self.format(record) + self.terminator for record in records)
+            with self.lock:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.maxBytes > 0 and self.stream.tell() + len(text) >= self.maxBytes:
+                    self.doRollover()
+                self.stream.write(text)
+                self.flush()
+        except Exception:
+            self.handleError(records[-1])
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that drains everything queued and hands it over in one batch.
+
+    ``start``/``stop`` run the batching loop on a thread owned by this class,
+    so it does not depend on ``QueueListener``'s private worker, whose
+    internals differ between Python versions.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue,
+        handler: BufferedRotatingFileHandler,
+        max_batch: int = LOG_MAX_BATCH,
+    ) -> None:
+        super().__init__(log_queue, handler)
+        self._handler = handler
+        self._max_batch = max_batch
+        self._batch_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._batch_thread is not None:
+            raise RuntimeError("Listener already started")
+        self._batch_thread = threading.Thread(
+            target=self._drain, name="log-batch-writer", daemon=True
+        )
+        self._batch_thread.start()
+
+    def stop(self) -> None:
+        """Flush everything queued so far, then stop the writer thread."""
+        if self._batch_thread is None:
+            return
+        self.queue.put_nowait(None)  # stop marker; records are never None
+        self._batch_thread.join()
+        self._batch_thread = None
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not None]
+            if records:
+                self._handler.emit_batch(records)
+            if len(records) != len(batch):
+                return
 
 
 def _cleanup_logs(log_files: Iterable[str]) -> None:
@@ -20,15 +137,80 @@ def _cleanup_logs(log_files: Iterable[str]) -> None:
             print(f"⚠️  Could not delete {log_file}: {exc}")
 
 
-def configure_logging(clear_logs: bool = True) -> None:
-    """Configure structured logging for the demo."""
+def _rotated_log_files() -> list[str]:
+    return [f"{LOG_FILE_NAME}.{index}" for index in range(1, LOG_BACKUP_COUNT + 1)]
+
+
+def _resolve_json_lines(json_lines: Optional[bool]) -> bool:
+    if json_lines is not None:
+        return json_lines
+    env_format = os.environ.get("AGENT_LOG_FORMAT")
+    if env_format:
+        return env_format.strip().lower() == "json"
+    return LOG_JSON_LINES
+
+
+def stop_logging() -> None:
+    """Drain queued records and close the background file handler."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def configure_logging(
+    clear_logs: bool = True,
+    *,
+    non_blocking: bool = True,
+    json_lines: Optional[bool] = None,
+) -> None:
+    """Configure structured logging for the demo.
+
+    With ``non_blocking`` (the default) the root logger only enqueues records;
+    a listener thread formats them in batches and writes to a size-rotated
+    ``logger.log``, so DEBUG-heavy plugins never block the event loop on disk
+    writes. ``json_lines`` switches the file format to one JSON object per line
+    (defaults to ``AGENT_LOG_FORMAT=json``).
+    """
+    global _atexit_registered, _listener
+
+    stop_logging()
     if clear_logs:
-        _cleanup_logs(LOG_FILES)
+        _cleanup_logs((*LOG_FILES, *_rotated_log_files()))
+
+    formatter: logging.Formatter
+    if _resolve_json_lines(json_lines):
+        formatter = JsonLinesFormatter()
+    else:
+        formatter = logging.Formatter(LOG_FORMAT)
+
+    if not non_blocking:
+        file_handler = logging.FileHandler(LOG_FILE_NAME, encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        logging.basicConfig(level=logging.DEBUG, handlers=[file_handler], force=True)
+        print("✅ Logging configured")
+        return
+
+    file_handler = BufferedRotatingFileHandler(
+        LOG_FILE_NAME,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(formatter)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = BatchingQueueListener(log_queue, file_handler)
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(stop_logging)
+        _atexit_registered = True
 
     logging.basicConfig(
-        filename=LOG_FILE_NAME,
         level=logging.DEBUG,
-        format=LOG_FORMAT,
+        handlers=[DeferredFormatQueueHandler(log_queue)],
         force=True,
     )
-    print("✅ Logging configured")
+    print("✅ Logging configured (non-blocking)")
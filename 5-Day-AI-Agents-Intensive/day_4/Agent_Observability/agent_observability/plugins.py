@@ -3,16 +3,40 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import io
 import logging
-from typing import Optional, Set
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Optional
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
 from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.plugins.logging_plugin import LoggingPlugin
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
 from google.adk.utils._debug_output import print_event
 from google.genai import types
 
+from .config import TRACE_MAX_SESSIONS, TRACE_SAMPLE_RATE
+
+TraceSink = Callable[[str], None]
+
+
+def logger_sink(
+    logger_name: str = "conversation_trace", level: int = logging.INFO
+) -> TraceSink:
+    """Return a sink that routes transcript lines through ``logging``."""
+    logger = logging.getLogger(logger_name)
+
+    def _sink(text: str) -> None:
+        logger.log(level, "%s", text)
+
+    return _sink
+
 
 class CountInvocationPlugin(BasePlugin):
     """Counts agent and tool invocations for quick instrumentation."""
@@ -40,13 +64,124 @@ class CountInvocationPlugin(BasePlugin):
         logging.info("[Plugin] LLM request count: %s", current_count)
 
 
+class FileLoggingPlugin(LoggingPlugin):
+    """LoggingPlugin that also records its lines in ``logger.log``.
+
+    The stock plugin only prints to the terminal; routing the same lines
+    through ``logging`` (timestamped by LOG_FORMAT) lets ``log_analyzer``
+    reconstruct invocations afterwards. ``echo=False`` keeps the terminal quiet.
+
+    The stock LLM and TOOL blocks carry no invocation id, so this plugin adds
+    an ``Invocation ID`` line under their header; ``log_analyzer`` matches on
+    it, which keeps concurrent invocations of the same agent apart.
+    """
+
+    def __init__(self, *, echo: bool = True) -> None:
+        super().__init__()
+        self._echo = echo
+        self._logger = logging.getLogger("google_adk.logging_plugin")
+        # Set right before a stock callback runs; its _log calls have no await
+        # between them, so no other block can interleave.
+        self._block_invocation_id: Optional[str] = None
+
+    def _log(self, message: str) -> None:
+        self._write(message)
+        invocation_id = self._block_invocation_id
+        if invocation_id is not None and not message.startswith(" "):
+            self._block_invocation_id = None
+            self._write(f"   Invocation ID: {invocation_id}")
+
+    def _write(self, message: str) -> None:
+        if self._echo:
+            super()._log(message)
+        self._logger.info("[%s] %s", self.name, message)
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        self._block_invocation_id = callback_context.invocation_id
+        return await super().before_model_callback(
+            callback_context=callback_context, llm_request=llm_request
+        )
+
+    async def after_model_callback(
+        self, *, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        self._block_invocation_id = callback_context.invocation_id
+        return await super().after_model_callback(
+            callback_context=callback_context, llm_response=llm_response
+        )
+
+    async def on_model_error_callback(
+        self,
+        *,
+        callback_context: CallbackContext,
+        llm_request: LlmRequest,
+        error: Exception,
+    ) -> Optional[LlmResponse]:
+        self._block_invocation_id = callback_context.invocation_id
+        return await super().on_model_error_callback(
+            callback_context=callback_context, llm_request=llm_request, error=error
+        )
+
+    async def before_tool_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext
+    ) -> Optional[dict]:
+        self._block_invocation_id = tool_context.invocation_id
+        return await super().before_tool_callback(
+            tool=tool, tool_args=tool_args, tool_context=tool_context
+        )
+
+    async def after_tool_callback(
+        self,
+        *,
+        tool: BaseTool,
+        tool_args: dict[str, Any],
+        tool_context: ToolContext,
+        result: dict,
+    ) -> Optional[dict]:
+        self._block_invocation_id = tool_context.invocation_id
+        return await super().after_tool_callback(
+            tool=tool, tool_args=tool_args, tool_context=tool_context, result=result
+        )
+
+    async def on_tool_error_callback(
+        self,
+        *,
+        tool: BaseTool,
+        tool_args: dict[str, Any],
+        tool_context: ToolContext,
+        error: Exception,
+    ) -> Optional[dict]:
+        self._block_invocation_id = tool_context.invocation_id
+        return await super().on_tool_error_callback(
+            tool=tool, tool_args=tool_args, tool_context=tool_context, error=error
+        )
+
+
 class ConversationTracePlugin(BasePlugin):
-    """Prints concise transcripts so ADK Web logs match run_debug output."""
+    """Prints concise transcripts so ADK Web logs match run_debug output.
+
+    Only 1-in-``sample_rate`` sessions are traced (chosen by a stable hash of
+    the session id), but error events are always emitted. Sessions already
+    announced are remembered in an LRU capped at ``max_tracked_sessions``, and
+    output goes to ``sink`` (stdout when omitted).
+    """
 
-    def __init__(self, *, root_agent_name: str) -> None:
+    def __init__(
+        self,
+        *,
+        root_agent_name: str,
+        sample_rate: int = TRACE_SAMPLE_RATE,
+        max_tracked_sessions: int = TRACE_MAX_SESSIONS,
+        sink: Optional[TraceSink] = None,
+    ) -> None:
         super().__init__(name="conversation_trace")
         self._root_agent_name = root_agent_name
-        self._seen_sessions: Set[str] = set()
+        self._sample_rate = max(1, sample_rate)
+        self._max_tracked_sessions = max(1, max_tracked_sessions)
+        self._sink = sink
+        self._seen_sessions: OrderedDict[str, None] = OrderedDict()
         self._lock = asyncio.Lock()
 
     async def on_user_message_callback(
@@ -62,20 +197,25 @@ class ConversationTracePlugin(BasePlugin):
         ):
             return None
 
+        session_id = invocation_context.session.id
+        if not self._is_sampled(session_id):
+            return None
+
         async with self._lock:
-            session_id = invocation_context.session.id
             first_visit = session_id not in self._seen_sessions
-            if first_visit:
-                self._seen_sessions.add(session_id)
+            self._seen_sessions[session_id] = None
+            self._seen_sessions.move_to_end(session_id)
+            while len(self._seen_sessions) > self._max_tracked_sessions:
+                self._seen_sessions.popitem(last=False)
 
         if first_visit:
-            print(f"\n ### Created new session: {session_id}")
+            self._emit(f"\n ### Created new session: {session_id}")
         else:
-            print(f"\n ### Continue session: {session_id}")
+            self._emit(f"\n ### Continue session: {session_id}")
 
         rendered_message = self._render_user_message(user_message)
         if rendered_message:
-            print(f"\nUser > {rendered_message}")
+            self._emit(f"\nUser > {rendered_message}")
 
         return None
 
@@ -89,9 +229,34 @@ class ConversationTracePlugin(BasePlugin):
         ):
             return None
 
-        print_event(event)
+        is_error = bool(event.error_code or event.error_message)
+        if not is_error and not self._is_sampled(invocation_context.session.id):
+            return None
+
+        if self._sink is None:
+            print_event(event)
+            return None
+
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            print_event(event)
+        rendered = buffer.getvalue().rstrip("\n")
+        if rendered:
+            self._sink(rendered)
         return None
 
+    def _is_sampled(self, session_id: str) -> bool:
+        """Stable 1-in-N decision so every event of a session shares it."""
+        if self._sample_rate == 1:
+            return True
+        return zlib.crc32(session_id.encode("utf-8")) % self._sample_rate == 0
+
+    def _emit(self, text: str) -> None:
+        if self._sink is None:
+            print(text)
+        else:
+            self._sink(text)
+
     def _render_user_message(self, content: Optional[types.Content]) -> str:
         """Flatten user content into a simple string."""
         if not content or not content.parts:
@@ -2,24 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Optional
 
 from google.adk.runners import InMemoryRunner
-from google.adk.plugins.logging_plugin import LoggingPlugin
 
 from .agents import create_google_search_agent, create_research_agent
-from .config import DEFAULT_QUERY
-from .plugins import ConversationTracePlugin, CountInvocationPlugin
-
-
-def build_runner(extra_plugins: Iterable = ()) -> InMemoryRunner:
+from .config import DEFAULT_QUERY, TRACE_SAMPLE_RATE
+from .plugins import (
+    ConversationTracePlugin,
+    CountInvocationPlugin,
+    FileLoggingPlugin,
+    TraceSink,
+)
+
+
+def build_runner(
+    extra_plugins: Iterable = (),
+    *,
+    trace_sample_rate: int = TRACE_SAMPLE_RATE,
+    trace_sink: Optional[TraceSink] = None,
+    echo_plugin_logs: bool = True,
+) -> InMemoryRunner:
     """Build an InMemoryRunner with the default agents and plugins."""
     search_agent = create_google_search_agent()
     research_agent = create_research_agent(search_agent)
 
     plugins = [
-        ConversationTracePlugin(root_agent_name=research_agent.name),
-        LoggingPlugin(),
+        ConversationTracePlugin(
+            root_agent_name=research_agent.name,
+            sample_rate=trace_sample_rate,
+            sink=trace_sink,
+        ),
+        FileLoggingPlugin(echo=echo_plugin_logs),
         CountInvocationPlugin(),
         *extra_plugins,
     ]
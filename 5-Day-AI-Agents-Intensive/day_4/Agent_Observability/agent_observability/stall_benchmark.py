@@ -0,0 +1,151 @@
+"""Measure event-loop stalls caused by DEBUG logging under concurrent runs.
+
+Each simulated run emits the kind of DEBUG traffic ADK produces per invocation
+(LLM request dumps, plugin lines) while a monitor task records how late its
+timer wakes up. Comparing the blocking ``FileHandler`` setup with the
+queue-based one shows how much synchronous disk I/O the event loop absorbs.
+``--write-latency-ms`` adds a fixed delay to every ``write`` call to emulate
+slower storage (network volumes, throttled writeback).
+
+Usage (from the repository root)::
+
+    python -m day_4.Agent_Observability.agent_observability.stall_benchmark \\
+        --runs 50 --lines 400 --write-latency-ms 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from dataclasses import dataclass
+from typing import IO, List
+
+from . import logging_utils
+from .logging_utils import configure_logging, stop_logging
+
+_LOGGER = logging.getLogger("google_adk.stall_benchmark")
+
+
+@dataclass(slots=True)
+class StallReport:
+    mode: str
+    lines: int
+    elapsed_s: float
+    max_stall_ms: float
+    p99_stall_ms: float
+    total_stall_ms: float
+
+
+class _SlowStream:
+    """File proxy that sleeps before each write to emulate storage latency."""
+
+    def __init__(self, stream: IO[str], latency: float) -> None:
+        self._stream = stream
+        self._latency = latency
+
+    def write(self, text: str) -> int:
+        time.sleep(self._latency)
+        return self._stream.write(text)
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+def _slow_down_file_handlers(latency: float) -> None:
+    handlers = list(logging.getLogger().handlers)
+    if logging_utils._listener is not None:
+        handlers.extend(logging_utils._listener.handlers)
+    for handler in handlers:
+        if isinstance(handler, logging.FileHandler) and handler.stream is not None:
+            handler.stream = _SlowStream(handler.stream, latency)
+
+
+async def _monitor(interval: float, stop: asyncio.Event, lags: List[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def _simulated_run(run_id: int, lines: int, payload: str) -> None:
+    for index in range(lines):
+        _LOGGER.debug("run=%s step=%s request=%s", run_id, index, payload)
+        if index % 20 == 0:
+            await asyncio.sleep(0)
+
+
+async def _burst(runs: int, lines: int, payload_bytes: int, interval: float) -> tuple[float, List[float]]:
+    payload = "x" * payload_bytes
+    stop = asyncio.Event()
+    lags: List[float] = []
+    monitor = asyncio.create_task(_monitor(interval, stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(_simulated_run(run, lines, payload) for run in range(runs)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+    return elapsed, lags
+
+
+def measure_stall(
+    *,
+    non_blocking: bool,
+    runs: int = 50,
+    lines: int = 400,
+    payload_bytes: int = 2048,
+    interval: float = 0.001,
+    write_latency_ms: float = 0.0,
+) -> StallReport:
+    """Run one burst with the given logging mode and summarise monitor lag."""
+    configure_logging(clear_logs=True, non_blocking=non_blocking)
+    if write_latency_ms > 0:
+        _slow_down_file_handlers(write_latency_ms / 1000)
+    try:
+        elapsed, lags = asyncio.run(_burst(runs, lines, payload_bytes, interval))
+    finally:
+        stop_logging()
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99_index = min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))
+    return StallReport(
+        mode="queue" if non_blocking else "blocking",
+        lines=runs * lines,
+        elapsed_s=elapsed,
+        max_stall_ms=lags_ms[-1],
+        p99_stall_ms=lags_ms[p99_index],
+        total_stall_ms=statistics.fsum(lags_ms),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50, help="Concurrent runs per burst")
+    parser.add_argument("--lines", type=int, default=400, help="DEBUG lines per run")
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    parser.add_argument("--write-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    reports = [
+        measure_stall(
+            non_blocking=non_blocking,
+            runs=args.runs,
+            lines=args.lines,
+            payload_bytes=args.payload_bytes,
+            write_latency_ms=args.write_latency_ms,
+        )
+        for non_blocking in (False, True)
+    ]
+    print(f"\n{'mode':<10}{'lines':>10}{'elapsed s':>12}{'max ms':>10}{'p99 ms':>10}{'total ms':>12}")
+    for report in reports:
+        print(
+            f"{report.mode:<10}{report.lines:>10}{report.elapsed_s:>12.3f}"
+            f"{report.max_stall_ms:>10.2f}{report.p99_stall_ms:>10.2f}{report.total_stall_ms:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
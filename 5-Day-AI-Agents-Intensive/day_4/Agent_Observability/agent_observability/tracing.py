@@ -0,0 +1,140 @@
+"""OpenTelemetry span export for the observability demo.
+
+ADK already emits an ``invocation → invoke_agent → call_llm / execute_tool``
+span tree through the global tracer provider, with ``AgentTool`` sub-runs
+nested under their ``execute_tool`` span; this module only installs that
+provider and its exporters.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Dict, Optional, Sequence
+
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+    SpanExportResult,
+)
+
+from .config import (
+    TRACE_EXPORTER,
+    TRACE_FILE_NAME,
+    TRACE_MAX_EXPORT_BATCH_SIZE,
+    TRACE_SCHEDULE_DELAY_MILLIS,
+    TRACE_SERVICE_NAME,
+)
+
+logger = logging.getLogger(__name__)
+
+_provider_lock = threading.Lock()
+_genai_instrumented = False
+# Exporters already attached to the global provider, so re-running
+# configure_tracing() (notebook cells, tests) does not export spans twice.
+_configured_exporters: Dict[str, TracerProvider] = {}
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Append finished spans to a local file, one JSON document per line.
+
+    Stands in for an OTLP collector: the file can be replayed into a real
+    backend later, and batches are written from the BatchSpanProcessor worker
+    thread so the event loop never blocks on disk I/O.
+    """
+
+    def __init__(self, file_name: str = TRACE_FILE_NAME) -> None:
+        self._file_name = file_name
+        self._lock = threading.Lock()
+        self._stream = open(file_name, "a", encoding="utf-8")
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = "".join(span.to_json(indent=None) + "\n" for span in spans)
+        with self._lock:
+            if self._stream.closed:
+                return SpanExportResult.FAILURE
+            self._stream.write(lines)
+            self._stream.flush()
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if not self._stream.closed:
+                self._stream.close()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        with self._lock:
+            if not self._stream.closed:
+                self._stream.flush()
+        return True
+
+
+def _build_exporter(exporter: str) -> Optional[SpanExporter]:
+    if exporter == "file":
+        return JsonLinesSpanExporter(TRACE_FILE_NAME)
+    if exporter == "console":
+        return ConsoleSpanExporter()
+    if exporter == "none":
+        return None
+    raise ValueError(
+        f"Unknown trace exporter {exporter!r}; expected 'file', 'console' or 'none'"
+    )
+
+
+def _instrument_genai() -> None:
+    """Add google-genai client spans underneath ADK's ``call_llm`` spans."""
+    global _genai_instrumented
+    if _genai_instrumented:
+        return
+    try:
+        from opentelemetry.instrumentation.google_genai import (
+            GoogleGenAiSdkInstrumentor,
+        )
+    except ImportError:
+        logger.info("opentelemetry-instrumentation-google-genai not installed")
+        return
+    GoogleGenAiSdkInstrumentor().instrument()
+    _genai_instrumented = True
+
+
+def configure_tracing(exporter: Optional[str] = None) -> Optional[TracerProvider]:
+    """Install a batching span exporter on the global tracer provider.
+
+    ``exporter`` defaults to the ``AGENT_TRACE_EXPORTER`` environment variable
+    and accepts ``file`` (JSON lines in ``traces.jsonl``), ``console`` or
+    ``none``. Spans are flushed by the SDK's exit hook. Calling it again with
+    an exporter that is already installed returns the same provider.
+    """
+    resolved = (exporter or os.environ.get("AGENT_TRACE_EXPORTER") or TRACE_EXPORTER).strip().lower()
+    with _provider_lock:
+        provider = _configured_exporters.get(resolved)
+        if provider is not None:
+            return provider
+        span_exporter = _build_exporter(resolved)
+        if span_exporter is None:
+            print("⚪ Tracing disabled")
+            return None
+
+        provider = trace.get_tracer_provider()
+        if not isinstance(provider, TracerProvider):
+            provider = TracerProvider(
+                resource=Resource.create({"service.name": TRACE_SERVICE_NAME})
+            )
+            trace.set_tracer_provider(provider)
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                span_exporter,
+                schedule_delay_millis=TRACE_SCHEDULE_DELAY_MILLIS,
+                max_export_batch_size=TRACE_MAX_EXPORT_BATCH_SIZE,
+            )
+        )
+        _configured_exporters[resolved] = provider
+        _instrument_genai()
+
+    print(f"✅ Tracing configured ({resolved})")
+    return provider
@@ -9,51 +9,95 @@ import os
 import subprocess
 import sys
 import time
-import uuid
 import warnings
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
-# When executed directly (python day_5/Agent2Agent_Communication/agent.py),
-# ensure the repository root is on sys.path so package imports succeed.
-if __package__ is None or __package__ == "":
-    if str(REPO_ROOT) not in sys.path:
-        sys.path.append(str(REPO_ROOT))
+# When executed directly (python day_5/Agent2Agent_Communication/agent.py), or
+# loaded by adk web with only day_5 on sys.path, ensure the repository root is
+# on sys.path so the day_5.* and intensive_shared imports succeed.
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
 
-import requests  # noqa: E402
 from google.adk.agents import LlmAgent  # noqa: E402
-from google.adk.agents.remote_a2a_agent import (  # noqa: E402
-    AGENT_CARD_WELL_KNOWN_PATH,
-    RemoteA2aAgent,
-)
+from google.adk.agents.remote_a2a_agent import RemoteA2aAgent  # noqa: E402
 from google.adk.models.google_llm import Gemini  # noqa: E402
-from google.adk.runners import Runner  # noqa: E402
-from google.adk.sessions import InMemorySessionService  # noqa: E402
-from google.genai import types  # noqa: E402
+from google.adk.tools.agent_tool import AgentTool  # noqa: E402
+from intensive_shared.lazy_agent import LazyAgentRegistry  # noqa: E402
 
 if __package__:
     from .config import (  # type: ignore[attr-defined]
         A2A_LABELS,
         A2A_PORTS,
         A2A_REMOTE_NAMES,
-        A2A_SERVER_MODULES,
+        A2A_TRANSPORT,
         MODEL_NAME,
+        ORCHESTRATION_MODE,
         RETRY_CONFIG,
     )
+    from .http_client import (
+        agent_card_url,
+        agent_cards,
+        fast_path_enabled,
+        fast_path_url,
+        get_a2a_client_factory,
+    )
+    from .launcher import launch_servers, print_launch_report, shutdown_servers
+    from .resilience import ResilientRemoteA2aAgent, print_resilience_stats
+    from .response_cache import cache_ttl, print_response_cache_stats
+    from .scenario_runner import (
+        build_scenario_runner,
+        print_scenario_result,
+        print_scenario_timings,
+        run_scenario,
+        run_scenarios,
+    )
+    from .warmup import ServerWarmup, server_warmup_enabled
 else:  # Fallback when running the script directly (python path/to/agent.py)
     from day_5.Agent2Agent_Communication.config import (  # noqa: E402
         A2A_LABELS,
         A2A_PORTS,
         A2A_REMOTE_NAMES,
-        A2A_SERVER_MODULES,
+        A2A_TRANSPORT,
         MODEL_NAME,
+        ORCHESTRATION_MODE,
         RETRY_CONFIG,
     )
+    from day_5.Agent2Agent_Communication.http_client import (  # noqa: E402
+        agent_card_url,
+        agent_cards,
+        fast_path_enabled,
+        fast_path_url,
+        get_a2a_client_factory,
+    )
+    from day_5.Agent2Agent_Communication.launcher import (  # noqa: E402
+        launch_servers,
+        print_launch_report,
+        shutdown_servers,
+    )
+    from day_5.Agent2Agent_Communication.resilience import (  # noqa: E402
+        ResilientRemoteA2aAgent,
+        print_resilience_stats,
+    )
+    from day_5.Agent2Agent_Communication.response_cache import (  # noqa: E402
+        cache_ttl,
+        print_response_cache_stats,
+    )
+    from day_5.Agent2Agent_Communication.scenario_runner import (  # noqa: E402
+        build_scenario_runner,
+        print_scenario_result,
+        print_scenario_timings,
+        run_scenario,
+        run_scenarios,
+    )
+    from day_5.Agent2Agent_Communication.warmup import (  # noqa: E402
+        ServerWarmup,
+        server_warmup_enabled,
+    )
 
 warnings.filterwarnings("default")
-print("✅ ADK components imported successfully.")
 
 WAIT_FOR_AGENT_CARD = os.environ.get("A2A_WAIT_FOR_AGENT_CARD", "1").strip().lower() not in {
     "0",
@@ -76,138 +120,142 @@ REMOTE_DESCRIPTIONS: Dict[str, str] = {
 }
 
 
-def wait_for_server(port: int, agent_label: str, retries: int = 30) -> bool:
-    """Poll until an A2A server responds."""
-    if not WAIT_FOR_AGENT_CARD:
-        return True
-    url = f"http://localhost:{port}{AGENT_CARD_WELL_KNOWN_PATH}"
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, timeout=1)
-            if response.status_code == 200:
-                print(f"\n✅ {agent_label} server is running at http://localhost:{port}")
-                return True
-        except requests.exceptions.RequestException:
-            time.sleep(5)
-            print(".", end="", flush=True)
-    print(f"\n⚠️  {agent_label} server may not be ready yet. Check manually if needed.")
-    return False
-
-
-def log_agent_card(port: int, agent_label: str) -> None:
-    """Fetch and display the agent card for visibility."""
+def print_agent_card(agent_label: str, agent_card: Dict[str, Any]) -> None:
+    """Display an agent card for visibility."""
+    print(f"\n📋 {agent_label} Agent Card:")
+    print(json.dumps(agent_card, indent=2))
+    print("\n✨ Key Information:")
+    print(f"   Name: {agent_card.get('name')}")
+    print(f"   Description: {agent_card.get('description')}")
+    print(f"   URL: {agent_card.get('url')}")
+    print(f"   Skills: {len(agent_card.get('skills', []))} capabilities exposed")
+
+
+def log_agent_card(agent_key: str) -> None:
+    """Display the (cached) agent card for visibility."""
+    agent_label = A2A_LABELS[agent_key]
     if not WAIT_FOR_AGENT_CARD:
         print(f"⚠️  Skipping agent card fetch for {agent_label} (A2A_WAIT_FOR_AGENT_CARD=0).")
         return
-    try:
-        response = requests.get(
-            f"http://localhost:{port}{AGENT_CARD_WELL_KNOWN_PATH}", timeout=5
-        )
-        if response.status_code == 200:
-            agent_card = response.json()
-            print(f"\n📋 {agent_label} Agent Card:")
-            print(json.dumps(agent_card, indent=2))
-            print("\n✨ Key Information:")
-            print(f"   Name: {agent_card.get('name')}")
-            print(f"   Description: {agent_card.get('description')}")
-            print(f"   URL: {agent_card.get('url')}")
-            print(f"   Skills: {len(agent_card.get('skills', []))} capabilities exposed")
-        else:
-            print(f"❌ Failed to fetch agent card for {agent_label}: {response.status_code}")
-    except requests.exceptions.RequestException as exc:
-        print(f"❌ Error fetching agent card for {agent_label}: {exc}")
+    agent_card = agent_cards.get(agent_key)
+    if agent_card is None:
+        print(f"❌ Failed to fetch agent card for {agent_label} at port {A2A_PORTS[agent_key]}")
+        return
+    print_agent_card(agent_label, agent_card)
 
 
 def start_a2a_server(agent_key: str) -> subprocess.Popen:
     """Start uvicorn for a given agent and wait for readiness."""
-    module_path = A2A_SERVER_MODULES[agent_key]
-    port = A2A_PORTS[agent_key]
-    label = A2A_LABELS[agent_key]
-
-    try:
-        process = subprocess.Popen(
-            [
-                "uvicorn",
-                f"{module_path}:app",
-                "--host",
-                "localhost",
-                "--port",
-                str(port),
-            ],
-            cwd=str(REPO_ROOT),
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            env={**os.environ},
-        )
-    except (FileNotFoundError, OSError) as exc:
-        print(f"❌ Failed to start {label} server: {exc}")
-        raise
-
-    print(f"🚀 Starting {label} server on port {port}...")
-    wait_for_server(port, label)
-    log_agent_card(port, label)
-    return process
-
+    return ensure_servers_running([agent_key], force_start=True)[0]
 
 
 def server_is_available(agent_key: str) -> bool:
-    """Return True if the remote agent card resolves successfully."""
-    try:
-        response = requests.get(
-            f"http://localhost:{A2A_PORTS[agent_key]}{AGENT_CARD_WELL_KNOWN_PATH}", timeout=2
-        )
-        return response.status_code == 200
-    except requests.exceptions.RequestException:
-        return False
-
-
-def ensure_servers_running(force_start: bool = False) -> List[subprocess.Popen]:
-    """Start any missing servers (or all if force_start)."""
-    started: List[subprocess.Popen] = []
-    target_keys = AGENT_KEYS if force_start else [k for k in AGENT_KEYS if not server_is_available(k)]
-    for agent_key in target_keys:
-        started.append(start_a2a_server(agent_key))
-    return started
-
-
-def shutdown_servers(processes: Iterable[subprocess.Popen]) -> None:
-    """Terminate uvicorn processes gracefully."""
-    for process in processes:
-        if process and process.poll() is None:
-            process.terminate()
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
-
-
-def build_remote_agents(require_running: bool = True) -> Dict[str, RemoteA2aAgent]:
-    """Create RemoteA2aAgent proxies for each specialized service."""
+    """Return True if the remote agent card resolves (cached for a short TTL)."""
+    return agent_cards.get(agent_key) is not None
+
+
+def ensure_servers_running(
+    agent_keys: Iterable[str] = AGENT_KEYS, force_start: bool = False
+) -> List[subprocess.Popen]:
+    """Start any missing servers (or all if force_start) concurrently.
+
+    Every process is spawned at once and the agent cards are probed in
+    parallel with exponential backoff (see ``launcher.py``), so startup takes
+    about as long as the slowest server.
+    """
+    report = launch_servers(agent_keys, force_start=force_start, wait=WAIT_FOR_AGENT_CARD)
+    for agent_key, agent_card in report.cards.items():
+        agent_cards.put(agent_key, agent_card)
+    if report.processes:
+        for agent_key in report.processes:
+            if agent_key in report.cards:
+                print_agent_card(A2A_LABELS[agent_key], report.cards[agent_key])
+        if WAIT_FOR_AGENT_CARD:
+            print_launch_report(report)
+    return list(report.processes.values())
+
+
+TRANSPORTS = ("http", "in_process")
+
+
+def resolve_transport(transport: str | None = None) -> str:
+    """Return the requested transport, falling back to A2A_TRANSPORT/config."""
+    resolved = (transport or os.environ.get("A2A_TRANSPORT") or A2A_TRANSPORT).strip().lower()
+    if resolved not in TRANSPORTS:
+        raise ValueError(f"Unknown A2A transport {resolved!r}; expected one of {', '.join(TRANSPORTS)}")
+    return resolved
+
+
+def build_remote_agents(
+    require_running: bool = True, transport: str | None = None
+) -> Dict[str, RemoteA2aAgent]:
+    """Create RemoteA2aAgent proxies for each specialized service.
+
+    Over ``http`` the proxies share one pooled HTTP client and receive the
+    cached ``AgentCard`` directly, so no card is fetched again when they are
+    first used. With ``in_process`` the specialists are built in this process
+    and each proxy's A2A client calls their request handler without a socket.
+    Either way, repeated self-contained requests are answered from the remote
+    response cache for each remote's ``A2A_RESPONSE_CACHE_TTL_S``. Over
+    ``http`` exact product / city / order-ID lookups are then tried on the
+    remote's fast path, and calls that reach a remote agent go through its
+    circuit breaker, hedging and deadline.
+    """
+    transport = resolve_transport(transport)
     remotes: Dict[str, RemoteA2aAgent] = {}
+    if transport == "in_process":
+        in_process_host = _load_in_process_host()
+        client_factory = in_process_host.client_factory()
+        for agent_key in AGENT_KEYS:
+            remotes[agent_key] = ResilientRemoteA2aAgent(
+                name=A2A_REMOTE_NAMES[agent_key],
+                description=REMOTE_DESCRIPTIONS[agent_key],
+                agent_card=in_process_host.get_agent_card(agent_key),
+                a2a_client_factory=client_factory,
+                cache_ttl_s=cache_ttl(agent_key),
+            )
+            print(f"✅ Remote {A2A_LABELS[agent_key]} proxy configured in-process")
+        return remotes
+
+    client_factory = get_a2a_client_factory()
+    use_fast_path = fast_path_enabled()
     for agent_key in AGENT_KEYS:
-        if require_running and not server_is_available(agent_key):
+        agent_card = agent_cards.get_agent_card(agent_key)
+        if require_running and agent_card is None:
             raise RuntimeError(
                 f"{A2A_LABELS[agent_key]} server is not reachable at "
                 f"http://localhost:{A2A_PORTS[agent_key]}. "
                 "Start the A2A servers (e.g., run `python day_5/Agent2Agent_Communication/agent.py` "
                 "or set A2A_AUTO_START_SERVERS=1) before requesting the root agent."
             )
-        remotes[agent_key] = RemoteA2aAgent(
+        remotes[agent_key] = ResilientRemoteA2aAgent(
             name=A2A_REMOTE_NAMES[agent_key],
             description=REMOTE_DESCRIPTIONS[agent_key],
-            agent_card=f"http://localhost:{A2A_PORTS[agent_key]}{AGENT_CARD_WELL_KNOWN_PATH}",
+            agent_card=agent_card or agent_card_url(agent_key),
+            a2a_client_factory=client_factory,
+            cache_ttl_s=cache_ttl(agent_key),
+            fast_path_url=fast_path_url(agent_key) if use_fast_path else None,
         )
         print(f"✅ Remote {A2A_LABELS[agent_key]} proxy configured at port {A2A_PORTS[agent_key]}")
     return remotes
 
 
-def create_customer_support_agent(remote_agents: Dict[str, RemoteA2aAgent]) -> LlmAgent:
-    """Assemble the orchestrator that coordinates remote specialists."""
-    agent = LlmAgent(
-        model=Gemini(model=MODEL_NAME, retry_options=RETRY_CONFIG),
-        name="customer_support_agent",
-        description="Customer support assistant coordinating product, inventory, and shipping requests.",
-        instruction="""
+def _load_in_process_host() -> Any:
+    """Import the in-process host on first use.
+
+    It pulls in the whole A2A server stack (request handler, task stores),
+    which is most of this module's own import time and unused over HTTP.
+    """
+    if __package__:
+        from .in_process import in_process_host
+    else:
+        from day_5.Agent2Agent_Communication.in_process import in_process_host
+    return in_process_host
+
+
+ORCHESTRATION_MODES = ("delegate", "fan_out")
+
+DELEGATE_INSTRUCTION = """
         You are a friendly and professional customer support agent.
 
         Always coordinate with specialized sub-agents:
@@ -216,47 +264,82 @@ def create_customer_support_agent(remote_agents: Dict[str, RemoteA2aAgent]) -> L
         3. Use shipping_agent for delivery ETAs or tracking events (provide city or order ID).
 
         Combine their insights into a single coherent response for the customer.
-        """,
-        sub_agents=list(remote_agents.values()),
+        """
+
+FAN_OUT_INSTRUCTION = """
+        You are a friendly and professional customer support agent.
+
+        Specialists are available as tools; pass each one a self-contained question:
+        1. product_catalog_agent for detailed specs, pricing, and comparisons.
+        2. inventory_agent to confirm real-time stock counts and restock timelines.
+        3. shipping_agent for delivery ETAs or tracking events (provide city or order ID).
+
+        Work out every specialist the customer's message needs up front and call all of them
+        in the same turn, so they are queried in parallel. Only make a follow-up call when an
+        answer depends on another specialist's result.
+
+        Combine their answers into a single coherent response for the customer.
+        """
+
+
+def resolve_orchestration_mode(mode: str | None = None) -> str:
+    """Return the requested mode, falling back to A2A_ORCHESTRATION_MODE/config."""
+    resolved = (mode or os.environ.get("A2A_ORCHESTRATION_MODE") or ORCHESTRATION_MODE).strip().lower()
+    if resolved not in ORCHESTRATION_MODES:
+        raise ValueError(
+            f"Unknown orchestration mode {resolved!r}; expected one of {', '.join(ORCHESTRATION_MODES)}"
+        )
+    return resolved
+
+
+def create_customer_support_agent(
+    remote_agents: Dict[str, RemoteA2aAgent], mode: str | None = None
+) -> LlmAgent:
+    """Assemble the orchestrator that coordinates remote specialists.
+
+    ``mode="fan_out"`` wraps each remote in an ``AgentTool`` so independent
+    questions go to all specialists at once; ``"delegate"`` keeps them as
+    sub-agents reached by transfer, one at a time.
+    """
+    mode = resolve_orchestration_mode(mode)
+    if mode == "fan_out":
+        wiring = {"tools": [AgentTool(agent=remote) for remote in remote_agents.values()]}
+        instruction = FAN_OUT_INSTRUCTION
+    else:
+        wiring = {"sub_agents": list(remote_agents.values())}
+        instruction = DELEGATE_INSTRUCTION
+    agent = LlmAgent(
+        model=Gemini(model=MODEL_NAME, retry_options=RETRY_CONFIG),
+        name="customer_support_agent",
+        description="Customer support assistant coordinating product, inventory, and shipping requests.",
+        instruction=instruction,
+        **wiring,
     )
     print("✅ Customer Support Agent created!")
     print("   Model:", MODEL_NAME)
-    print("   Sub-agents: 3 (Product Catalog, Inventory, Shipping via A2A)")
+    if mode == "fan_out":
+        print("   Tools: 3 (Product Catalog, Inventory, Shipping via A2A, queried in parallel)")
+    else:
+        print("   Sub-agents: 3 (Product Catalog, Inventory, Shipping via A2A)")
     return agent
 
 
 def initialize_agents() -> tuple[LlmAgent, List[subprocess.Popen]]:
-    """Start servers and return the orchestrator along with process handles."""
-    a2a_server_processes = ensure_servers_running(force_start=True)
+    """Start servers and return the orchestrator along with process handles.
+
+    No servers are started when ``A2A_TRANSPORT=in_process``.
+    """
+    a2a_server_processes: List[subprocess.Popen] = []
+    if resolve_transport() == "http":
+        a2a_server_processes = ensure_servers_running(force_start=True)
     remote_agents = build_remote_agents()
     return create_customer_support_agent(remote_agents), a2a_server_processes
 
 
 async def test_a2a_communication(user_query: str, customer_support_agent: LlmAgent) -> None:
     """Exercise the Customer Support Agent over a single query."""
-    session_service = InMemorySessionService()
-    app_name = "support_app"
-    user_id = "demo_user"
-    session_id = f"demo_session_{uuid.uuid4().hex[:8]}"
-
-    await session_service.create_session(app_name=app_name, user_id=user_id, session_id=session_id)
-    runner = Runner(agent=customer_support_agent, app_name=app_name, session_service=session_service)
-    test_content = types.Content(parts=[types.Part(text=user_query)])
-
-    print(f"\n👤 Customer: {user_query}")
-    print("\n🎧 Support Agent response:")
-    print("-" * 60)
-    async for event in runner.run_async(
-        user_id=user_id,
-        session_id=session_id,
-        new_message=test_content,
-    ):
-        if event.is_final_response() and event.content:
-            parts = getattr(event.content, "parts", None) or []
-            for part in parts:
-                if hasattr(part, "text"):
-                    print(part.text)
-    print("-" * 60)
+    runner = build_scenario_runner(customer_support_agent)
+    print_scenario_result(await run_scenario(runner, user_query))
 
 
 async def main() -> None:
@@ -264,8 +347,14 @@ async def main() -> None:
     customer_support_agent, a2a_server_processes = initialize_agents()
     try:
         print("🧪 Testing A2A Communication...\n")
-        for prompt in SCENARIO_PROMPTS:
-            await test_a2a_communication(prompt, customer_support_agent)
+        started = time.perf_counter()
+        results = await run_scenarios(customer_support_agent, SCENARIO_PROMPTS)
+        elapsed = time.perf_counter() - started
+        for result in results:
+            print_scenario_result(result)
+        print_scenario_timings(results, elapsed)
+        print_response_cache_stats()
+        print_resilience_stats()
     finally:
         shutdown_servers(a2a_server_processes)
         cleanup_root_agent()
@@ -283,8 +372,15 @@ def get_root_agent(auto_start: bool = True) -> LlmAgent:
     if _root_agent_instance is not None:
         return _root_agent_instance
 
+    # Let a background warmup finish booting the servers first, so the probe
+    # below finds them running instead of spawning them a second time.
+    report = _warmup.wait()
+    if report is not None:
+        for agent_key, agent_card in report.cards.items():
+            agent_cards.put(agent_key, agent_card)
+
     started_processes: List[subprocess.Popen] = []
-    if auto_start:
+    if auto_start and resolve_transport() == "http":
         started_processes = ensure_servers_running(force_start=False)
         _root_processes.extend(started_processes)
     _root_agent_instance = create_customer_support_agent(build_remote_agents(require_running=True))
@@ -292,12 +388,14 @@ def get_root_agent(auto_start: bool = True) -> LlmAgent:
 
 
 def cleanup_root_agent() -> None:
-    """Stop any servers started through get_root_agent()."""
+    """Stop any servers started through get_root_agent() or the background warmup."""
     global _root_agent_instance
     if _root_processes:
         shutdown_servers(_root_processes)
         _root_processes.clear()
+    _warmup.stop()
     _root_agent_instance = None
+    _agents.reset("root_agent")
 
 
 auto_start_default = os.environ.get("A2A_AUTO_START_SERVERS")
@@ -306,17 +404,43 @@ if auto_start_default is None:
 auto_start_enabled = auto_start_default.strip().lower() not in {"0", "false", "no"}
 
 
+def _register_cleanup() -> None:
+    global _cleanup_registered
+    if not _cleanup_registered:
+        atexit.register(cleanup_root_agent)
+        _cleanup_registered = True
+
+
 def _initialize_root_agent() -> LlmAgent:
-    global _root_agent_instance, _cleanup_registered
+    global _root_agent_instance
     if _root_agent_instance is None:
         _root_agent_instance = get_root_agent(auto_start=auto_start_enabled)
-        if not _cleanup_registered:
-            atexit.register(cleanup_root_agent)
-            _cleanup_registered = True
+        _register_cleanup()
     return _root_agent_instance
 
 
-root_agent = _initialize_root_agent()
+def _warmup_wanted() -> bool:
+    if __name__ == "__main__" or not auto_start_enabled or not server_warmup_enabled():
+        return False
+    try:
+        return resolve_transport() == "http"
+    except ValueError:
+        return False  # reported when root_agent is built, not at import
+
+
+# Start missing servers in the background now, so they are booting while the
+# ADK loader carries on; root_agent waits for them when it is first resolved.
+_warmup = ServerWarmup(AGENT_KEYS)
+if _warmup_wanted():
+    _warmup.start()
+    _register_cleanup()
+
+
+# root_agent is resolved on first attribute access (ADK loader, notebooks); the
+# import itself only starts the warmup thread above and prints nothing.
+_agents = LazyAgentRegistry()
+_agents.register("root_agent", _initialize_root_agent)
+__getattr__ = _agents.module_getattr(__name__)
 
 
 if __name__ == "__main__":
@@ -1,31 +1,63 @@
 """Product catalog agent responsible for pricing/spec lookups."""
 
+from typing import Optional
+
 from google.adk.agents import LlmAgent
 from google.adk.models.google_llm import Gemini
 
 from ..config import MODEL_NAME, RETRY_CONFIG
+from .products import get_product_store
+
+
+def find_product_info(product_name: str, *, fuzzy: bool = False) -> Optional[str]:
+    """Catalog answer for a product name or SKU (``fuzzy`` allows partial names), else None."""
+    product = get_product_store().find(product_name, fuzzy=fuzzy)
+    return f"Product: {product.summary}" if product is not None else None
 
 
 def get_product_info(product_name: str) -> str:
     """Return catalog details for a supported product."""
-    product_catalog = {
-        "iphone 15 pro": "iPhone 15 Pro, $999, Low Stock (8 units), 128GB, Titanium finish",
-        "samsung galaxy s24": "Samsung Galaxy S24, $799, In Stock (31 units), 256GB, Phantom Black",
-        "dell xps 15": 'Dell XPS 15, $1,299, In Stock (45 units), 15.6" display, 16GB RAM, 512GB SSD',
-        "macbook pro 14": 'MacBook Pro 14", $1,999, In Stock (22 units), M3 Pro chip, 18GB RAM, 512GB SSD',
-        "sony wh-1000xm5": "Sony WH-1000XM5 Headphones, $399, In Stock (67 units), Noise-canceling, 30hr battery",
-        "ipad air": 'iPad Air, $599, In Stock (28 units), 10.9" display, 64GB',
-        "lg ultrawide 34": 'LG UltraWide 34" Monitor, $499, Out of Stock, Expected: Next week',
-    }
-
-    product_lower = product_name.lower().strip()
-    if product_lower in product_catalog:
-        return f"Product: {product_catalog[product_lower]}"
-
-    available = ", ".join([p.title() for p in product_catalog.keys()])
+    answer = find_product_info(product_name, fuzzy=True)
+    if answer is not None:
+        return answer
+
+    store = get_product_store()
+    suggestions = store.suggestions(product_name)
+    if suggestions is not None:
+        return f"{product_name} matches several products. Did you mean: {suggestions}?"
+    available = store.available_titles()
     return f"Sorry, I don't have information for {product_name}. Available products: {available}"
 
 
+def get_products_info(product_names: list[str]) -> str:
+    """Return catalog details for several products in one call, one line each.
+
+    Use this instead of repeated get_product_info calls when comparing or
+    listing products, e.g. "Dell XPS 15 vs MacBook Pro 14".
+    """
+    if not product_names:
+        return "No product names given."
+    store = get_product_store()
+    lines = []
+    missing = []
+    for name in product_names:
+        answer = find_product_info(name, fuzzy=True)
+        if answer is not None:
+            lines.append(answer)
+            continue
+        suggestions = store.suggestions(name)
+        if suggestions is not None:
+            lines.append(f"{name} matches several products. Did you mean: {suggestions}?")
+        else:
+            missing.append(name)
+    if missing:
+        available = store.available_titles()
+        lines.append(
+            f"Sorry, I don't have information for {', '.join(missing)}. Available products: {available}"
+        )
+    return "\n".join(lines)
+
+
 def create_product_catalog_agent() -> LlmAgent:
     """Build the LLM agent exposed over A2A for catalog queries."""
     return LlmAgent(
@@ -36,8 +68,8 @@ def create_product_catalog_agent() -> LlmAgent:
         You are a product catalog specialist from an external vendor.
         When asked about products, use the get_product_info tool to fetch data from the catalog.
         Provide clear, accurate product information including price, availability, and specs.
-        If asked about multiple products, look up each one.
+        If asked about multiple products, look them all up with a single get_products_info call.
         Be professional and helpful.
         """,
-        tools=[get_product_info],
+        tools=[get_product_info, get_products_info],
     )
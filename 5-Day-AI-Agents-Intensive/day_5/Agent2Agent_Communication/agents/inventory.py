@@ -1,35 +1,66 @@
 """Inventory agent that tracks stock levels and restocks."""
 
+from typing import Optional
+
 from google.adk.agents import LlmAgent
 from google.adk.models.google_llm import Gemini
 
 from ..config import MODEL_NAME, RETRY_CONFIG
+from .products import get_product_store
+
+
+def find_inventory_status(product_name: str, *, fuzzy: bool = False) -> Optional[str]:
+    """Inventory report for a product name or SKU (``fuzzy`` allows partial names), else None."""
+    product = get_product_store().find(product_name, fuzzy=fuzzy)
+    if product is None:
+        return None
+    return (
+        f"Inventory Report: {product.title} - {product.status} "
+        f"({product.stock} units). Next restock: {product.restock}."
+    )
 
 
 def get_inventory_status(product_name: str) -> str:
     """Return inventory details for a supported product."""
-    inventory = {
-        "iphone 15 pro": {"stock": 8, "status": "Low Stock", "restock": "Arriving in 3 days"},
-        "samsung galaxy s24": {"stock": 31, "status": "In Stock", "restock": "Stable supply"},
-        "dell xps 15": {"stock": 45, "status": "In Stock", "restock": "Weekly shipment"},
-        "macbook pro 14": {"stock": 22, "status": "In Stock", "restock": "Next refresh in 10 days"},
-        "sony wh-1000xm5": {"stock": 67, "status": "In Stock", "restock": "Monthly replenishment"},
-        "ipad air": {"stock": 28, "status": "In Stock", "restock": "Next shipment tomorrow"},
-        "lg ultrawide 34": {"stock": 0, "status": "Out of Stock", "restock": "Next week"},
-    }
-
-    product_lower = product_name.lower().strip()
-    if product_lower in inventory:
-        info = inventory[product_lower]
-        return (
-            f"Inventory Report: {product_lower.title()} - {info['status']} "
-            f"({info['stock']} units). Next restock: {info['restock']}."
-        )
-
-    available = ", ".join([p.title() for p in inventory.keys()])
+    answer = find_inventory_status(product_name, fuzzy=True)
+    if answer is not None:
+        return answer
+
+    store = get_product_store()
+    suggestions = store.suggestions(product_name)
+    if suggestions is not None:
+        return f"{product_name} matches several tracked products. Did you mean: {suggestions}?"
+    available = store.available_titles()
     return f"Inventory unavailable for {product_name}. Tracked products: {available}"
 
 
+def get_inventory_statuses(product_names: list[str]) -> str:
+    """Return inventory details for several products in one call, one line each.
+
+    Use this instead of repeated get_inventory_status calls when a request
+    covers more than one product.
+    """
+    if not product_names:
+        return "No product names given."
+    store = get_product_store()
+    lines = []
+    missing = []
+    for name in product_names:
+        answer = find_inventory_status(name, fuzzy=True)
+        if answer is not None:
+            lines.append(answer)
+            continue
+        suggestions = store.suggestions(name)
+        if suggestions is not None:
+            lines.append(f"{name} matches several tracked products. Did you mean: {suggestions}?")
+        else:
+            missing.append(name)
+    if missing:
+        available = store.available_titles()
+        lines.append(f"Inventory unavailable for {', '.join(missing)}. Tracked products: {available}")
+    return "\n".join(lines)
+
+
 def create_inventory_agent() -> LlmAgent:
     """Build the LLM agent exposed over A2A for warehouse lookups."""
     return LlmAgent(
@@ -39,7 +70,8 @@ def create_inventory_agent() -> LlmAgent:
         instruction="""
         You are responsible for providing up-to-date inventory information.
         Always call the get_inventory_status tool before replying so you can confirm stock counts
-        and restock timelines. Include both pieces of information in your response.
+        and restock timelines; when several products are mentioned, check them all with a single
+        get_inventory_statuses call instead. Include both pieces of information in your response.
         """,
-        tools=[get_inventory_status],
+        tools=[get_inventory_status, get_inventory_statuses],
     )
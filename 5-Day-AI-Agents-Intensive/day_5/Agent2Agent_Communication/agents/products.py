@@ -0,0 +1,355 @@
+"""Shared product data for the catalog and inventory specialists.
+
+The store is built once per process (``get_product_store``) and indexed three
+ways, so neither tool rebuilds a dict per call or scans the catalog:
+
+* normalised name -> product (``"MacBook Pro 14"`` and ``" macbook  pro 14 "``
+  are the same key),
+* SKU -> product,
+* token vocabulary kept sorted, so a query token is matched as a prefix with
+  ``bisect`` and the candidate sets of all query tokens are intersected
+  (``"macbook 14"`` -> ``macbook pro 14``).
+
+Queries that still miss get a typo-tolerant pass: each token without a match
+is corrected against the vocabulary with ``difflib``. Only vocabulary tokens
+sharing the most character trigrams with it (and of a length that can reach
+``PRODUCT_FUZZY_CUTOFF``) are scored, so a miss does not scan the whole
+vocabulary. Tokens containing digits (``15``, ``s24``) are model numbers and
+only ever match exactly.
+
+``find`` answers only when the query means exactly one product; "pro" matches
+both the iPhone 15 Pro and the MacBook Pro 14, so it returns None and
+``suggestions`` lists the candidates for a "did you mean" reply. Exact lookups
+are dictionary hits regardless of catalog size; set ``A2A_PRODUCT_DATA`` to a
+JSON file to load a larger catalog.
+"""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+import heapq
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..config import (
+    PRODUCT_DATA_FILE,
+    PRODUCT_FUZZY_CUTOFF,
+    PRODUCT_LIST_LIMIT,
+    PRODUCT_SUGGESTION_LIMIT,
+)
+
+# Shorter query tokens only match whole vocabulary tokens, not prefixes.
+MIN_PREFIX_LENGTH = 2
+# Vocabulary tokens scored by difflib per misspelt token, most shared trigrams first.
+FUZZY_POOL_SIZE = 64
+
+_NON_WORD = re.compile(r"[^\w\s-]+")
+_DIGIT = re.compile(r"\d")
+
+
+def normalize(name: str) -> str:
+    """Lowercase, drop punctuation other than hyphens, collapse whitespace."""
+    return " ".join(_NON_WORD.sub(" ", name.lower()).split())
+
+
+def normalize_sku(sku: str) -> str:
+    return "".join(sku.upper().split())
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f" {token} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def _rank(key: str) -> Tuple[int, int, str]:
+    # Most specific first: fewest words, then shortest name.
+    return (len(key.split()), len(key), key)
+
+
+@dataclass(slots=True)
+class Product:
+    """One catalog entry. Slotted: the store may hold 100k of them."""
+
+    key: str
+    sku: str
+    summary: str
+    stock: int
+    status: str
+    restock: str
+
+    @property
+    def title(self) -> str:
+        return self.key.title()
+
+
+# (name, sku, catalog summary, stock, inventory status, restock note) for the demo store.
+DEFAULT_PRODUCTS: Tuple[Tuple[str, str, str, int, str, str], ...] = (
+    (
+        "iphone 15 pro",
+        "APL-IP15P-128",
+        "iPhone 15 Pro, $999, Low Stock (8 units), 128GB, Titanium finish",
+        8,
+        "Low Stock",
+        "Arriving in 3 days",
+    ),
+    (
+        "samsung galaxy s24",
+        "SAM-GS24-256",
+        "Samsung Galaxy S24, $799, In Stock (31 units), 256GB, Phantom Black",
+        31,
+        "In Stock",
+        "Stable supply",
+    ),
+    (
+        "dell xps 15",
+        "DEL-XPS15-512",
+        'Dell XPS 15, $1,299, In Stock (45 units), 15.6" display, 16GB RAM, 512GB SSD',
+        45,
+        "In Stock",
+        "Weekly shipment",
+    ),
+    (
+        "macbook pro 14",
+        "APL-MBP14-M3P",
+        'MacBook Pro 14", $1,999, In Stock (22 units), M3 Pro chip, 18GB RAM, 512GB SSD',
+        22,
+        "In Stock",
+        "Next refresh in 10 days",
+    ),
+    (
+        "sony wh-1000xm5",
+        "SNY-WH1000XM5",
+        "Sony WH-1000XM5 Headphones, $399, In Stock (67 units), Noise-canceling, 30hr battery",
+        67,
+        "In Stock",
+        "Monthly replenishment",
+    ),
+    (
+        "ipad air",
+        "APL-IPADAIR-64",
+        'iPad Air, $599, In Stock (28 units), 10.9" display, 64GB',
+        28,
+        "In Stock",
+        "Next shipment tomorrow",
+    ),
+    (
+        "lg ultrawide 34",
+        "LG-UW34-MON",
+        'LG UltraWide 34" Monitor, $499, Out of Stock, Expected: Next week',
+        0,
+        "Out of Stock",
+        "Next week",
+    ),
+)
+
+
+class ProductStore:
+    """Products keyed by normalised name with SKU and token-prefix indexes."""
+
+    def __init__(self, products: Iterable[Product] = ()) -> None:
+        self._by_key: Dict[str, Product] = {}
+        self._by_sku: Dict[str, str] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_sorted = True
+        # Trigram -> vocabulary tokens, built on the first typo correction.
+        self._by_trigram: Optional[Dict[str, List[str]]] = None
+        self._available: Optional[str] = None
+        for product in products:
+            self.add(product)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def add(self, product: Product) -> Product:
+        product.key = normalize(product.key)
+        previous = self._by_key.get(product.key)
+        if previous is not None:
+            self._by_sku.pop(normalize_sku(previous.sku), None)
+        self._by_key[product.key] = product
+        self._by_sku[normalize_sku(product.sku)] = product.key
+        for token in product.key.split():
+            keys = self._by_token.get(token)
+            if keys is None:
+                self._by_token[token] = keys = set()
+                self._vocabulary.append(token)
+                self._vocabulary_sorted = False
+                if self._by_trigram is not None:
+                    self._index_trigrams(token)
+            keys.add(product.key)
+        self._available = None
+        return product
+
+    def get(self, query: str) -> Optional[Product]:
+        """Exact match on normalised name or SKU."""
+        key = normalize(query)
+        product = self._by_key.get(key)
+        if product is not None:
+            return product
+        sku_key = self._by_sku.get(normalize_sku(query))
+        return self._by_key[sku_key] if sku_key is not None else None
+
+    def find(self, query: str, *, fuzzy: bool = True) -> Optional[Product]:
+        """The one product ``query`` means; None when nothing or several match."""
+        matches = self.matches(query, fuzzy=fuzzy, limit=2)
+        return matches[0] if len(matches) == 1 else None
+
+    def matches(
+        self, query: str, *, fuzzy: bool = True, limit: int = PRODUCT_SUGGESTION_LIMIT
+    ) -> List[Product]:
+        """Exact match first, then token prefixes, then typo-corrected tokens.
+
+        At most ``limit`` products, most specific (fewest words) first.
+        """
+        product = self.get(query)
+        if product is not None:
+            return [product]
+        tokens = normalize(query).split()
+        if not fuzzy or not tokens:
+            return []
+        token_matches = [self._prefix_matches(token) for token in tokens]
+        candidates = self._candidates(token_matches)
+        if not candidates:
+            for index, token in enumerate(tokens):
+                if not token_matches[index]:
+                    token_matches[index] = set().union(
+                        *(self._by_token[corrected] for corrected in self._correct(token))
+                    )
+            candidates = self._candidates(token_matches)
+        return [self._by_key[key] for key in heapq.nsmallest(limit, candidates, key=_rank)]
+
+    def suggestions(self, query: str) -> Optional[str]:
+        """Titles for a "did you mean" reply when ``query`` matches several products."""
+        matches = self.matches(query)
+        if len(matches) < 2:
+            return None
+        return ", ".join(product.title for product in matches)
+
+    def _sorted_vocabulary(self) -> List[str]:
+        # Sorted lazily so bulk loads append tokens in O(1).
+        if not self._vocabulary_sorted:
+            self._vocabulary.sort()
+            self._vocabulary_sorted = True
+        return self._vocabulary
+
+    def _prefix_matches(self, token: str) -> Set[str]:
+        # "bravo3" must not pick "bravo32": model numbers match whole tokens only.
+        if len(token) < MIN_PREFIX_LENGTH or _DIGIT.search(token):
+            return set(self._by_token.get(token, ()))
+        vocabulary = self._sorted_vocabulary()
+        matches: Set[str] = set()
+        index = bisect.bisect_left(vocabulary, token)
+        while index < len(vocabulary) and vocabulary[index].startswith(token):
+            matches |= self._by_token[vocabulary[index]]
+            index += 1
+        return matches
+
+    def _candidates(self, token_matches: List[Set[str]]) -> Set[str]:
+        # Intersect starting from the most selective token so large sets shrink fast.
+        sets = sorted(token_matches, key=len)
+        candidates = sets[0]
+        for other in sets[1:]:
+            if not candidates:
+                break
+            candidates = candidates & other
+        return candidates
+
+    def _index_trigrams(self, token: str) -> None:
+        if _DIGIT.search(token):
+            return
+        for trigram in _trigrams(token):
+            self._by_trigram.setdefault(trigram, []).append(token)
+
+    def _fuzzy_pool(self, token: str) -> List[str]:
+        if self._by_trigram is None:
+            self._by_trigram = {}
+            for known in self._vocabulary:
+                self._index_trigrams(known)
+        # difflib's ratio 2*M/(a+b) can only reach the cutoff within this length band.
+        cutoff = PRODUCT_FUZZY_CUTOFF
+        shortest = len(token) * cutoff / (2 - cutoff)
+        longest = len(token) * (2 - cutoff) / cutoff
+        shared: Dict[str, int] = {}
+        for trigram in _trigrams(token):
+            for known in self._by_trigram.get(trigram, ()):
+                shared[known] = shared.get(known, 0) + 1
+        pool = [known for known in shared if shortest <= len(known) <= longest]
+        return heapq.nlargest(FUZZY_POOL_SIZE, pool, key=lambda known: (shared[known], known))
+
+    def _correct(self, token: str) -> List[str]:
+        """Vocabulary tokens tied for the closest match to ``token`` (empty if none)."""
+        if token in self._by_token:
+            return [token]
+        if len(token) < MIN_PREFIX_LENGTH or _DIGIT.search(token):
+            return []
+        matcher = difflib.SequenceMatcher(b=token)
+        scored: Dict[str, float] = {}
+        for known in self._fuzzy_pool(token):
+            matcher.set_seq1(known)
+            # Cheap upper bounds first, as difflib.get_close_matches does.
+            if (
+                matcher.real_quick_ratio() < PRODUCT_FUZZY_CUTOFF
+                or matcher.quick_ratio() < PRODUCT_FUZZY_CUTOFF
+            ):
+                continue
+            ratio = matcher.ratio()
+            if ratio >= PRODUCT_FUZZY_CUTOFF:
+                scored[known] = ratio
+        if not scored:
+            return []
+        best = max(scored.values())
+        return sorted(known for known, ratio in scored.items() if ratio == best)
+
+    def available_titles(self) -> str:
+        """Product titles for "not found" replies, capped at ``PRODUCT_LIST_LIMIT``."""
+        if self._available is None:
+            titles = [key.title() for _, key in zip(range(PRODUCT_LIST_LIMIT), self._by_key)]
+            hidden = len(self._by_key) - len(titles)
+            if hidden > 0:
+                titles.append(f"and {hidden} more")
+            self._available = ", ".join(titles)
+        return self._available
+
+
+def load_products(path: Optional[str] = None) -> List[Product]:
+    """Products from a JSON list of objects, or ``DEFAULT_PRODUCTS``.
+
+    Each object needs ``name``, ``sku``, ``summary``, ``stock``, ``status``
+    and ``restock``.
+    """
+    if path is None:
+        return [Product(*row) for row in DEFAULT_PRODUCTS]
+    records = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [
+        Product(
+            key=record["name"],
+            sku=record["sku"],
+            summary=record["summary"],
+            stock=int(record["stock"]),
+            status=record["status"],
+            restock=record["restock"],
+        )
+        for record in records
+    ]
+
+
+@lru_cache(maxsize=1)
+def get_product_store() -> ProductStore:
+    """Process-wide store, loaded on first use (``A2A_PRODUCT_DATA`` overrides the file)."""
+    return ProductStore(load_products(os.getenv("A2A_PRODUCT_DATA") or PRODUCT_DATA_FILE))
+
+
+__all__ = [
+    "DEFAULT_PRODUCTS",
+    "Product",
+    "ProductStore",
+    "get_product_store",
+    "load_products",
+    "normalize",
+]
@@ -0,0 +1,224 @@
+"""Shipment data for the shipping specialist.
+
+The store is built once per process (``get_shipment_store``) and indexed two
+ways:
+
+* canonical order ID -> tracking record (``"ORD12345"``, ``"ord-12345"`` and
+  ``" ord 12345 "`` are the same key),
+* normalised destination -> delivery estimate.
+
+Order IDs are also picked out of free text with one compiled pattern
+(``extract_order_ids``), so "where are ORD12345 and ORD67890?" resolves to two
+dictionary hits instead of a failed exact match. Destinations mentioned in a
+sentence are found by looking up its word n-grams, which costs one dictionary
+probe per n-gram whatever the number of destinations. Set
+``A2A_SHIPMENT_DATA`` to a JSON file to load a larger order book.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ..config import SHIPMENT_DATA_FILE, SHIPMENT_LIST_LIMIT
+
+# "ORD12345", "ord-12345", "ORD 12345"; the word boundary keeps "record12" out.
+ORDER_ID_PATTERN = re.compile(r"\bORD[-\s]?(\d+)\b", re.IGNORECASE)
+
+_NON_WORD = re.compile(r"[^\w\s-]+")
+
+SHIPPING_ESTIMATES = {
+    "new york": {"delivery": "2 business days", "carrier": "UPS Air", "cost": "$35"},
+    "los angeles": {"delivery": "1 business day", "carrier": "FedEx Express", "cost": "$29"},
+    "chicago": {"delivery": "3 business days", "carrier": "USPS Priority", "cost": "$24"},
+    "seattle": {"delivery": "4 business days", "carrier": "UPS Ground", "cost": "$22"},
+}
+TRACKING_UPDATES = {
+    "ord12345": {
+        "status": "Out for delivery",
+        "eta": "Today by 7 PM",
+        "carrier": "UPS",
+        "last_scan": "Local facility - 7:15 AM",
+    },
+    "ord67890": {
+        "status": "In transit",
+        "eta": "Tomorrow",
+        "carrier": "FedEx",
+        "last_scan": "Memphis, TN - 2:40 AM",
+    },
+}
+
+
+def normalize_destination(name: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", name.lower()).split())
+
+
+def normalize_order_id(text: str) -> Optional[str]:
+    """Canonical ``ORD<digits>`` when ``text`` is exactly one order ID, else None."""
+    match = ORDER_ID_PATTERN.fullmatch(text.strip())
+    return f"ORD{match.group(1)}" if match else None
+
+
+def extract_order_ids(text: str) -> List[str]:
+    """Canonical order IDs mentioned in ``text``, first mention order, no duplicates."""
+    return list(dict.fromkeys(f"ORD{digits}" for digits in ORDER_ID_PATTERN.findall(text)))
+
+
+@dataclass(slots=True)
+class Shipment:
+    order_id: str
+    status: str
+    eta: str
+    carrier: str
+    last_scan: str
+
+
+@dataclass(slots=True)
+class ShippingEstimate:
+    destination: str
+    delivery: str
+    carrier: str
+    cost: str
+
+    @property
+    def title(self) -> str:
+        return self.destination.title()
+
+
+class ShipmentStore:
+    """Tracking records by order ID and delivery estimates by destination."""
+
+    def __init__(
+        self, shipments: Iterable[Shipment] = (), estimates: Iterable[ShippingEstimate] = ()
+    ) -> None:
+        self._by_order: Dict[str, Shipment] = {}
+        self._by_destination: Dict[str, ShippingEstimate] = {}
+        self._max_destination_words = 0
+        self._orders_text: Optional[str] = None
+        self._destinations_text: Optional[str] = None
+        for shipment in shipments:
+            self.add_shipment(shipment)
+        for estimate in estimates:
+            self.add_estimate(estimate)
+
+    def __len__(self) -> int:
+        return len(self._by_order)
+
+    def add_shipment(self, shipment: Shipment) -> Shipment:
+        order_id = normalize_order_id(shipment.order_id)
+        if order_id is None:
+            raise ValueError(f"Not an order ID: {shipment.order_id!r}")
+        shipment.order_id = order_id
+        self._by_order[order_id] = shipment
+        self._orders_text = None
+        return shipment
+
+    def add_estimate(self, estimate: ShippingEstimate) -> ShippingEstimate:
+        estimate.destination = normalize_destination(estimate.destination)
+        self._by_destination[estimate.destination] = estimate
+        self._max_destination_words = max(
+            self._max_destination_words, len(estimate.destination.split())
+        )
+        self._destinations_text = None
+        return estimate
+
+    def tracking(self, order_id: str) -> Optional[Shipment]:
+        """Tracking record for text that is exactly one order ID."""
+        canonical = normalize_order_id(order_id)
+        return self._by_order.get(canonical) if canonical is not None else None
+
+    def estimate(self, destination: str) -> Optional[ShippingEstimate]:
+        """Estimate for text that is exactly one destination."""
+        return self._by_destination.get(normalize_destination(destination))
+
+    def mentioned_destination(self, text: str) -> Optional[ShippingEstimate]:
+        """First destination named anywhere in ``text``, longest name first at each position."""
+        words = normalize_destination(text).split()
+        for start in range(len(words)):
+            longest = min(self._max_destination_words, len(words) - start)
+            for size in range(longest, 0, -1):
+                estimate = self._by_destination.get(" ".join(words[start:start + size]))
+                if estimate is not None:
+                    return estimate
+        return None
+
+    def trackable_orders(self) -> str:
+        """Order IDs for "not found" replies, capped at ``SHIPMENT_LIST_LIMIT``."""
+        if self._orders_text is None:
+            self._orders_text = _capped(list(self._by_order))
+        return self._orders_text
+
+    def destinations(self) -> str:
+        """Destination names for "not found" replies, capped at ``SHIPMENT_LIST_LIMIT``."""
+        if self._destinations_text is None:
+            self._destinations_text = _capped([key.title() for key in self._by_destination])
+        return self._destinations_text
+
+
+def _capped(names: List[str]) -> str:
+    shown = names[:SHIPMENT_LIST_LIMIT]
+    hidden = len(names) - len(shown)
+    if hidden > 0:
+        shown.append(f"and {hidden} more")
+    return ", ".join(shown)
+
+
+def load_shipments(path: Optional[str] = None) -> ShipmentStore:
+    """Store from a JSON object, or from ``TRACKING_UPDATES``/``SHIPPING_ESTIMATES``.
+
+    The JSON object has an ``orders`` list (``order_id``, ``status``, ``eta``,
+    ``carrier``, ``last_scan``) and a ``destinations`` list (``name``,
+    ``delivery``, ``carrier``, ``cost``).
+    """
+    if path is None:
+        return ShipmentStore(
+            (Shipment(order_id=order_id, **info) for order_id, info in TRACKING_UPDATES.items()),
+            (ShippingEstimate(destination=name, **info) for name, info in SHIPPING_ESTIMATES.items()),
+        )
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return ShipmentStore(
+        (
+            Shipment(
+                order_id=record["order_id"],
+                status=record["status"],
+                eta=record["eta"],
+                carrier=record["carrier"],
+                last_scan=record["last_scan"],
+            )
+            for record in data.get("orders", [])
+        ),
+        (
+            ShippingEstimate(
+                destination=record["name"],
+                delivery=record["delivery"],
+                carrier=record["carrier"],
+                cost=record["cost"],
+            )
+            for record in data.get("destinations", [])
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_shipment_store() -> ShipmentStore:
+    """Process-wide store, loaded on first use (``A2A_SHIPMENT_DATA`` overrides the file)."""
+    return load_shipments(os.getenv("A2A_SHIPMENT_DATA") or SHIPMENT_DATA_FILE)
+
+
+__all__ = [
+    "ORDER_ID_PATTERN",
+    "SHIPPING_ESTIMATES",
+    "Shipment",
+    "ShipmentStore",
+    "ShippingEstimate",
+    "TRACKING_UPDATES",
+    "extract_order_ids",
+    "get_shipment_store",
+    "load_shipments",
+    "normalize_order_id",
+]
@@ -1,58 +1,115 @@
 """Shipping agent that provides delivery estimates and tracking."""
 
+from typing import List, Optional, Tuple
+
 from google.adk.agents import LlmAgent
 from google.adk.models.google_llm import Gemini
 
 from ..config import MODEL_NAME, RETRY_CONFIG
+from .shipments import (
+    Shipment,
+    ShippingEstimate,
+    extract_order_ids,
+    get_shipment_store,
+)
+
+
+def _tracking_line(shipment: Shipment) -> str:
+    return (
+        f"Tracking Update for {shipment.order_id}: {shipment.status}. "
+        f"ETA: {shipment.eta}. Carrier: {shipment.carrier}. "
+        f"Last scan: {shipment.last_scan}."
+    )
+
+
+def _estimate_line(estimate: ShippingEstimate) -> str:
+    return (
+        f"Shipping Estimate to {estimate.title}: {estimate.delivery} via {estimate.carrier} "
+        f"with estimated cost {estimate.cost}."
+    )
+
+
+def _tracking_report(order_ids: List[str]) -> Tuple[List[str], List[str]]:
+    """Tracking lines for known order IDs and the IDs that are not tracked."""
+    store = get_shipment_store()
+    lines = []
+    missing = []
+    for order_id in order_ids:
+        shipment = store.tracking(order_id)
+        if shipment is None:
+            missing.append(order_id)
+        else:
+            lines.append(_tracking_line(shipment))
+    return lines, missing
+
+
+def _untracked_line(missing: List[str]) -> str:
+    orders = get_shipment_store().trackable_orders()
+    return f"Tracking unavailable for {', '.join(missing)}. Trackable orders: {orders}."
+
+
+def find_shipping_info(request: str) -> Optional[str]:
+    """Tracking update or estimate for an exact order ID or city, else None."""
+    store = get_shipment_store()
+    shipment = store.tracking(request)
+    if shipment is not None:
+        return _tracking_line(shipment)
+    estimate = store.estimate(request)
+    if estimate is not None:
+        return _estimate_line(estimate)
+    return None
 
 
 def get_shipping_info(request: str) -> str:
     """Return shipping estimate or tracking details."""
-    shipping_estimates = {
-        "new york": {"delivery": "2 business days", "carrier": "UPS Air", "cost": "$35"},
-        "los angeles": {"delivery": "1 business day", "carrier": "FedEx Express", "cost": "$29"},
-        "chicago": {"delivery": "3 business days", "carrier": "USPS Priority", "cost": "$24"},
-        "seattle": {"delivery": "4 business days", "carrier": "UPS Ground", "cost": "$22"},
-    }
-    tracking_updates = {
-        "ord12345": {
-            "status": "Out for delivery",
-            "eta": "Today by 7 PM",
-            "carrier": "UPS",
-            "last_scan": "Local facility - 7:15 AM",
-        },
-        "ord67890": {
-            "status": "In transit",
-            "eta": "Tomorrow",
-            "carrier": "FedEx",
-            "last_scan": "Memphis, TN - 2:40 AM",
-        },
-    }
-
-    normalized = request.lower().strip()
-    if normalized in tracking_updates:
-        info = tracking_updates[normalized]
-        return (
-            f"Tracking Update for {request.upper()}: {info['status']}. "
-            f"ETA: {info['eta']}. Carrier: {info['carrier']}. "
-            f"Last scan: {info['last_scan']}."
-        )
-
-    if normalized in shipping_estimates:
-        info = shipping_estimates[normalized]
-        return (
-            f"Shipping Estimate to {request.title()}: {info['delivery']} via {info['carrier']} "
-            f"with estimated cost {info['cost']}."
-        )
-
-    destinations = ", ".join([d.title() for d in shipping_estimates.keys()])
-    orders = ", ".join([o.upper() for o in tracking_updates.keys()])
+    answer = find_shipping_info(request)
+    if answer is not None:
+        return answer
+
+    # Free text: every order ID it mentions, else the first destination it names.
+    store = get_shipment_store()
+    order_ids = extract_order_ids(request)
+    if order_ids:
+        lines, missing = _tracking_report(order_ids)
+        if lines:
+            if missing:
+                lines.append(_untracked_line(missing))
+            return "\n".join(lines)
+    else:
+        estimate = store.mentioned_destination(request)
+        if estimate is not None:
+            return _estimate_line(estimate)
+
     return (
         f"Shipping information unavailable for '{request}'. "
-        f"Supported destinations: {destinations}. Trackable orders: {orders}."
+        f"Supported destinations: {store.destinations()}. Trackable orders: {store.trackable_orders()}."
     )
 
 
+def get_tracking_updates(order_ids: list[str]) -> str:
+    """Return tracking updates for several orders in one call, one line each.
+
+    Entries may be bare IDs ("ORD12345") or text containing several IDs. Use
+    this instead of repeated get_shipping_info calls when a request covers
+    more than one order.
+    """
+    requested: List[str] = []
+    unrecognized: List[str] = []
+    for entry in order_ids:
+        found = extract_order_ids(entry)
+        if found:
+            requested.extend(found)
+        else:
+            unrecognized.append(entry)
+    if not requested and not unrecognized:
+        return "No order IDs given."
+    lines, missing = _tracking_report(list(dict.fromkeys(requested)))
+    missing.extend(unrecognized)
+    if missing:
+        lines.append(_untracked_line(missing))
+    return "\n".join(lines)
+
+
 def create_shipping_agent() -> LlmAgent:
     """Build the LLM agent exposed over A2A for logistics questions."""
     return LlmAgent(
@@ -62,7 +119,9 @@ def create_shipping_agent() -> LlmAgent:
         instruction="""
         You coordinate delivery logistics.
         Use the get_shipping_info tool with either a destination (city/region) to get estimates
-        or an order ID (e.g., ORD12345) to fetch tracking updates. Always report carrier and ETA.
+        or an order ID (e.g., ORD12345) to fetch tracking updates; when several orders are
+        mentioned, fetch them all with a single get_tracking_updates call instead.
+        Always report carrier and ETA.
         """,
-        tools=[get_shipping_info],
+        tools=[get_shipping_info, get_tracking_updates],
     )
@@ -20,6 +20,22 @@ A2A_PORTS = {
     "shipping": 8003,
 }
 
+# uvicorn settings per specialist, used when the launcher runs in multi-worker
+# mode (A2A_MULTI_WORKER=1 or launch_servers(multi_worker=True)). "workers" is
+# the number of processes, "limit_concurrency" caps in-flight requests per
+# process (excess gets HTTP 503 instead of queueing behind slow LLM calls) and
+# "backlog" is the listen queue for connections not yet accepted.
+# Each worker keeps its own in-memory sessions and tasks, so multi-worker mode
+# only suits stateless single-turn traffic: a follow-up whose contextId lands
+# on another worker is rejected with a JSON-RPC error (servers/context_guard.py)
+# instead of silently starting an empty session.
+A2A_SERVER_SETTINGS = {
+    "product_catalog": {"workers": 2, "limit_concurrency": 64, "backlog": 256},
+    "inventory": {"workers": 2, "limit_concurrency": 64, "backlog": 256},
+    "shipping": {"workers": 4, "limit_concurrency": 128, "backlog": 512},
+}
+A2A_MULTI_WORKER = False
+
 # Human-friendly labels for log messages
 A2A_LABELS = {
     "product_catalog": "Product Catalog Agent",
@@ -40,3 +56,93 @@ A2A_REMOTE_NAMES = {
     "inventory": "inventory_agent",
     "shipping": "shipping_agent",
 }
+
+# How the customer support orchestrator reaches the specialists:
+# "delegate" hands the conversation to one sub-agent at a time (transfer);
+# "fan_out" exposes each remote as an AgentTool so a single model turn can call
+# several of them, and ADK runs those function calls concurrently.
+# Override with the A2A_ORCHESTRATION_MODE environment variable.
+ORCHESTRATION_MODE = "delegate"
+
+# Launcher readiness probing: the first retry comes after
+# A2A_PROBE_INITIAL_DELAY_S and the delay doubles up to A2A_PROBE_MAX_DELAY_S;
+# a server that has not served its agent card after A2A_STARTUP_TIMEOUT_S is
+# reported as not ready.
+A2A_PROBE_INITIAL_DELAY_S = 0.05
+A2A_PROBE_MAX_DELAY_S = 1.0
+A2A_PROBE_TIMEOUT_S = 2.0
+A2A_STARTUP_TIMEOUT_S = 60.0
+
+# Background warmup (warmup.py): when root_agent is resolved lazily (adk web),
+# importing agent.py starts any missing servers on a daemon thread so they boot
+# before the agent is first used. Override with A2A_SERVER_WARMUP=0/1;
+# A2A_AUTO_START_SERVERS=0 also turns it off.
+A2A_SERVER_WARMUP = True
+
+# Shared HTTP clients (http_client.py): keep-alive pool bounds, and how long a
+# fetched agent card is reused before it is fetched again.
+A2A_HTTP_MAX_CONNECTIONS = 20
+A2A_HTTP_MAX_KEEPALIVE = 10
+A2A_AGENT_CARD_TTL_S = 300.0
+# Per-request timeout for remote agent calls (a remote LLM turn can be slow).
+A2A_REMOTE_TIMEOUT_S = 600.0
+
+# Structured fast path (servers/fast_path.py): each specialist also serves
+# FAST_PATH_ROUTE, which answers exact product / city / order-ID lookups from
+# the tool table without a model turn. Override with A2A_FAST_PATH=0/1.
+A2A_FAST_PATH_ENABLED = True
+FAST_PATH_ROUTE = "/fast/lookup"
+
+# Shared product store (agents/products.py). PRODUCT_DATA_FILE points at a JSON
+# list of products (A2A_PRODUCT_DATA overrides it); None uses the demo catalog.
+# Typo correction accepts vocabulary tokens at or above PRODUCT_FUZZY_CUTOFF
+# similarity, "not found" replies list at most PRODUCT_LIST_LIMIT names, and
+# "did you mean" replies for ambiguous names at most PRODUCT_SUGGESTION_LIMIT.
+PRODUCT_DATA_FILE = None
+PRODUCT_FUZZY_CUTOFF = 0.75
+PRODUCT_LIST_LIMIT = 25
+PRODUCT_SUGGESTION_LIMIT = 5
+
+# Shipment store (agents/shipments.py). SHIPMENT_DATA_FILE points at a JSON
+# object with "orders" and "destinations" lists (A2A_SHIPMENT_DATA overrides
+# it); None uses the demo data. "Not found" replies list at most
+# SHIPMENT_LIST_LIMIT order IDs or destinations.
+SHIPMENT_DATA_FILE = None
+SHIPMENT_LIST_LIMIT = 25
+
+# Remote answer cache (response_cache.py): seconds a remote's answer to an
+# identical, self-contained request is reused. Stock moves quickly, catalog
+# specs rarely; 0 disables caching for that remote. A2A_RESPONSE_CACHE=0
+# turns the cache off entirely.
+A2A_RESPONSE_CACHE_ENABLED = True
+A2A_RESPONSE_CACHE_TTL_S = {
+    "product_catalog": 3600.0,
+    "inventory": 30.0,
+    "shipping": 300.0,
+}
+A2A_RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# Demo scenarios in agent.main() share one runner; at most this many run at
+# once (A2A_SCENARIO_CONCURRENCY overrides it).
+SCENARIO_CONCURRENCY = 4
+
+# How build_remote_agents reaches the specialists: "http" (uvicorn servers on
+# A2A_PORTS) or "in_process" (specialists built in this process and called
+# through their A2A request handlers without sockets, see in_process.py).
+# Override with the A2A_TRANSPORT environment variable.
+A2A_TRANSPORT = "http"
+
+# Remote call resilience (resilience.py). A remote's circuit opens after
+# A2A_BREAKER_FAILURE_THRESHOLD consecutive failures and calls then fail fast
+# until one trial call is allowed after A2A_BREAKER_RESET_S. Once
+# A2A_HEDGE_MIN_SAMPLES calls have been timed (over the last A2A_LATENCY_WINDOW),
+# a call still unanswered at the remote's A2A_HEDGE_PERCENTILE latency gets a
+# second request. A call is abandoned after A2A_REMOTE_DEADLINE_S.
+A2A_BREAKER_FAILURE_THRESHOLD = 3
+A2A_BREAKER_RESET_S = 30.0
+A2A_HEDGE_ENABLED = True
+A2A_HEDGE_MIN_SAMPLES = 20
+A2A_HEDGE_PERCENTILE = 95
+A2A_HEDGE_MIN_DELAY_S = 0.05
+A2A_LATENCY_WINDOW = 200
+A2A_REMOTE_DEADLINE_S = 90.0
@@ -0,0 +1,181 @@
+"""Pooled HTTP clients and an agent-card cache for the local A2A servers.
+
+One keep-alive ``httpx.Client`` serves every synchronous probe (availability
+checks, agent-card display), and one ``httpx.AsyncClient`` is shared by all
+``RemoteA2aAgent`` proxies through an A2A client factory, so neither opens a
+new TCP connection per request. Agent cards are cached per agent key for
+``A2A_AGENT_CARD_TTL_S``; ``build_remote_agents`` passes the cached
+``AgentCard`` object to ``RemoteA2aAgent`` so the proxies do not fetch it
+again on first use. The same async client serves the proxies' structured
+fast-path lookups (``FAST_PATH_ROUTE``).
+
+The async client is bound to the event loop that first uses it; this module
+assumes the orchestrator runs on a single loop (``adk web``, ``asyncio.run``).
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from a2a.client.client import ClientConfig as A2AClientConfig
+from a2a.client.client_factory import ClientFactory as A2AClientFactory
+from a2a.types import AgentCard
+from a2a.types import TransportProtocol as A2ATransport
+from google.adk.agents.remote_a2a_agent import AGENT_CARD_WELL_KNOWN_PATH
+
+from .config import (
+    A2A_AGENT_CARD_TTL_S,
+    A2A_FAST_PATH_ENABLED,
+    A2A_HTTP_MAX_CONNECTIONS,
+    A2A_HTTP_MAX_KEEPALIVE,
+    A2A_PORTS,
+    A2A_PROBE_TIMEOUT_S,
+    A2A_REMOTE_TIMEOUT_S,
+    FAST_PATH_ROUTE,
+)
+
+_LIMITS = httpx.Limits(
+    max_connections=A2A_HTTP_MAX_CONNECTIONS, max_keepalive_connections=A2A_HTTP_MAX_KEEPALIVE
+)
+_lock = threading.Lock()
+_sync_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_client_factory: Optional[A2AClientFactory] = None
+
+
+def agent_card_url(agent_key: str) -> str:
+    return f"http://localhost:{A2A_PORTS[agent_key]}{AGENT_CARD_WELL_KNOWN_PATH}"
+
+
+def fast_path_url(agent_key: str) -> str:
+    return f"http://localhost:{A2A_PORTS[agent_key]}{FAST_PATH_ROUTE}"
+
+
+def fast_path_enabled() -> bool:
+    """``A2A_FAST_PATH`` (1/0) overrides ``config.A2A_FAST_PATH_ENABLED``."""
+    override = os.getenv("A2A_FAST_PATH")
+    if override is None:
+        return A2A_FAST_PATH_ENABLED
+    return override.lower() not in {"0", "false", "no"}
+
+
+def get_http_client() -> httpx.Client:
+    """Process-wide keep-alive client for short synchronous requests."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(timeout=A2A_PROBE_TIMEOUT_S, limits=_LIMITS)
+        return _sync_client
+
+
+def get_a2a_client_factory() -> A2AClientFactory:
+    """A2A client factory sharing one pooled ``AsyncClient`` across remotes.
+
+    Mirrors the factory ``RemoteA2aAgent`` builds for itself (JSON-RPC,
+    non-streaming) apart from the shared client.
+    """
+    global _async_client, _client_factory
+    with _lock:
+        if _client_factory is None or _async_client is None or _async_client.is_closed:
+            _async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(timeout=A2A_REMOTE_TIMEOUT_S), limits=_LIMITS
+            )
+            _client_factory = A2AClientFactory(
+                config=A2AClientConfig(
+                    httpx_client=_async_client,
+                    streaming=False,
+                    polling=False,
+                    supported_transports=[A2ATransport.jsonrpc],
+                )
+            )
+        return _client_factory
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """The pooled ``AsyncClient`` behind ``get_a2a_client_factory``."""
+    get_a2a_client_factory()
+    assert _async_client is not None
+    return _async_client
+
+
+class AgentCardCache:
+    """Agent cards per agent key, refetched after ``ttl_s`` seconds."""
+
+    def __init__(self, ttl_s: float = A2A_AGENT_CARD_TTL_S) -> None:
+        self.ttl_s = ttl_s
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, agent_key: str, card: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[agent_key] = (time.monotonic() + self.ttl_s, card)
+
+    def invalidate(self, agent_key: Optional[str] = None) -> None:
+        with self._lock:
+            if agent_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(agent_key, None)
+
+    def get(self, agent_key: str, *, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """Cached card, fetched over the pooled client when missing or stale.
+
+        Returns ``None`` when the server does not serve its card; failures are
+        not cached so a server that comes up later is seen immediately.
+        """
+        if not refresh:
+            with self._lock:
+                entry = self._entries.get(agent_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+        self.misses += 1
+        try:
+            response = get_http_client().get(agent_card_url(agent_key))
+        except httpx.HTTPError:
+            self.invalidate(agent_key)
+            return None
+        if response.status_code != 200:
+            self.invalidate(agent_key)
+            return None
+        card = response.json()
+        self.put(agent_key, card)
+        return card
+
+    def get_agent_card(self, agent_key: str) -> Optional[AgentCard]:
+        card = self.get(agent_key)
+        return AgentCard.model_validate(card) if card is not None else None
+
+
+agent_cards = AgentCardCache()
+
+
+def close_http_clients() -> None:
+    """Close the shared sync client (the async one closes with its loop)."""
+    global _sync_client
+    with _lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+
+atexit.register(close_http_clients)
+
+__all__ = [
+    "AgentCardCache",
+    "agent_card_url",
+    "agent_cards",
+    "close_http_clients",
+    "fast_path_enabled",
+    "fast_path_url",
+    "get_a2a_client_factory",
+    "get_async_http_client",
+    "get_http_client",
+]
@@ -0,0 +1,255 @@
+"""In-process A2A transport for specialists co-located with the orchestrator.
+
+With ``A2A_TRANSPORT=in_process`` (or ``build_remote_agents(transport=...)``)
+the three specialists are built in this process, each behind the same A2A
+stack ``to_a2a()`` gives a uvicorn server: ``A2aAgentExecutor`` on an
+in-memory ``Runner``, ``DefaultRequestHandler`` and ``InMemoryTaskStore``.
+``RemoteA2aAgent`` still speaks the A2A contract and sends ``MessageSendParams``
+and receives ``Task``/``Message`` objects. The difference is that its client
+transport hands them straight to the request handler. There is no socket, no
+HTTP and no JSON encoding or decoding. Requests and results are deep-copied at
+the boundary so client and server never share mutable objects, as they would
+not over the wire.
+
+The specialists' agent cards advertise the ``IN-PROCESS`` transport with an
+``in-process://<agent key>`` URL, and only the client factory from
+``InProcessA2aHost.client_factory()`` knows how to reach them.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from a2a.client.client import ClientConfig as A2AClientConfig
+from a2a.client.client_factory import ClientFactory as A2AClientFactory
+from a2a.client.middleware import ClientCallContext
+from a2a.client.transports.base import ClientTransport
+from a2a.server.context import ServerCallContext
+from a2a.server.request_handlers import DefaultRequestHandler, RequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import (
+    AgentCard,
+    GetTaskPushNotificationConfigParams,
+    Message,
+    MessageSendParams,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskIdParams,
+    TaskPushNotificationConfig,
+    TaskQueryParams,
+    TaskStatusUpdateEvent,
+)
+from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
+from google.adk.a2a.utils.agent_card_builder import AgentCardBuilder
+from google.adk.agents import BaseAgent
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.auth.credential_service.in_memory_credential_service import (
+    InMemoryCredentialService,
+)
+from google.adk.memory import InMemoryMemoryService
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+from .agents import create_inventory_agent, create_product_catalog_agent, create_shipping_agent
+from .launcher import run_sync
+
+IN_PROCESS_TRANSPORT = "IN-PROCESS"
+
+SPECIALIST_FACTORIES: Dict[str, Callable[[], BaseAgent]] = {
+    "product_catalog": create_product_catalog_agent,
+    "inventory": create_inventory_agent,
+    "shipping": create_shipping_agent,
+}
+
+StreamEvent = Message | Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
+
+
+def in_process_url(agent_key: str) -> str:
+    return f"in-process://{agent_key}"
+
+
+@dataclass(slots=True)
+class InProcessEndpoint:
+    agent_key: str
+    card: AgentCard
+    handler: RequestHandler
+
+
+def build_endpoint(agent_key: str, agent: BaseAgent) -> InProcessEndpoint:
+    """Wire ``agent`` into the same executor/handler stack ``to_a2a()`` builds."""
+
+    async def create_runner() -> Runner:
+        return Runner(
+            app_name=agent.name or "adk_agent",
+            agent=agent,
+            artifact_service=InMemoryArtifactService(),
+            session_service=InMemorySessionService(),
+            memory_service=InMemoryMemoryService(),
+            credential_service=InMemoryCredentialService(),
+        )
+
+    handler = DefaultRequestHandler(
+        agent_executor=A2aAgentExecutor(runner=create_runner), task_store=InMemoryTaskStore()
+    )
+    card = run_sync(AgentCardBuilder(agent=agent, rpc_url=in_process_url(agent_key)).build())
+    card.preferred_transport = IN_PROCESS_TRANSPORT
+    return InProcessEndpoint(agent_key=agent_key, card=card, handler=handler)
+
+
+class InProcessTransport(ClientTransport):
+    """A2A client transport that calls a ``RequestHandler`` directly."""
+
+    def __init__(self, endpoint: InProcessEndpoint) -> None:
+        self._endpoint = endpoint
+        self._handler = endpoint.handler
+
+    async def send_message(
+        self,
+        request: MessageSendParams,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+    ) -> Task | Message:
+        result = await self._handler.on_message_send(
+            request.model_copy(deep=True), ServerCallContext()
+        )
+        return result.model_copy(deep=True)
+
+    async def send_message_streaming(
+        self,
+        request: MessageSendParams,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+    ) -> AsyncGenerator[StreamEvent]:
+        async for event in self._handler.on_message_send_stream(
+            request.model_copy(deep=True), ServerCallContext()
+        ):
+            yield event.model_copy(deep=True)
+
+    async def get_task(
+        self,
+        request: TaskQueryParams,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+    ) -> Task:
+        task = await self._handler.on_get_task(request, ServerCallContext())
+        if task is None:
+            raise LookupError(f"Task {request.id} not found on {self._endpoint.agent_key}")
+        return task.model_copy(deep=True)
+
+    async def cancel_task(
+        self,
+        request: TaskIdParams,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+    ) -> Task:
+        task = await self._handler.on_cancel_task(request, ServerCallContext())
+        if task is None:
+            raise LookupError(f"Task {request.id} not found on {self._endpoint.agent_key}")
+        return task.model_copy(deep=True)
+
+    async def set_task_callback(
+        self,
+        request: TaskPushNotificationConfig,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+    ) -> TaskPushNotificationConfig:
+        return await self._handler.on_set_task_push_notification_config(
+            request, ServerCallContext()
+        )
+
+    async def get_task_callback(
+        self,
+        request: GetTaskPushNotificationConfigParams,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+    ) -> TaskPushNotificationConfig:
+        return await self._handler.on_get_task_push_notification_config(
+            request, ServerCallContext()
+        )
+
+    async def resubscribe(
+        self,
+        request: TaskIdParams,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+    ) -> AsyncGenerator[StreamEvent]:
+        async for event in self._handler.on_resubscribe_to_task(request, ServerCallContext()):
+            yield event.model_copy(deep=True)
+
+    async def get_card(
+        self,
+        *,
+        context: ClientCallContext | None = None,
+        extensions: list[str] | None = None,
+        signature_verifier: Callable[[AgentCard], None] | None = None,
+    ) -> AgentCard:
+        return self._endpoint.card
+
+    async def close(self) -> None:
+        return None
+
+
+class InProcessA2aHost:
+    """Specialists served in this process, built on first use."""
+
+    def __init__(self, factories: Optional[Dict[str, Callable[[], BaseAgent]]] = None) -> None:
+        self._factories = dict(factories or SPECIALIST_FACTORIES)
+        self._endpoints: Dict[str, InProcessEndpoint] = {}
+        self._client_factory: Optional[A2AClientFactory] = None
+        self._lock = threading.Lock()
+
+    def endpoint(self, agent_key: str) -> InProcessEndpoint:
+        with self._lock:
+            endpoint = self._endpoints.get(agent_key)
+            if endpoint is None:
+                endpoint = build_endpoint(agent_key, self._factories[agent_key]())
+                self._endpoints[agent_key] = endpoint
+            return endpoint
+
+    def get_agent_card(self, agent_key: str) -> AgentCard:
+        return self.endpoint(agent_key).card
+
+    def _create_transport(
+        self, card: AgentCard, url: str, config: A2AClientConfig, interceptors: Any
+    ) -> InProcessTransport:
+        agent_key = url.removeprefix("in-process://")
+        return InProcessTransport(self.endpoint(agent_key))
+
+    def client_factory(self) -> A2AClientFactory:
+        """Client factory that resolves ``in-process://`` cards to local handlers."""
+        with self._lock:
+            if self._client_factory is None:
+                factory = A2AClientFactory(
+                    config=A2AClientConfig(
+                        streaming=False,
+                        polling=False,
+                        supported_transports=[IN_PROCESS_TRANSPORT],
+                    )
+                )
+                factory.register(IN_PROCESS_TRANSPORT, self._create_transport)
+                self._client_factory = factory
+            return self._client_factory
+
+
+in_process_host = InProcessA2aHost()
+
+__all__ = [
+    "IN_PROCESS_TRANSPORT",
+    "InProcessA2aHost",
+    "InProcessEndpoint",
+    "InProcessTransport",
+    "SPECIALIST_FACTORIES",
+    "build_endpoint",
+    "in_process_host",
+    "in_process_url",
+]
@@ -0,0 +1,290 @@
+"""Concurrent launcher for the A2A specialist servers.
+
+All missing uvicorn processes are spawned at once, then their agent cards are
+probed in parallel over ``httpx`` with exponential backoff (50 ms, 100 ms, …
+capped at ``A2A_PROBE_MAX_DELAY_S``). Startup therefore costs roughly the
+slowest server's boot time instead of the sum of three boots plus fixed
+five-second sleeps. A process that exits during startup is reported at once
+rather than after the full timeout.
+
+In multi-worker mode each server gets the worker count, concurrency limit and
+listen backlog from ``A2A_SERVER_SETTINGS`` in ``config.py``.
+
+Usage (from the repository root, keeps the servers up until Ctrl+C)::
+
+    python -m day_5.Agent2Agent_Communication.launcher --multi-worker
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Coroutine, Dict, Iterable, List, Optional, TypeVar
+
+import httpx
+
+from .config import (
+    A2A_LABELS,
+    A2A_MULTI_WORKER,
+    A2A_PORTS,
+    A2A_PROBE_INITIAL_DELAY_S,
+    A2A_PROBE_MAX_DELAY_S,
+    A2A_PROBE_TIMEOUT_S,
+    A2A_SERVER_MODULES,
+    A2A_SERVER_SETTINGS,
+    A2A_STARTUP_TIMEOUT_S,
+)
+from .http_client import agent_card_url
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+AGENT_KEYS = tuple(A2A_PORTS)
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class LaunchReport:
+    processes: Dict[str, subprocess.Popen] = field(default_factory=dict)
+    already_running: List[str] = field(default_factory=list)
+    ready_s: Dict[str, Optional[float]] = field(default_factory=dict)
+    cards: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+
+    @property
+    def all_ready(self) -> bool:
+        return all(seconds is not None for seconds in self.ready_s.values())
+
+
+_UVICORN_OPTIONS = ("workers", "limit_concurrency", "backlog")
+
+
+def resolve_multi_worker(multi_worker: Optional[bool] = None) -> bool:
+    if multi_worker is not None:
+        return multi_worker
+    env_value = os.environ.get("A2A_MULTI_WORKER")
+    if env_value is None:
+        return A2A_MULTI_WORKER
+    return env_value.strip().lower() not in {"0", "false", "no"}
+
+
+def server_command(agent_key: str, multi_worker: bool = False) -> List[str]:
+    """uvicorn command line for ``agent_key``, tuned when ``multi_worker``."""
+    command = [
+        "uvicorn",
+        f"{A2A_SERVER_MODULES[agent_key]}:app",
+        "--host",
+        "localhost",
+        "--port",
+        str(A2A_PORTS[agent_key]),
+    ]
+    if multi_worker:
+        settings = A2A_SERVER_SETTINGS.get(agent_key, {})
+        for option in _UVICORN_OPTIONS:
+            if settings.get(option) is not None:
+                command += [f"--{option.replace('_', '-')}", str(settings[option])]
+    return command
+
+
+def spawn_server(
+    agent_key: str, multi_worker: bool = False, *, verbose: bool = True
+) -> subprocess.Popen:
+    """Start uvicorn for ``agent_key`` without waiting for it."""
+    try:
+        process = subprocess.Popen(
+            server_command(agent_key, multi_worker),
+            cwd=str(REPO_ROOT),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            # Tells the server whether to install its context guard.
+            env={**os.environ, "A2A_MULTI_WORKER": "1" if multi_worker else "0"},
+        )
+    except (FileNotFoundError, OSError) as exc:
+        print(f"❌ Failed to start {A2A_LABELS[agent_key]} server: {exc}")
+        raise
+    if not verbose:
+        return process
+    workers = A2A_SERVER_SETTINGS.get(agent_key, {}).get("workers", 1) if multi_worker else 1
+    print(
+        f"🚀 Starting {A2A_LABELS[agent_key]} server on port {A2A_PORTS[agent_key]}"
+        f"{f' ({workers} workers)' if workers > 1 else ''}..."
+    )
+    return process
+
+
+async def fetch_agent_card(client: httpx.AsyncClient, agent_key: str) -> Optional[Dict[str, Any]]:
+    """One probe: the agent card as a dict, or None if the server is not up."""
+    try:
+        response = await client.get(agent_card_url(agent_key))
+    except httpx.HTTPError:
+        return None
+    return response.json() if response.status_code == 200 else None
+
+
+async def wait_until_ready(
+    client: httpx.AsyncClient,
+    agent_key: str,
+    process: Optional[subprocess.Popen] = None,
+    *,
+    timeout_s: float = A2A_STARTUP_TIMEOUT_S,
+    initial_delay_s: float = A2A_PROBE_INITIAL_DELAY_S,
+    max_delay_s: float = A2A_PROBE_MAX_DELAY_S,
+) -> Optional[Dict[str, Any]]:
+    """Probe with exponential backoff until the card is served or time runs out."""
+    deadline = time.monotonic() + timeout_s
+    delay = initial_delay_s
+    while True:
+        card = await fetch_agent_card(client, agent_key)
+        if card is not None:
+            return card
+        if process is not None and process.poll() is not None:
+            print(f"❌ {A2A_LABELS[agent_key]} server exited with code {process.returncode}")
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay_s)
+
+
+async def launch_servers_async(
+    agent_keys: Iterable[str] = AGENT_KEYS,
+    *,
+    force_start: bool = False,
+    wait: bool = True,
+    timeout_s: float = A2A_STARTUP_TIMEOUT_S,
+    multi_worker: Optional[bool] = None,
+    verbose: bool = True,
+) -> LaunchReport:
+    """Start every missing server at once and wait for all of them together."""
+    agent_keys = list(agent_keys)
+    multi_worker = resolve_multi_worker(multi_worker)
+    report = LaunchReport()
+    started = time.perf_counter()
+    async with httpx.AsyncClient(timeout=A2A_PROBE_TIMEOUT_S) as client:
+        if force_start:
+            targets = agent_keys
+        else:
+            cards = await asyncio.gather(*(fetch_agent_card(client, key) for key in agent_keys))
+            targets = []
+            for key, card in zip(agent_keys, cards):
+                if card is None:
+                    targets.append(key)
+                else:
+                    report.already_running.append(key)
+                    report.cards[key] = card
+                    report.ready_s[key] = 0.0
+
+        report.processes = {key: spawn_server(key, multi_worker, verbose=verbose) for key in targets}
+        if not wait:
+            report.elapsed_s = time.perf_counter() - started
+            return report
+
+        async def _ready(key: str) -> None:
+            card = await wait_until_ready(client, key, report.processes[key], timeout_s=timeout_s)
+            report.ready_s[key] = time.perf_counter() - started if card is not None else None
+            if card is not None:
+                report.cards[key] = card
+                if verbose:
+                    print(f"✅ {A2A_LABELS[key]} server is running at http://localhost:{A2A_PORTS[key]}")
+            elif verbose:
+                print(f"⚠️  {A2A_LABELS[key]} server may not be ready yet. Check manually if needed.")
+
+        await asyncio.gather(*(_ready(key) for key in targets))
+    report.elapsed_s = time.perf_counter() - started
+    return report
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run ``coroutine`` to completion from sync code, even inside a running loop.
+
+    ``adk web`` and notebooks resolve ``root_agent`` while their own event loop
+    is running, where ``asyncio.run`` is not allowed; the coroutine then runs
+    on a short-lived worker thread with its own loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def launch_servers(
+    agent_keys: Iterable[str] = AGENT_KEYS,
+    *,
+    force_start: bool = False,
+    wait: bool = True,
+    timeout_s: float = A2A_STARTUP_TIMEOUT_S,
+    multi_worker: Optional[bool] = None,
+    verbose: bool = True,
+) -> LaunchReport:
+    """Synchronous wrapper around :func:`launch_servers_async`."""
+    return run_sync(
+        launch_servers_async(
+            agent_keys,
+            force_start=force_start,
+            wait=wait,
+            timeout_s=timeout_s,
+            multi_worker=multi_worker,
+            verbose=verbose,
+        )
+    )
+
+
+def print_launch_report(report: LaunchReport) -> None:
+    print("\n⏱️  A2A server startup")
+    for key, seconds in report.ready_s.items():
+        if key in report.already_running:
+            state = "already running"
+        elif seconds is None:
+            state = "not ready"
+        else:
+            state = f"ready after {seconds:.2f}s"
+        print(f"   {A2A_LABELS[key]:<24}{state}")
+    print(f"   Total startup time: {report.elapsed_s:.2f}s")
+
+
+def shutdown_servers(processes: Iterable[subprocess.Popen]) -> None:
+    """Terminate uvicorn processes gracefully."""
+    for process in processes:
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--multi-worker",
+        action="store_true",
+        default=None,
+        help="Apply A2A_SERVER_SETTINGS (workers, limit_concurrency, backlog)",
+    )
+    args = parser.parse_args()
+
+    report = launch_servers(force_start=False, multi_worker=args.multi_worker)
+    print_launch_report(report)
+    if not report.processes:
+        return
+    try:
+        print("\nServers are running. Press Ctrl+C to stop them.")
+        while all(process.poll() is None for process in report.processes.values()):
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown_servers(report.processes.values())
+        print("\n🛑 Shut down all A2A agent servers.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""Circuit breaking, hedged requests and deadlines for remote A2A calls.
+
+``ResilientRemoteA2aAgent`` wraps every call that reaches a remote (response
+cache hits never do) in three policies, with state kept per remote in
+``remote_health``:
+
+* **Circuit breaker**: after ``A2A_BREAKER_FAILURE_THRESHOLD`` consecutive
+  failures (error events, failed tasks, deadline overruns) the remote's circuit
+  opens. While it is open, calls fail immediately with an error event the
+  orchestrator can answer around, instead of waiting on a dead or degraded
+  server. After ``A2A_BREAKER_RESET_S`` one trial call is let through
+  (half-open). Its success closes the circuit, and its failure reopens it.
+* **Hedging**: once ``A2A_HEDGE_MIN_SAMPLES`` successful calls have been
+  timed, a call that has not answered by the remote's recent p95 latency gets
+  a second, identical request. The first successful answer wins and the other
+  request is cancelled. Only self-contained requests are hedged: a fresh text
+  question (the same test the response cache applies) is a read-only lookup
+  that can safely run twice, whereas a function-response reply or a follow-up
+  on an existing ``context_id`` would advance the remote session twice.
+* **Deadline**: a call (including its hedge) that has not answered within
+  ``A2A_REMOTE_DEADLINE_S`` is abandoned and counted as a failure, so one
+  slow remote cannot hold the support agent for the full HTTP timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Deque, Dict, List, Optional, Tuple
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.remote_a2a_agent import A2A_METADATA_PREFIX
+from google.adk.events.event import Event
+
+from .config import (
+    A2A_BREAKER_FAILURE_THRESHOLD,
+    A2A_BREAKER_RESET_S,
+    A2A_HEDGE_ENABLED,
+    A2A_HEDGE_MIN_DELAY_S,
+    A2A_HEDGE_MIN_SAMPLES,
+    A2A_HEDGE_PERCENTILE,
+    A2A_LATENCY_WINDOW,
+    A2A_REMOTE_DEADLINE_S,
+)
+from .response_cache import CachedRemoteA2aAgent, answer_failed
+
+RESILIENCE_METADATA_KEY = A2A_METADATA_PREFIX + "resilience"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open trial call."""
+
+    def __init__(
+        self,
+        failure_threshold: int = A2A_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout_s: float = A2A_BREAKER_RESET_S,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> Optional[str]:
+        """State the call is admitted under (``CLOSED``/``HALF_OPEN``), or None if rejected.
+
+        A call admitted under ``HALF_OPEN`` owns the single trial.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return CLOSED
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout_s:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return HALF_OPEN
+            return None
+
+    def release(self) -> None:
+        """Give back the half-open trial when its call ended without an outcome (cancelled).
+
+        Only the call admitted under ``HALF_OPEN`` may call this.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """Latencies of the last ``window`` successful calls."""
+
+    def __init__(self, window: int = A2A_LATENCY_WINDOW) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency_s: float) -> None:
+        self._samples.append(latency_s)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+
+@dataclass
+class RemoteHealth:
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    latency: LatencyTracker = field(default_factory=LatencyTracker)
+    calls: int = 0
+    failures: int = 0
+    fast_fails: int = 0
+    timeouts: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or ``None`` while there is too little data."""
+        if not A2A_HEDGE_ENABLED or len(self.latency) < A2A_HEDGE_MIN_SAMPLES:
+            return None
+        return max(A2A_HEDGE_MIN_DELAY_S, self.latency.percentile(A2A_HEDGE_PERCENTILE) or 0.0)
+
+
+_health: Dict[str, RemoteHealth] = {}
+_health_lock = threading.Lock()
+
+
+def remote_health(remote: str) -> RemoteHealth:
+    with _health_lock:
+        health = _health.get(remote)
+        if health is None:
+            _health[remote] = health = RemoteHealth()
+        return health
+
+
+def reset_remote_health() -> None:
+    with _health_lock:
+        _health.clear()
+
+
+Attempt = Tuple[List[Event], bool]
+
+
+class ResilientRemoteA2aAgent(CachedRemoteA2aAgent):
+    """Cached remote proxy whose remote calls go through breaker, hedge and deadline."""
+
+    deadline_s: float = A2A_REMOTE_DEADLINE_S
+
+    def _error_event(self, ctx: InvocationContext, message: str, reason: str) -> Event:
+        return Event(
+            author=self.name,
+            error_message=message,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            custom_metadata={RESILIENCE_METADATA_KEY: reason},
+        )
+
+    async def _attempt(self, ctx: InvocationContext) -> Attempt:
+        events: List[Event] = []
+        ok = True
+        try:
+            async for event in super()._call_remote(ctx):
+                ok = ok and not answer_failed(event)
+                events.append(event)
+        except Exception as exc:  # noqa: BLE001 - an attempt failure is an outcome, not a crash
+            return [self._error_event(ctx, f"A2A request failed: {exc}", "error")], False
+        return events, ok and bool(events)
+
+    async def _call_remote(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        health = remote_health(self.name)
+        admitted = health.breaker.allow()
+        if admitted is None:
+            health.fast_fails += 1
+            yield self._error_event(
+                ctx,
+                f"{self.name} is temporarily unavailable (circuit open after repeated failures).",
+                "circuit_open",
+            )
+            return
+
+        health.calls += 1
+        hedge_delay = health.hedge_delay() if self._self_contained_request(ctx) is not None else None
+        primary = asyncio.create_task(self._attempt(ctx))
+        pending = {primary}
+        winner: Optional[Attempt] = None
+        last: Optional[Attempt] = None
+        started = time.perf_counter()
+        deadline = time.monotonic() + self.deadline_s
+        try:
+            if hedge_delay is not None and hedge_delay < self.deadline_s:
+                done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+                if not done:
+                    health.hedges += 1
+                    pending.add(asyncio.create_task(self._attempt(ctx)))
+                else:
+                    pending = done
+            while pending and winner is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    last = task.result()
+                    if last[1] and winner is None:
+                        winner = last
+                        if task is not primary:
+                            health.hedge_wins += 1
+        except asyncio.CancelledError:
+            if admitted == HALF_OPEN:
+                health.breaker.release()
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if winner is not None:
+            health.breaker.record_success()
+            # Caller-observed latency, so hedged calls do not hide the remote's tail.
+            health.latency.add(time.perf_counter() - started)
+            for event in winner[0]:
+                yield event
+            return
+
+        health.failures += 1
+        health.breaker.record_failure()
+        if last is not None:
+            for event in last[0]:
+                yield event
+            return
+        health.timeouts += 1
+        yield self._error_event(
+            ctx, f"{self.name} did not answer within {self.deadline_s:.0f}s.", "deadline"
+        )
+
+
+def print_resilience_stats() -> None:
+    with _health_lock:
+        snapshot = dict(_health)
+    if not snapshot:
+        return
+    print("\n🛡️ Remote call health")
+    for remote, health in sorted(snapshot.items()):
+        p95 = health.latency.percentile(95)
+        p95_text = f"{p95 * 1000:.0f}ms" if p95 is not None else "-"
+        print(
+            f"   {remote:<24} circuit={health.breaker.state} calls={health.calls} "
+            f"failures={health.failures} fast-fails={health.fast_fails} timeouts={health.timeouts} "
+            f"hedges={health.hedges} (won {health.hedge_wins}) p95={p95_text}"
+        )
+
+
+__all__ = [
+    "CircuitBreaker",
+    "LatencyTracker",
+    "RemoteHealth",
+    "ResilientRemoteA2aAgent",
+    "print_resilience_stats",
+    "remote_health",
+    "reset_remote_health",
+]
@@ -0,0 +1,280 @@
+"""TTL cache for answers from the remote A2A specialists.
+
+``CachedRemoteA2aAgent`` is a drop-in ``RemoteA2aAgent``. It builds the same
+message it would send, normalises its text (case, whitespace) and looks up
+``(remote name, text)`` in ``response_cache``. A hit replays the stored
+answer without any HTTP traffic. On a miss the request goes out as usual, and
+a completed answer is stored for that remote's TTL
+(``A2A_RESPONSE_CACHE_TTL_S``): short for inventory, whose stock changes, and
+long for catalog specs, which do not.
+
+Only self-contained requests are cached. These are text-only messages that do
+not continue an existing remote conversation (no A2A ``context_id``) and are not
+replies to a remote's function call. Error responses and tasks that did not
+complete are never stored. A replayed answer carries no remote context
+ID, so the next turn with that remote opens a fresh remote conversation.
+
+On a cache miss, a proxy with a ``fast_path_url`` first posts the request to
+the remote's structured fast path. An exact product name, city or order ID is
+answered from the tool table without a model turn (and cached like any other
+answer); anything else gets a 404 and goes out as a normal ``message/send``.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
+
+import httpx
+from a2a.types import TextPart
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.remote_a2a_agent import A2A_METADATA_PREFIX, RemoteA2aAgent
+from google.adk.events.event import Event
+from google.genai import types
+
+from .config import (
+    A2A_REMOTE_NAMES,
+    A2A_RESPONSE_CACHE_ENABLED,
+    A2A_RESPONSE_CACHE_MAX_ENTRIES,
+    A2A_PROBE_TIMEOUT_S,
+    A2A_RESPONSE_CACHE_TTL_S,
+)
+from .http_client import get_async_http_client
+
+CacheKey = Tuple[str, str]
+
+CACHE_METADATA_KEY = A2A_METADATA_PREFIX + "cache"
+FAST_PATH_METADATA_KEY = A2A_METADATA_PREFIX + "fast_path"
+_CACHEABLE_STATES = {None, "completed"}
+
+
+def answer_failed(event: Event) -> bool:
+    """True for error events and remote tasks that did not complete."""
+    if event.error_message:
+        return True
+    response = (event.custom_metadata or {}).get(A2A_METADATA_PREFIX + "response") or {}
+    return (response.get("status") or {}).get("state") not in _CACHEABLE_STATES
+
+
+def normalize_request(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def response_cache_enabled() -> bool:
+    """``A2A_RESPONSE_CACHE`` (1/0) overrides ``config.A2A_RESPONSE_CACHE_ENABLED``."""
+    override = os.getenv("A2A_RESPONSE_CACHE")
+    if override is None:
+        return A2A_RESPONSE_CACHE_ENABLED
+    return override.lower() not in {"0", "false", "no"}
+
+
+def cache_ttl(agent_key: str) -> float:
+    """TTL in seconds for one remote; 0 when caching is disabled."""
+    if not response_cache_enabled():
+        return 0.0
+    return float(A2A_RESPONSE_CACHE_TTL_S.get(agent_key, 0.0))
+
+
+@dataclass(slots=True)
+class RemoteCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    fast_path: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RemoteResponseCache:
+    """Answer contents per ``(remote name, normalised request)`` with per-entry expiry.
+
+    Bounded to ``max_entries``; the least recently used entry is evicted first.
+    """
+
+    def __init__(self, max_entries: int = A2A_RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[types.Content]]]" = OrderedDict()
+        self._stats: Dict[str, RemoteCacheStats] = {}
+        self._lock = threading.Lock()
+
+    def _remote_stats(self, remote: str) -> RemoteCacheStats:
+        stats = self._stats.get(remote)
+        if stats is None:
+            self._stats[remote] = stats = RemoteCacheStats()
+        return stats
+
+    def get(self, remote: str, request: str) -> Optional[List[types.Content]]:
+        key = (remote, normalize_request(request))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._remote_stats(remote).hits += 1
+                return [content.model_copy(deep=True) for content in entry[1]]
+            if entry is not None:
+                del self._entries[key]
+            self._remote_stats(remote).misses += 1
+            return None
+
+    def put(self, remote: str, request: str, contents: List[types.Content], ttl_s: float) -> None:
+        if ttl_s <= 0 or not contents:
+            return
+        key = (remote, normalize_request(request))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_s, contents)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._remote_stats(remote).stores += 1
+
+    def record_fast_path(self, remote: str) -> None:
+        with self._lock:
+            self._remote_stats(remote).fast_path += 1
+
+    def invalidate(self, remote: Optional[str] = None) -> None:
+        with self._lock:
+            if remote is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == remote]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, RemoteCacheStats]:
+        with self._lock:
+            return {
+                remote: RemoteCacheStats(stats.hits, stats.misses, stats.stores, stats.fast_path)
+                for remote, stats in self._stats.items()
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = RemoteResponseCache()
+
+
+class CachedRemoteA2aAgent(RemoteA2aAgent):
+    """``RemoteA2aAgent`` that answers self-contained requests from ``response_cache``
+    or the remote's fast path when it can."""
+
+    cache_ttl_s: float = 0.0
+    fast_path_url: Optional[str] = None
+
+    def _self_contained_request(self, ctx: InvocationContext) -> Optional[str]:
+        """Request text when the call starts no remote state, else None.
+
+        Replies to a remote's function call and follow-ups on an existing
+        ``context_id`` continue a remote session, so they are never cached or
+        sent twice.
+        """
+        if self._create_a2a_request_for_user_function_response(ctx) is not None:
+            return None
+        parts, context_id = self._construct_message_parts_from_session(ctx)
+        if context_id is not None or not parts:
+            return None
+        texts = []
+        for part in parts:
+            if not isinstance(part.root, TextPart):
+                return None
+            texts.append(part.root.text)
+        return "\n".join(texts)
+
+    async def _call_remote(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """Send the request to the remote; subclasses add call policies here."""
+        async for event in super()._run_async_impl(ctx):
+            yield event
+
+    async def _fast_lookup(self, request: str) -> Optional[str]:
+        """The fast path's answer for an exact lookup, else None (use the model)."""
+        if self.fast_path_url is None:
+            return None
+        try:
+            response = await get_async_http_client().post(
+                self.fast_path_url, json={"query": request}, timeout=A2A_PROBE_TIMEOUT_S
+            )
+        except httpx.HTTPError:
+            return None
+        if response.status_code != 200:
+            return None
+        body = response.json()
+        answer = body.get("answer") if body.get("matched") else None
+        return answer if isinstance(answer, str) else None
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        request = self._self_contained_request(ctx)
+        if request is None:
+            async for event in self._call_remote(ctx):
+                yield event
+            return
+
+        cacheable = self.cache_ttl_s > 0
+        cached = response_cache.get(self.name, request) if cacheable else None
+        if cached is not None:
+            for content in cached:
+                yield Event(
+                    author=self.name,
+                    content=content,
+                    invocation_id=ctx.invocation_id,
+                    branch=ctx.branch,
+                    custom_metadata={CACHE_METADATA_KEY: "hit"},
+                )
+            return
+
+        answer = await self._fast_lookup(request)
+        if answer is not None:
+            response_cache.record_fast_path(self.name)
+            content = types.Content(role="model", parts=[types.Part(text=answer)])
+            if cacheable:
+                response_cache.put(self.name, request, [content.model_copy(deep=True)], self.cache_ttl_s)
+            yield Event(
+                author=self.name,
+                content=content,
+                invocation_id=ctx.invocation_id,
+                branch=ctx.branch,
+                custom_metadata={FAST_PATH_METADATA_KEY: "hit"},
+            )
+            return
+
+        contents: List[types.Content] = []
+        async for event in self._call_remote(ctx):
+            if answer_failed(event):
+                cacheable = False
+            elif event.content is not None and event.content.parts:
+                contents.append(event.content.model_copy(deep=True))
+            yield event
+        if cacheable:
+            response_cache.put(self.name, request, contents, self.cache_ttl_s)
+
+
+def print_response_cache_stats(cache: RemoteResponseCache = response_cache) -> None:
+    stats = cache.stats()
+    if not stats:
+        return
+    agent_keys = {name: key for key, name in A2A_REMOTE_NAMES.items()}
+    print("\n🗃️ Remote response cache")
+    for remote, remote_stats in sorted(stats.items()):
+        ttl = cache_ttl(agent_keys.get(remote, ""))
+        print(
+            f"   {remote:<24} hits={remote_stats.hits} misses={remote_stats.misses} "
+            f"hit rate={remote_stats.hit_rate:.0%} ttl={ttl:.0f}s fast-path={remote_stats.fast_path}"
+        )
+
+
+__all__ = [
+    "CachedRemoteA2aAgent",
+    "RemoteCacheStats",
+    "RemoteResponseCache",
+    "answer_failed",
+    "cache_ttl",
+    "normalize_request",
+    "print_response_cache_stats",
+    "response_cache",
+    "response_cache_enabled",
+]
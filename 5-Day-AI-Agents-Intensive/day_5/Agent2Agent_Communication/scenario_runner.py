@@ -0,0 +1,209 @@
+"""Concurrent scenario runner with orchestrator vs. remote latency split.
+
+All prompts go through one ``Runner`` (one session per prompt), at most
+``concurrency`` at a time. ``RemoteTimingPlugin`` records when each remote
+specialist starts and finishes. It sees remotes run as sub-agents
+(``delegate``) and as ``AgentTool`` calls (``fan_out``), because ``AgentTool``
+forwards the parent runner's plugins. The intervals are written to the
+current scenario's timing state through a ``ContextVar``, which concurrent
+scenarios do not share. A scenario's remote time is the union of those intervals
+(parallel calls are not double counted), and everything else in its wall
+time is attributed to the orchestrator (its model turns and tool handling).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from .config import A2A_LABELS, A2A_REMOTE_NAMES, SCENARIO_CONCURRENCY
+
+APP_NAME = "support_app"
+USER_ID = "demo_user"
+
+_REMOTE_KEYS = {name: key for key, name in A2A_REMOTE_NAMES.items()}
+
+
+@dataclass(slots=True)
+class _TimingState:
+    started: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    intervals: List[Tuple[str, float, float]] = field(default_factory=list)
+
+
+_current_timing: ContextVar[Optional[_TimingState]] = ContextVar("scenario_timing", default=None)
+
+
+class RemoteTimingPlugin(BasePlugin):
+    """Records start/end times of remote specialist runs for the current scenario."""
+
+    def __init__(self, name: str = "remote_timing") -> None:
+        super().__init__(name=name)
+
+    async def before_agent_callback(
+        self, *, agent: BaseAgent, callback_context: CallbackContext
+    ) -> Optional[types.Content]:
+        state = _current_timing.get()
+        if state is not None and agent.name in _REMOTE_KEYS:
+            state.started[(callback_context.invocation_id, agent.name)] = time.perf_counter()
+        return None
+
+    async def after_agent_callback(
+        self, *, agent: BaseAgent, callback_context: CallbackContext
+    ) -> Optional[types.Content]:
+        state = _current_timing.get()
+        if state is None or agent.name not in _REMOTE_KEYS:
+            return None
+        started = state.started.pop((callback_context.invocation_id, agent.name), None)
+        if started is not None:
+            state.intervals.append((_REMOTE_KEYS[agent.name], started, time.perf_counter()))
+        return None
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    prompt: str
+    response: str
+    wall_s: float
+    orchestrator_s: float
+    remote_busy_s: float
+    remote_s: Dict[str, float]
+    error: Optional[str] = None
+
+
+def _union_length(intervals: Sequence[Tuple[str, float, float]]) -> float:
+    total = 0.0
+    current_start = current_end = None
+    for _, start, end in sorted(intervals, key=lambda interval: interval[1]):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def resolve_concurrency(concurrency: Optional[int] = None) -> int:
+    """Explicit value, then ``A2A_SCENARIO_CONCURRENCY``, then ``config.SCENARIO_CONCURRENCY``."""
+    if concurrency is None:
+        concurrency = int(os.getenv("A2A_SCENARIO_CONCURRENCY", SCENARIO_CONCURRENCY))
+    return max(1, concurrency)
+
+
+def build_scenario_runner(agent: BaseAgent) -> Runner:
+    return Runner(
+        agent=agent,
+        app_name=APP_NAME,
+        session_service=InMemorySessionService(),
+        plugins=[RemoteTimingPlugin()],
+    )
+
+
+async def run_scenario(runner: Runner, prompt: str, *, user_id: str = USER_ID) -> ScenarioResult:
+    """Run one prompt in a fresh session on ``runner`` and time it."""
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id=user_id)
+    state = _TimingState()
+    token = _current_timing.set(state)
+    texts: List[str] = []
+    error = None
+    started = time.perf_counter()
+    try:
+        async for event in runner.run_async(
+            user_id=user_id,
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text=prompt)]),
+        ):
+            if event.is_final_response() and event.content:
+                texts.extend(part.text for part in event.content.parts or [] if part.text)
+    except Exception as exc:  # noqa: BLE001 - report the failure, keep other scenarios running
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        wall = time.perf_counter() - started
+        _current_timing.reset(token)
+        await runner.session_service.delete_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session.id
+        )
+
+    remote_s: Dict[str, float] = {}
+    for agent_key, start, end in state.intervals:
+        remote_s[agent_key] = remote_s.get(agent_key, 0.0) + (end - start)
+    remote_busy = _union_length(state.intervals)
+    return ScenarioResult(
+        prompt=prompt,
+        response="\n".join(texts),
+        wall_s=wall,
+        orchestrator_s=max(0.0, wall - remote_busy),
+        remote_busy_s=remote_busy,
+        remote_s=remote_s,
+        error=error,
+    )
+
+
+async def run_scenarios(
+    agent_or_runner: Any,
+    prompts: Sequence[str],
+    *,
+    concurrency: Optional[int] = None,
+) -> List[ScenarioResult]:
+    """Run ``prompts`` through one runner, at most ``concurrency`` at a time.
+
+    Results are returned in prompt order.
+    """
+    runner = agent_or_runner if isinstance(agent_or_runner, Runner) else build_scenario_runner(agent_or_runner)
+    in_flight = asyncio.Semaphore(resolve_concurrency(concurrency))
+
+    async def _bounded(prompt: str) -> ScenarioResult:
+        async with in_flight:
+            return await run_scenario(runner, prompt)
+
+    return list(await asyncio.gather(*(_bounded(prompt) for prompt in prompts)))
+
+
+def print_scenario_result(result: ScenarioResult) -> None:
+    print(f"\n👤 Customer: {result.prompt}")
+    print("\n🎧 Support Agent response:")
+    print("-" * 60)
+    print(result.response if result.error is None else f"❌ {result.error}")
+    print("-" * 60)
+
+
+def print_scenario_timings(results: Sequence[ScenarioResult], elapsed_s: Optional[float] = None) -> None:
+    agent_keys = list(A2A_REMOTE_NAMES)
+    header = f"{'#':<3}{'wall s':>8}{'orch s':>8}{'remote s':>9}" + "".join(
+        f"{A2A_LABELS[key].split()[0][:9]:>10}" for key in agent_keys
+    )
+    print("\n⏱️ Scenario latency (orchestrator vs. remote agents)")
+    print(header)
+    for index, result in enumerate(results, start=1):
+        print(
+            f"{index:<3}{result.wall_s:>8.2f}{result.orchestrator_s:>8.2f}{result.remote_busy_s:>9.2f}"
+            + "".join(f"{result.remote_s.get(key, 0.0):>10.2f}" for key in agent_keys)
+        )
+    if elapsed_s is not None:
+        serial = sum(result.wall_s for result in results)
+        print(f"   Total: {elapsed_s:.2f}s for {len(results)} scenarios (sum of scenario times {serial:.2f}s)")
+
+
+__all__ = [
+    "RemoteTimingPlugin",
+    "ScenarioResult",
+    "build_scenario_runner",
+    "print_scenario_result",
+    "print_scenario_timings",
+    "resolve_concurrency",
+    "run_scenario",
+    "run_scenarios",
+]
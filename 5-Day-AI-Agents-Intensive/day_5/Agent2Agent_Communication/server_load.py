@@ -0,0 +1,204 @@
+"""Local load test measuring requests/sec per A2A specialist server.
+
+Each remote is driven on its own with ``--requests`` JSON-RPC
+``message/send`` calls, at most ``--concurrency`` in flight, over a pooled
+``httpx.AsyncClient``. ``--target card`` fetches the agent card instead, which
+measures the HTTP/ASGI stack without any LLM work, and ``--target fast`` sends
+the same lookups to the structured fast path (``servers/fast_path.py``) so its
+latency can be compared with the ``message`` path through the model. Servers that are not
+already running are started first (``--multi-worker`` applies
+``A2A_SERVER_SETTINGS``) and stopped afterwards, so the single-process and
+tuned setups can be compared back to back.
+
+Usage (from the repository root)::
+
+    python -m day_5.Agent2Agent_Communication.server_load --requests 60 --concurrency 12
+    python -m day_5.Agent2Agent_Communication.server_load --requests 60 --concurrency 12 --multi-worker
+    python -m day_5.Agent2Agent_Communication.server_load --requests 60 --concurrency 12 --target fast
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+from .config import A2A_LABELS, A2A_PORTS, A2A_REMOTE_TIMEOUT_S
+from .http_client import agent_card_url, fast_path_url
+from .launcher import AGENT_KEYS, launch_servers, print_launch_report, shutdown_servers
+
+LOAD_PROMPTS: Dict[str, str] = {
+    "product_catalog": "Tell me about the iPhone 15 Pro.",
+    "inventory": "Is the iPad Air in stock?",
+    "shipping": "What's the shipping estimate to Chicago?",
+}
+# Exact-match lookups for the same questions, answered without the model.
+FAST_PATH_QUERIES: Dict[str, str] = {
+    "product_catalog": "iPhone 15 Pro",
+    "inventory": "iPad Air",
+    "shipping": "Chicago",
+}
+TARGETS = ("message", "card", "fast")
+
+
+@dataclass(slots=True)
+class RemoteLoadReport:
+    agent_key: str
+    requests: int
+    errors: int
+    elapsed_s: float
+    throughput_rps: float
+    latency_ms: Dict[str, float]
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def message_send_payload(text: str) -> Dict[str, object]:
+    """JSON-RPC ``message/send`` request carrying a single text part."""
+    return {
+        "jsonrpc": "2.0",
+        "id": uuid.uuid4().hex,
+        "method": "message/send",
+        "params": {
+            "message": {
+                "kind": "message",
+                "role": "user",
+                "messageId": uuid.uuid4().hex,
+                "parts": [{"kind": "text", "text": text}],
+            }
+        },
+    }
+
+
+async def _one_request(client: httpx.AsyncClient, agent_key: str, target: str) -> bool:
+    if target == "card":
+        response = await client.get(agent_card_url(agent_key))
+        return response.status_code == 200
+    if target == "fast":
+        response = await client.post(
+            fast_path_url(agent_key), json={"query": FAST_PATH_QUERIES[agent_key]}
+        )
+        return response.status_code == 200 and response.json().get("matched") is True
+    response = await client.post(
+        f"http://localhost:{A2A_PORTS[agent_key]}/",
+        json=message_send_payload(LOAD_PROMPTS[agent_key]),
+    )
+    if response.status_code != 200:
+        return False
+    body = response.json()
+    if "error" in body:
+        return False
+    state = ((body.get("result") or {}).get("status") or {}).get("state")
+    return state != "failed"
+
+
+async def load_remote(
+    client: httpx.AsyncClient,
+    agent_key: str,
+    *,
+    requests: int,
+    concurrency: int,
+    target: str = "message",
+) -> RemoteLoadReport:
+    """Send ``requests`` calls to one remote with bounded concurrency."""
+    in_flight = asyncio.Semaphore(max(1, concurrency))
+    latencies: List[float] = []
+    errors = 0
+
+    async def _timed() -> None:
+        nonlocal errors
+        async with in_flight:
+            started = time.perf_counter()
+            try:
+                ok = await _one_request(client, agent_key, target)
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_timed() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latency * 1000 for latency in latencies)
+    return RemoteLoadReport(
+        agent_key=agent_key,
+        requests=requests,
+        errors=errors,
+        elapsed_s=elapsed,
+        throughput_rps=len(latencies) / elapsed if elapsed else 0.0,
+        latency_ms={f"p{percent}": _percentile(ordered, percent) for percent in (50, 95, 99)},
+    )
+
+
+async def run_server_load(
+    agent_keys: Sequence[str] = AGENT_KEYS,
+    *,
+    requests: int = 50,
+    concurrency: int = 10,
+    target: str = "message",
+) -> List[RemoteLoadReport]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=A2A_REMOTE_TIMEOUT_S, limits=limits) as client:
+        return [
+            await load_remote(
+                client, agent_key, requests=requests, concurrency=concurrency, target=target
+            )
+            for agent_key in agent_keys
+        ]
+
+
+def print_server_load(reports: Sequence[RemoteLoadReport]) -> None:
+    print(f"\n{'remote':<24}{'requests':>9}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for report in reports:
+        print(
+            f"{A2A_LABELS[report.agent_key]:<24}{report.requests:>9}{report.errors:>8}"
+            f"{report.throughput_rps:>9.1f}"
+            + "".join(f"{value:>9.0f}" for value in report.latency_ms.values())
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("agents", nargs="*", help=f"Remotes to load (default: {' '.join(AGENT_KEYS)})")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per remote")
+    parser.add_argument("--concurrency", type=int, default=10, help="Max requests in flight")
+    parser.add_argument("--target", choices=TARGETS, default="message")
+    parser.add_argument(
+        "--multi-worker", action="store_true", default=None, help="Start servers with A2A_SERVER_SETTINGS"
+    )
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.agents) - set(AGENT_KEYS))
+    if unknown:
+        parser.error(f"unknown remote(s): {', '.join(unknown)}")
+    args.agents = args.agents or list(AGENT_KEYS)
+
+    launch = launch_servers(args.agents, multi_worker=args.multi_worker)
+    print_launch_report(launch)
+    try:
+        reports = asyncio.run(
+            run_server_load(
+                args.agents,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                target=args.target,
+            )
+        )
+        print_server_load(reports)
+    finally:
+        shutdown_servers(launch.processes.values())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Reject follow-up turns that land on a worker without their session.
+
+Every uvicorn worker has its own ``InMemorySessionService`` and task store, so
+in multi-worker mode a follow-up ``message/send`` carrying a ``contextId`` may
+reach a worker that never saw the conversation. ``A2aAgentExecutor`` would
+then silently start an empty session and answer without the earlier turns.
+
+``add_context_guard(app, runner)`` wraps a server app so such a request gets a
+JSON-RPC error instead. Requests without a ``contextId`` (single-turn,
+stateless traffic, the only kind multi-worker mode is meant for) and
+follow-ups that reach the worker holding their session pass through.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from a2a.utils.constants import DEFAULT_RPC_URL
+from google.adk.runners import Runner
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+_MESSAGE_METHODS = {"message/send", "message/stream"}
+# JSON-RPC "invalid params"; the message explains which context was lost.
+_CONTEXT_NOT_FOUND_CODE = -32602
+
+
+class ContextGuard:
+    """ASGI middleware in front of the A2A JSON-RPC endpoint."""
+
+    def __init__(self, app: Any, runner: Runner) -> None:
+        self.app = app
+        self.runner = runner
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != DEFAULT_RPC_URL:
+            await self.app(scope, receive, send)
+            return
+
+        chunks: List[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                return  # client disconnected before sending the body
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        request = _parse(body)
+        context_id = _context_id(request)
+        if context_id is not None and not await self._holds(context_id):
+            response = JSONResponse(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request.get("id"),
+                    "error": {
+                        "code": _CONTEXT_NOT_FOUND_CODE,
+                        "message": (
+                            f"Context {context_id} is not held by this server worker. "
+                            "Multi-worker servers keep sessions per process and only "
+                            "support stateless single-turn requests; run a single "
+                            "worker for multi-turn conversations."
+                        ),
+                    },
+                }
+            )
+            await response(scope, receive, send)
+            return
+
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay, send)
+
+    async def _holds(self, context_id: str) -> bool:
+        # A2aAgentExecutor uses the context ID as session ID and, without
+        # authentication, derives the user ID from it the same way.
+        session = await self.runner.session_service.get_session(
+            app_name=self.runner.app_name,
+            user_id=f"A2A_USER_{context_id}",
+            session_id=context_id,
+        )
+        return session is not None
+
+
+def _parse(body: bytes) -> Dict[str, Any]:
+    try:
+        request = json.loads(body)
+    except ValueError:
+        return {}
+    return request if isinstance(request, dict) else {}
+
+
+def _context_id(request: Dict[str, Any]) -> Optional[str]:
+    if request.get("method") not in _MESSAGE_METHODS:
+        return None
+    params = request.get("params")
+    message = params.get("message") if isinstance(params, dict) else None
+    context_id = message.get("contextId") if isinstance(message, dict) else None
+    return context_id if isinstance(context_id, str) and context_id else None
+
+
+def add_context_guard(app: Starlette, runner: Runner) -> Starlette:
+    """Wrap ``app`` so follow-ups for sessions ``runner`` lacks are rejected."""
+    app.add_middleware(ContextGuard, runner=runner)
+    return app
+
+
+__all__ = ["ContextGuard", "add_context_guard"]
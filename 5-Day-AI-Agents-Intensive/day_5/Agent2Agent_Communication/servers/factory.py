@@ -0,0 +1,43 @@
+"""Build a specialist's ASGI app: A2A endpoints, fast path and context guard."""
+
+from __future__ import annotations
+
+from google.adk.a2a.utils.agent_to_a2a import to_a2a
+from google.adk.agents import BaseAgent
+from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.adk.auth.credential_service.in_memory_credential_service import (
+    InMemoryCredentialService,
+)
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.runners import Runner
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from starlette.applications import Starlette
+
+from ..config import A2A_PORTS
+from ..launcher import resolve_multi_worker
+from .context_guard import add_context_guard
+from .fast_path import Lookup, add_fast_path
+
+
+def build_server_app(agent: BaseAgent, agent_key: str, lookup: Lookup) -> Starlette:
+    """``to_a2a`` with the same in-memory services, plus this demo's routes.
+
+    The runner is built here rather than inside ``to_a2a`` so the context
+    guard can see its session service; it is only installed when the launcher
+    started the server in multi-worker mode.
+    """
+    runner = Runner(
+        app_name=agent.name or "adk_agent",
+        agent=agent,
+        artifact_service=InMemoryArtifactService(),
+        session_service=InMemorySessionService(),
+        memory_service=InMemoryMemoryService(),
+        credential_service=InMemoryCredentialService(),
+    )
+    app = to_a2a(agent, port=A2A_PORTS[agent_key], runner=runner)
+    if resolve_multi_worker():
+        add_context_guard(app, runner)
+    return add_fast_path(app, lookup)
+
+
+__all__ = ["build_server_app"]
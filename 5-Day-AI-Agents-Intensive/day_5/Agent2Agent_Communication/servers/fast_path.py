@@ -0,0 +1,54 @@
+"""Structured lookup endpoint that answers exact matches without the LLM.
+
+``add_fast_path(app, lookup)`` mounts ``FAST_PATH_ROUTE`` on an A2A server
+app. A lookup that matches exactly (a product name, city or order ID) is
+answered straight from the specialist's tool table; anything else returns
+``{"matched": false}`` with status 404 so the caller falls back to the normal
+``message/send`` path through the model. ``CachedRemoteA2aAgent`` tries this
+route for self-contained requests before sending them to the remote agent.
+
+    GET  /fast/lookup?q=iPad%20Air
+    POST /fast/lookup   {"query": "iPad Air"}
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from ..config import FAST_PATH_ROUTE
+from ..http_client import fast_path_enabled
+
+Lookup = Callable[[str], Optional[str]]
+
+
+def add_fast_path(app: Starlette, lookup: Lookup) -> Starlette:
+    """Register the fast-path route on ``app`` when the feature is enabled."""
+    if not fast_path_enabled():
+        return app
+
+    async def fast_lookup(request: Request) -> JSONResponse:
+        if request.method == "POST":
+            try:
+                body = await request.json()
+            except ValueError:
+                body = None
+            query = body.get("query") if isinstance(body, dict) else None
+        else:
+            query = request.query_params.get("q")
+        if not isinstance(query, str) or not query.strip():
+            return JSONResponse({"error": "missing query"}, status_code=400)
+
+        answer = lookup(query)
+        if answer is None:
+            return JSONResponse({"matched": False, "query": query}, status_code=404)
+        return JSONResponse({"matched": True, "query": query, "answer": answer})
+
+    app.router.add_route(FAST_PATH_ROUTE, fast_lookup, methods=["GET", "POST"])
+    return app
+
+
+__all__ = ["add_fast_path", "fast_path_enabled"]
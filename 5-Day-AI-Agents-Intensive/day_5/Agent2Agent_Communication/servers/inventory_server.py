@@ -1,8 +1,6 @@
 """ASGI app for the Inventory Agent."""
 
-from google.adk.a2a.utils.agent_to_a2a import to_a2a
+from ..agents.inventory import create_inventory_agent, find_inventory_status
+from .factory import build_server_app
 
-from ..agents.inventory import create_inventory_agent
-from ..config import A2A_PORTS
-
-app = to_a2a(create_inventory_agent(), port=A2A_PORTS["inventory"])
+app = build_server_app(create_inventory_agent(), "inventory", find_inventory_status)
@@ -1,8 +1,6 @@
 """ASGI app for the Shipping Agent."""
 
-from google.adk.a2a.utils.agent_to_a2a import to_a2a
+from ..agents.shipping import create_shipping_agent, find_shipping_info
+from .factory import build_server_app
 
-from ..agents.shipping import create_shipping_agent
-from ..config import A2A_PORTS
-
-app = to_a2a(create_shipping_agent(), port=A2A_PORTS["shipping"])
+app = build_server_app(create_shipping_agent(), "shipping", find_shipping_info)
@@ -0,0 +1,274 @@
+"""Latency of remote specialist calls over HTTP vs. the in-process A2A transport.
+
+Both transports serve the same specialist agents, built in this process, so
+only the transport differs:
+
+* ``http``: each specialist is served by ``to_a2a()`` under uvicorn on a
+  background thread (ports ``A2A_PORTS`` + ``HTTP_PORT_OFFSET``, so servers
+  already running on the normal ports are left alone) and called over the
+  pooled ``httpx`` client with JSON-RPC.
+* ``in_process``: ``InProcessA2aHost`` calls the same executor stack through
+  ``InProcessTransport``.
+
+Each request runs a ``RemoteA2aAgent`` proxy (no response cache) as the root
+agent of an ``InMemoryRunner``, as the orchestrator would. ``--offline``
+replaces the specialists' Gemini model with ``ToolCallLlm``, which calls the
+agent's first tool with the prompt and answers with the tool result. The
+transport, A2A executor and tool path are then measured without any Gemini
+traffic, whose latency would otherwise dominate.
+
+Usage (from the repository root)::
+
+    python -m day_5.Agent2Agent_Communication.transport_benchmark --offline --requests 50
+    python -m day_5.Agent2Agent_Communication.transport_benchmark inventory --requests 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import threading
+import time
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Sequence, Tuple
+
+import uvicorn
+from google.adk.a2a.utils.agent_to_a2a import to_a2a
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.remote_a2a_agent import AGENT_CARD_WELL_KNOWN_PATH, RemoteA2aAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from .config import A2A_LABELS, A2A_PORTS, A2A_REMOTE_NAMES
+from .http_client import get_a2a_client_factory
+from .in_process import SPECIALIST_FACTORIES, InProcessA2aHost
+from .launcher import AGENT_KEYS
+from .server_load import (
+    FAST_PATH_QUERIES,
+    LOAD_PROMPTS,
+    RemoteLoadReport,
+    _percentile,
+    print_server_load,
+)
+
+HTTP_PORT_OFFSET = 100
+TRANSPORTS = ("http", "in_process")
+
+
+class ToolCallLlm(BaseLlm):
+    """Deterministic model: call the first tool with the prompt, then echo its result."""
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        last = llm_request.contents[-1]
+        for part in last.parts or []:
+            if part.function_response is not None:
+                result = (part.function_response.response or {}).get("result")
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=str(result))])
+                )
+                return
+        prompt = " ".join(part.text for part in last.parts or [] if part.text)
+        tool = next(iter(llm_request.tools_dict.values()))
+        argument = next(iter(tool._get_declaration().parameters.properties))
+        yield LlmResponse(
+            content=types.Content(
+                role="model",
+                parts=[types.Part(function_call=types.FunctionCall(name=tool.name, args={argument: prompt}))],
+            )
+        )
+
+
+def specialist_factories(offline: bool) -> Dict[str, Callable[[], BaseAgent]]:
+    if not offline:
+        return dict(SPECIALIST_FACTORIES)
+
+    def offline_factory(factory: Callable[[], BaseAgent]) -> Callable[[], BaseAgent]:
+        def build() -> BaseAgent:
+            agent = factory()
+            if isinstance(agent, LlmAgent):
+                agent.model = ToolCallLlm(model="tool-call")
+            return agent
+
+        return build
+
+    return {key: offline_factory(factory) for key, factory in SPECIALIST_FACTORIES.items()}
+
+
+def serve_http(
+    factories: Dict[str, Callable[[], BaseAgent]], agent_keys: Sequence[str]
+) -> List[Tuple[uvicorn.Server, threading.Thread]]:
+    """Serve each specialist with ``to_a2a()`` on a background uvicorn thread."""
+    servers = []
+    for agent_key in agent_keys:
+        port = A2A_PORTS[agent_key] + HTTP_PORT_OFFSET
+        app = to_a2a(factories[agent_key](), port=port)
+        server = uvicorn.Server(uvicorn.Config(app, host="localhost", port=port, log_level="error"))
+        thread = threading.Thread(target=server.run, name=f"a2a-{agent_key}", daemon=True)
+        thread.start()
+        servers.append((server, thread))
+    deadline = time.monotonic() + 30
+    while not all(server.started for server, _ in servers):
+        if time.monotonic() > deadline:
+            raise RuntimeError("Benchmark HTTP servers did not start within 30s")
+        time.sleep(0.05)
+    return servers
+
+
+def stop_http(servers: Sequence[Tuple[uvicorn.Server, threading.Thread]]) -> None:
+    for server, _ in servers:
+        server.should_exit = True
+    for _, thread in servers:
+        thread.join(timeout=10)
+
+
+def build_proxies(
+    transport: str, agent_keys: Sequence[str], host: Optional[InProcessA2aHost] = None
+) -> Dict[str, RemoteA2aAgent]:
+    proxies: Dict[str, RemoteA2aAgent] = {}
+    for agent_key in agent_keys:
+        if transport == "in_process":
+            proxies[agent_key] = RemoteA2aAgent(
+                name=A2A_REMOTE_NAMES[agent_key],
+                agent_card=host.get_agent_card(agent_key),
+                a2a_client_factory=host.client_factory(),
+            )
+        else:
+            port = A2A_PORTS[agent_key] + HTTP_PORT_OFFSET
+            proxies[agent_key] = RemoteA2aAgent(
+                name=A2A_REMOTE_NAMES[agent_key],
+                agent_card=f"http://localhost:{port}{AGENT_CARD_WELL_KNOWN_PATH}",
+                a2a_client_factory=get_a2a_client_factory(),
+            )
+    return proxies
+
+
+async def measure_remote(
+    agent_key: str, proxy: RemoteA2aAgent, prompt: str, *, requests: int, concurrency: int
+) -> RemoteLoadReport:
+    """Send ``requests`` prompts through ``proxy``, one fresh session each."""
+    runner = InMemoryRunner(agent=proxy, app_name="transport_benchmark")
+    in_flight = asyncio.Semaphore(max(1, concurrency))
+    latencies: List[float] = []
+    errors = 0
+
+    async def _one() -> bool:
+        session = await runner.session_service.create_session(
+            app_name=runner.app_name, user_id="benchmark"
+        )
+        answered = False
+        async for event in runner.run_async(
+            user_id="benchmark",
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text=prompt)]),
+        ):
+            if event.error_message:
+                return False
+            answered = answered or bool(event.content and event.content.parts)
+        return answered
+
+    async def _timed() -> None:
+        nonlocal errors
+        async with in_flight:
+            started = time.perf_counter()
+            ok = await _one()
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    await _one()  # warm up: agent-card resolution, runner and connection setup
+    started = time.perf_counter()
+    await asyncio.gather(*(_timed() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latency * 1000 for latency in latencies)
+    return RemoteLoadReport(
+        agent_key=agent_key,
+        requests=requests,
+        errors=errors,
+        elapsed_s=elapsed,
+        throughput_rps=len(latencies) / elapsed if elapsed else 0.0,
+        latency_ms={f"p{percent}": _percentile(ordered, percent) for percent in (50, 95, 99)},
+    )
+
+
+async def run_transport_benchmark(
+    agent_keys: Sequence[str] = AGENT_KEYS,
+    *,
+    requests: int = 50,
+    concurrency: int = 1,
+    offline: bool = False,
+) -> Dict[str, List[RemoteLoadReport]]:
+    factories = specialist_factories(offline)
+    prompts = FAST_PATH_QUERIES if offline else LOAD_PROMPTS
+    servers = serve_http(factories, agent_keys)
+    # Request logging (to_a2a turns on INFO for ADK) would dominate both paths.
+    logging.disable(logging.INFO)
+    try:
+        results: Dict[str, List[RemoteLoadReport]] = {}
+        host = InProcessA2aHost(factories)
+        for transport in TRANSPORTS:
+            proxies = build_proxies(transport, agent_keys, host)
+            results[transport] = [
+                await measure_remote(
+                    agent_key,
+                    proxies[agent_key],
+                    prompts[agent_key],
+                    requests=requests,
+                    concurrency=concurrency,
+                )
+                for agent_key in agent_keys
+            ]
+        return results
+    finally:
+        logging.disable(logging.NOTSET)
+        stop_http(servers)
+
+
+def print_transport_benchmark(results: Dict[str, List[RemoteLoadReport]]) -> None:
+    for transport, reports in results.items():
+        print(f"\n🚚 Transport: {transport}")
+        print_server_load(reports)
+    if set(TRANSPORTS) <= set(results):
+        print("\n⚖️ In-process vs. HTTP (p50)")
+        for http_report, local_report in zip(results["http"], results["in_process"]):
+            http_p50 = http_report.latency_ms["p50"]
+            local_p50 = local_report.latency_ms["p50"]
+            saved = http_p50 - local_p50
+            ratio = http_p50 / local_p50 if local_p50 else 0.0
+            print(
+                f"   {A2A_LABELS[http_report.agent_key]:<24}{http_p50:>8.1f}ms -> {local_p50:>6.1f}ms "
+                f"(saves {saved:.1f}ms, {ratio:.1f}x)"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("agents", nargs="*", help=f"Remotes to measure (default: {' '.join(AGENT_KEYS)})")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per remote and transport")
+    parser.add_argument("--concurrency", type=int, default=1, help="Max requests in flight")
+    parser.add_argument(
+        "--offline", action="store_true", help="Use ToolCallLlm instead of Gemini in the specialists"
+    )
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.agents) - set(AGENT_KEYS))
+    if unknown:
+        parser.error(f"unknown remote(s): {', '.join(unknown)}")
+
+    results = asyncio.run(
+        run_transport_benchmark(
+            args.agents or AGENT_KEYS,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            offline=args.offline,
+        )
+    )
+    print_transport_benchmark(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Background warmup of the A2A specialist servers.
+
+``adk web`` imports ``agent.py`` when it discovers the package, but only
+resolves ``root_agent`` later, when the agent is first selected. ``ServerWarmup``
+uses that gap: at import it starts a daemon thread that probes for the
+specialists and spawns any missing servers, without printing or blocking the
+import. When ``root_agent`` is built it waits for the warmup instead of
+starting from scratch, so the uvicorn boot overlaps with the rest of the
+loader's work.
+
+The probe-and-spawn step and the readiness wait are separate, so ``stop()``
+(registered with ``atexit``) only has to wait for the former, which is quick,
+before it terminates the servers the warmup spawned; no process is left
+running when the interpreter exits mid-warmup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from typing import Iterable, Optional
+
+import httpx
+
+from .config import A2A_PROBE_TIMEOUT_S, A2A_SERVER_WARMUP, A2A_STARTUP_TIMEOUT_S
+from .launcher import (
+    AGENT_KEYS,
+    LaunchReport,
+    launch_servers,
+    shutdown_servers,
+    wait_until_ready,
+)
+
+
+def server_warmup_enabled() -> bool:
+    """``A2A_SERVER_WARMUP`` (1/0) overrides ``config.A2A_SERVER_WARMUP``."""
+    override = os.getenv("A2A_SERVER_WARMUP")
+    if override is None:
+        return A2A_SERVER_WARMUP
+    return override.strip().lower() not in {"0", "false", "no"}
+
+
+class ServerWarmup:
+    """Starts missing specialist servers on a daemon thread, at most once."""
+
+    def __init__(self, agent_keys: Iterable[str] = AGENT_KEYS) -> None:
+        self.agent_keys = list(agent_keys)
+        self.report = LaunchReport()
+        self.error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+        self._spawned = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="a2a-server-warmup", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        try:
+            try:
+                self.report = launch_servers(
+                    self.agent_keys, force_start=False, wait=False, verbose=False
+                )
+            finally:
+                self._spawned.set()
+            asyncio.run(self._wait_until_ready(started))
+        except Exception as exc:  # noqa: BLE001 - surfaced to the caller of wait()
+            self.error = exc
+
+    async def _wait_until_ready(self, started: float) -> None:
+        report = self.report
+
+        async def _ready(client: httpx.AsyncClient, agent_key: str) -> None:
+            card = await wait_until_ready(client, agent_key, report.processes[agent_key])
+            report.ready_s[agent_key] = time.perf_counter() - started if card is not None else None
+            if card is not None:
+                report.cards[agent_key] = card
+
+        async with httpx.AsyncClient(timeout=A2A_PROBE_TIMEOUT_S) as client:
+            await asyncio.gather(*(_ready(client, agent_key) for agent_key in report.processes))
+        report.elapsed_s = time.perf_counter() - started
+
+    def wait(self, timeout_s: float = A2A_STARTUP_TIMEOUT_S) -> Optional[LaunchReport]:
+        """Block until the warmup finished; ``None`` if it was never started or timed out."""
+        thread = self._thread
+        if thread is None:
+            return None
+        thread.join(timeout_s)
+        if thread.is_alive() or self.error is not None:
+            return None
+        return self.report
+
+    def stop(self) -> None:
+        """Terminate the servers this warmup spawned."""
+        if self._thread is not None:
+            self._spawned.wait(A2A_PROBE_TIMEOUT_S * 2)
+        shutdown_servers(list(self.report.processes.values()))
+
+
+__all__ = ["ServerWarmup", "server_warmup_enabled"]
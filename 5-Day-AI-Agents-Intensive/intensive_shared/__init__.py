@@ -0,0 +1,7 @@
+"""Modules shared by the day packages.
+
+``adk web <day directory>`` only puts the day directory on ``sys.path``, so
+each package that imports from here first falls back to adding the
+repository root, the same way ``day_2/Agent_Tools_Best_Practices/agent.py``
+reaches its ``day_2.*`` modules.
+"""
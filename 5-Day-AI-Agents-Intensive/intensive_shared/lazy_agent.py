@@ -0,0 +1,87 @@
+"""Thread-safe lazy construction for module-level ``root_agent`` exports."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LazyAgent(Generic[T]):
+    """Builds an agent on first access, exactly once, even across threads."""
+
+    def __init__(self, factory: Callable[[], T], *, name: str) -> None:
+        self.name = name
+        self.build_seconds: Optional[float] = None
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._instance is not None
+
+    def get(self) -> T:
+        instance = self._instance
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if self._instance is None:
+                started = time.perf_counter()
+                try:
+                    self._instance = self._factory()
+                except Exception:
+                    logger.exception("Failed to initialize lazy agent %s", self.name)
+                    raise
+                self.build_seconds = time.perf_counter() - started
+                logger.info("Built %s in %.3fs", self.name, self.build_seconds)
+            return self._instance
+
+    def reset(self) -> None:
+        with self._lock:
+            self._instance = None
+            self.build_seconds = None
+
+
+class LazyAgentRegistry:
+    """Maps module attribute names to lazily built agents.
+
+    Assign ``registry.module_getattr(__name__)`` to a module's ``__getattr__``
+    so ``module.root_agent`` (and ``hasattr`` checks from ADK's loader) build
+    the agent on first use instead of at import time.
+    """
+
+    def __init__(self) -> None:
+        self._agents: Dict[str, LazyAgent[Any]] = {}
+
+    def register(self, attribute: str, factory: Callable[[], T]) -> LazyAgent[T]:
+        holder = LazyAgent(factory, name=attribute)
+        self._agents[attribute] = holder
+        return holder
+
+    def get(self, attribute: str) -> Any:
+        return self._agents[attribute].get()
+
+    def reset(self, attribute: str) -> None:
+        self._agents[attribute].reset()
+
+    def build_times(self) -> Dict[str, Optional[float]]:
+        return {name: holder.build_seconds for name, holder in self._agents.items()}
+
+    def module_getattr(self, module_name: str) -> Callable[[str], Any]:
+        def __getattr__(name: str) -> Any:
+            holder = self._agents.get(name)
+            if holder is None:
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+            return holder.get()
+
+        return __getattr__
+
+
+__all__ = ["LazyAgent", "LazyAgentRegistry"]
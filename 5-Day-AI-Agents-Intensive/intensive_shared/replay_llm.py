@@ -0,0 +1,201 @@
+"""Record/replay model backend for offline evals and benchmarks.
+
+``ReplayLlm`` is a drop-in ``BaseLlm``. In ``record`` mode it forwards each
+request to a real model and appends the responses to a JSON-lines cassette;
+in ``replay`` mode it serves them back by request hash without touching the
+network. ``build_model`` picks live/record/replay from ``AGENT_LLM_MODE`` so
+an agent factory only swaps its ``Gemini(...)`` call for ``build_model(...)``.
+
+Environment variables:
+
+* ``AGENT_LLM_MODE`` – ``live`` (default), ``record`` or ``replay``.
+* ``AGENT_LLM_CASSETTE`` – cassette path, overriding the package default.
+* ``AGENT_LLM_REPLAY_LATENCY_MS`` – fixed delay per replayed call, to model
+  LLM latency in throughput benchmarks.
+
+``ReplayLlm`` keeps the live model name, because ADK copies it into each
+request and tools such as ``google_search`` check it; the eval result cache
+tells replayed and live runs apart by the model class instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from pydantic import PrivateAttr
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+
+# Generated per run, so they must not influence the request hash.
+_VOLATILE_KEYS = {"id"}
+_VOLATILE_PARENTS = {"function_call", "function_response"}
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when no recording exists for a request."""
+
+
+def _plain(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", exclude_none=True)
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _strip_volatile(value: Any, parent: Optional[str] = None) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _strip_volatile(item, key)
+            for key, item in value.items()
+            if not (parent in _VOLATILE_PARENTS and key in _VOLATILE_KEYS)
+        }
+    if isinstance(value, list):
+        return [_strip_volatile(item, parent) for item in value]
+    return value
+
+
+def request_key(llm_request: LlmRequest) -> str:
+    """Stable hash of what the model sees: model, instruction, tools, contents."""
+    config = llm_request.config
+    payload = {
+        "model": llm_request.model,
+        "system_instruction": _plain(config.system_instruction) if config else None,
+        "tools": _plain(config.tools) if config and config.tools else [],
+        "contents": _strip_volatile(_plain(llm_request.contents)),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """JSON-lines store of ``{"key": ..., "responses": [...]}`` recordings.
+
+    A key recorded several times (the same prompt sent repeatedly) is replayed
+    in recording order and wraps around once exhausted.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._entries: Dict[str, List[List[Dict[str, Any]]]] = defaultdict(list)
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]].append(entry["responses"])
+
+    def __len__(self) -> int:
+        return sum(len(recordings) for recordings in self._entries.values())
+
+    def next(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            recordings = self._entries.get(key)
+            if not recordings:
+                return None
+            index = self._cursor[key] % len(recordings)
+            self._cursor[key] += 1
+            return recordings[index]
+
+    def record(self, key: str, responses: List[Dict[str, Any]]) -> None:
+        line = json.dumps({"key": key, "responses": responses}, ensure_ascii=False)
+        with self._lock:
+            self._entries[key].append(responses)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+
+
+class ReplayLlm(BaseLlm):
+    """``BaseLlm`` that records from, or replays instead of, a real model."""
+
+    cassette_path: str
+    mode: str = REPLAY
+    delegate: Optional[BaseLlm] = None
+    latency_s: float = 0.0
+
+    _cassette: Optional[Cassette] = PrivateAttr(default=None)
+
+    @property
+    def cassette(self) -> Cassette:
+        if self._cassette is None:
+            self._cassette = Cassette(self.cassette_path)
+        return self._cassette
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        key = request_key(llm_request)
+        if self.mode == RECORD:
+            if self.delegate is None:
+                raise ValueError("ReplayLlm in record mode needs a delegate model")
+            responses: List[LlmResponse] = []
+            async for response in self.delegate.generate_content_async(llm_request, stream=stream):
+                responses.append(response)
+                yield response
+            self.cassette.record(
+                key, [response.model_dump(mode="json", exclude_none=True) for response in responses]
+            )
+            return
+
+        recorded = self.cassette.next(key)
+        if recorded is None:
+            raise CassetteMissError(
+                f"No recording for request {key[:12]} in {self.cassette_path}; "
+                f"run once with AGENT_LLM_MODE={RECORD} to capture it."
+            )
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        for data in recorded:
+            yield LlmResponse.model_validate(data)
+
+
+def build_model(
+    model: str,
+    *,
+    retry_options: Optional[types.HttpRetryOptions] = None,
+    cassette_path: Optional[str | Path] = None,
+    mode: Optional[str] = None,
+) -> BaseLlm:
+    """Return ``Gemini`` in live mode, otherwise a ``ReplayLlm`` around it."""
+    mode = (mode or os.environ.get("AGENT_LLM_MODE") or LIVE).strip().lower()
+    if mode not in (LIVE, RECORD, REPLAY):
+        raise ValueError(f"Unknown AGENT_LLM_MODE {mode!r}; use live, record or replay")
+    live = Gemini(model=model, retry_options=retry_options)
+    if mode == LIVE:
+        return live
+    path = os.environ.get("AGENT_LLM_CASSETTE") or cassette_path
+    if path is None:
+        raise ValueError("Set AGENT_LLM_CASSETTE or pass cassette_path for record/replay")
+    return ReplayLlm(
+        model=model,
+        cassette_path=str(path),
+        mode=mode,
+        delegate=live if mode == RECORD else None,
+        latency_s=float(os.environ.get("AGENT_LLM_REPLAY_LATENCY_MS") or 0) / 1000,
+    )
+
+
+__all__ = [
+    "Cassette",
+    "CassetteMissError",
+    "ReplayLlm",
+    "build_model",
+    "request_key",
+]